@@ -0,0 +1,43 @@
+# 文本行统计示例
+# 逐行统计行数、字符数和最长的行，适合处理很大的文件
+# 声明 LARGE_INPUT 后，文件输入和超大的剪贴板内容以内存映射的形式传入，逐行读取不会整体载入内存
+LARGE_INPUT = True
+
+
+def process(input_text, input_source, output_target):
+    """
+    统计文本的行数、字符数和最长的行
+    
+    Args:
+        input_text (str | MappedInput): 输入的文本内容；大输入时为 MappedInput，
+            可以 for line in input_text 逐行读取，或用 str(input_text) 获取完整文本
+        input_source (str): 输入源 (clipboard/selection/manual/file/none)
+        output_target (str): 输出目标 (text/url/clipboard/file/window)
+        
+    Returns:
+        str: 统计结果
+    """
+    
+    if not input_text:
+        return "没有输入文本"
+        
+    # 普通文本按行拆分，MappedInput 直接迭代
+    lines = input_text.splitlines() if isinstance(input_text, str) else input_text
+    
+    line_count = 0
+    char_count = 0
+    blank_count = 0
+    longest = ""
+    for line in lines:
+        line_count += 1
+        char_count += len(line)
+        if not line.strip():
+            blank_count += 1
+        if len(line) > len(longest):
+            longest = line
+            
+    preview = longest if len(longest) <= 80 else longest[:80] + "…"
+    return (f"行数: {line_count}\n"
+            f"空行: {blank_count}\n"
+            f"字符数（不含换行）: {char_count}\n"
+            f"最长的行（{len(longest)} 字符）: {preview}")
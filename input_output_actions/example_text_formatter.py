@@ -1,5 +1,8 @@
 # 文本格式化示例
 # 对输入文本进行多种格式化处理
+# 结果只取决于输入文本，相同输入直接使用缓存的结果
+PURE = True
+
 
 def process(input_text, input_source, output_target):
     """
@@ -1,5 +1,8 @@
 # 文本大写转换示例
 # 将剪贴板或选中的文本转换为大写
+# 结果只取决于输入文本，相同输入直接使用缓存的结果
+PURE = True
+
 
 def process(input_text, input_source, output_target):
     """
@@ -12,6 +12,11 @@ project_root = Path(__file__).parent
 src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
+# 命令行批量执行脚本：python main.py run-script <脚本> ...（不导入Qt、不启动界面）
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "run-script":
+    from src.batch_runner import main as run_script_main
+    sys.exit(run_script_main(sys.argv[2:]))
+
 try:
     from PySide6.QtWidgets import QApplication, QMessageBox
     from PySide6.QtCore import Qt, QTimer, qInstallMessageHandler, QtMsgType
@@ -88,7 +93,7 @@ class QuickerApp:
             # 注册全局热键
             success = self.hotkey_manager.register_hotkey(hotkey)
             
-            # 注册动作快捷键
+            # 注册动作快捷键（命令面板复用面板热键：显示主面板后直接输入文字即可打开）
             if success:
                 actions = config_manager.get("actions", [])
                 self.hotkey_manager.register_action_hotkeys(actions)
@@ -218,6 +223,10 @@ class QuickerApp:
             self.floating_button = FloatingButton()
             self.floating_button.show()
             
+            # 事件循环启动后，在空闲时预热主面板，避免首次打开时等待构建
+            if config_manager.get("action_panel.prewarm", True):
+                QTimer.singleShot(0, self.floating_button.prewarm_panel)
+            
             # 初始化热键管理器
             print("初始化热键管理器...")
             self.init_hotkey_manager()
@@ -259,6 +268,41 @@ class QuickerApp:
         if self.hotkey_manager and hasattr(self.hotkey_manager, 'unregister_hotkey'):
             self.hotkey_manager.unregister_hotkey()
             
+        # 关闭动作执行服务的线程池
+        try:
+            from src.action_executor import action_executor
+            action_executor.shutdown()
+        except Exception as e:
+            print(f"关闭动作执行服务失败: {e}")
+            
+        # 结束脚本进程
+        try:
+            from src.script_worker_pool import get_script_worker_pool
+            get_script_worker_pool().shutdown()
+        except Exception as e:
+            print(f"结束脚本进程失败: {e}")
+            
+        # 保存脚本结果缓存（启用持久化时）
+        try:
+            from src.script_result_cache import script_result_cache
+            script_result_cache.save()
+        except Exception as e:
+            print(f"保存脚本结果缓存失败: {e}")
+            
+        # 写完排队中的文件输出
+        try:
+            from src.file_output import file_output_writer
+            file_output_writer.shutdown()
+        except Exception as e:
+            print(f"写入文件输出失败: {e}")
+            
+        # 写入未落盘的使用统计
+        try:
+            from src.usage_store import usage_store
+            usage_store.flush()
+        except Exception as e:
+            print(f"保存使用统计失败: {e}")
+            
         # 保存配置（只在退出时强制保存）
         try:
             config_manager.save_config(force=True)
@@ -2,13 +2,10 @@
 from typing import Dict, Any, Optional
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QLineEdit, QTextEdit, QComboBox, QWidget, QMessageBox
+    QLineEdit, QWidget, QMessageBox
 )
 from PySide6.QtCore import Qt
-import os
-import subprocess
-import sys
-from .config_manager import config_manager
+from .action_types import TypeEditor
 
 
 class ActionEditDialog(QDialog):
@@ -26,14 +23,10 @@ class ActionEditDialog(QDialog):
         self.config_widget: QWidget
         self.config_layout: QVBoxLayout
         
-        # 类型特定的控件（可选）
-        self.command_input: Optional[QTextEdit] = None
-        self.command_line_input: Optional[QLineEdit] = None  # 用于程序路径
-        self.url_input: Optional[QLineEdit] = None
-        self.text_input: Optional[QTextEdit] = None
-        self.input_source_combo: Optional[QComboBox] = None
-        self.output_target_combo: Optional[QComboBox] = None
-        self.script_input: Optional[QLineEdit] = None
+        # 动作类型处理器和类型特定的编辑区域（可选）
+        from .action_types import get_handler
+        self.handler = get_handler(self.action_type)
+        self.type_editor: Optional[TypeEditor] = None
         
         self.setWindowTitle(f"编辑动作 - {action_config.get('name', '未命名')}")
         self.setModal(True)
@@ -183,159 +176,13 @@ class ActionEditDialog(QDialog):
         
     def _get_type_name(self) -> str:
         """获取动作类型名称"""
-        type_names = {
-            "key": "模拟按键",
-            "program": "运行程序",
-            "url": "打开网址",
-            "text": "发送文本",
-            "panel": "子页面",
-            "input_output": "输入输出"
-        }
-        return type_names.get(self.action_type, "未知类型")
+        return self.handler.display_name if self.handler is not None else "未知类型"
         
     def _setup_type_specific_ui(self):
-        """根据动作类型设置特定的UI"""
-        label_style = "font-size: 12px; color: #555; margin-bottom: 5px;"
-        input_style = """
-            QLineEdit, QTextEdit, QComboBox {
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 12px;
-                background-color: white;
-            }
-            QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
-                border-color: #007bff;
-            }
-        """
-        
-        if self.action_type == "key":
-            # 模拟按键
-            command_label = QLabel("按键序列:")
-            command_label.setStyleSheet(label_style)
-            self.config_layout.addWidget(command_label)
-            
-            self.command_input = QTextEdit()
-            self.command_input.setStyleSheet(input_style)
-            self.command_input.setMaximumHeight(100)
-            self.command_input.setPlaceholderText("支持格式:\n• 组合键: ctrl+c, alt+tab\n• 单个按键: f5, enter\n• 文本串: \"hello world\"\n• 延时: wait(1000)")
-            self.config_layout.addWidget(self.command_input)
-            
-        elif self.action_type == "program":
-            # 运行程序
-            command_label = QLabel("程序路径:")
-            command_label.setStyleSheet(label_style)
-            self.config_layout.addWidget(command_label)
-            
-            self.command_line_input = QLineEdit()
-            self.command_line_input.setStyleSheet(input_style)
-            self.command_line_input.setPlaceholderText("如: notepad.exe 或完整路径")
-            self.config_layout.addWidget(self.command_line_input)
-            
-        elif self.action_type == "url":
-            # 打开网址
-            url_label = QLabel("网址 (URL):")
-            url_label.setStyleSheet(label_style)
-            self.config_layout.addWidget(url_label)
-            
-            self.url_input = QLineEdit()
-            self.url_input.setStyleSheet(input_style)
-            self.url_input.setPlaceholderText("如: https://www.google.com")
-            self.config_layout.addWidget(self.url_input)
-            
-        elif self.action_type == "text":
-            # 发送文本
-            text_label = QLabel("文本内容:")
-            text_label.setStyleSheet(label_style)
-            self.config_layout.addWidget(text_label)
-            
-            self.text_input = QTextEdit()
-            self.text_input.setStyleSheet(input_style)
-            self.text_input.setMaximumHeight(150)
-            self.text_input.setPlaceholderText("要发送的文本内容")
-            self.config_layout.addWidget(self.text_input)
-            
-        elif self.action_type == "input_output":
-            # 输入输出动作
-            # 输入源
-            input_label = QLabel("输入源:")
-            input_label.setStyleSheet(label_style)
-            self.config_layout.addWidget(input_label)
-            
-            self.input_source_combo = QComboBox()
-            self.input_source_combo.setStyleSheet(input_style)
-            input_options = [
-                ("剪贴板内容", "clipboard"),
-                ("鼠标选中文本", "selection"),
-                ("手动输入", "manual"),
-                ("无输入", "none")
-            ]
-            for text, value in input_options:
-                self.input_source_combo.addItem(text, value)
-            self.config_layout.addWidget(self.input_source_combo)
-            
-            # 输出目标
-            output_label = QLabel("输出目标:")
-            output_label.setStyleSheet(label_style)
-            self.config_layout.addWidget(output_label)
-            
-            self.output_target_combo = QComboBox()
-            self.output_target_combo.setStyleSheet(input_style)
-            output_options = [
-                ("发送文本", "text"),
-                ("打开网址", "url"),
-                ("复制到剪贴板", "clipboard"),
-                ("保存到文件", "file"),
-                ("显示窗口", "window")
-            ]
-            for text, value in output_options:
-                self.output_target_combo.addItem(text, value)
-            self.config_layout.addWidget(self.output_target_combo)
-            
-            # 脚本文件路径（只读显示）
-            script_label = QLabel("脚本文件:")
-            script_label.setStyleSheet(label_style)
-            self.config_layout.addWidget(script_label)
+        """由动作类型处理器创建类型特定的UI"""
+        if self.handler is not None:
+            self.type_editor = self.handler.create_editor(self.config_widget, self.config_layout)
             
-            script_file_layout = QHBoxLayout()
-            
-            self.script_input = QLineEdit()
-            self.script_input.setStyleSheet(input_style + "QLineEdit { background-color: #f8f9fa; }")
-            self.script_input.setReadOnly(True)
-            self.script_input.setPlaceholderText("脚本文件路径 (只读)")
-            script_file_layout.addWidget(self.script_input)
-            
-            # 添加编辑脚本按钮
-            edit_script_button = QPushButton("编辑脚本")
-            edit_script_button.setFixedSize(80, 32)
-            edit_script_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #28a745;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #218838;
-                }
-            """)
-            edit_script_button.clicked.connect(self._edit_script_file)
-            script_file_layout.addWidget(edit_script_button)
-            
-            self.config_layout.addLayout(script_file_layout)
-            
-        elif self.action_type == "panel":
-            # 子页面 - 显示提示信息
-            info_label = QLabel("子页面动作配置:")
-            info_label.setStyleSheet(label_style)
-            self.config_layout.addWidget(info_label)
-            
-            info_text = QLabel("子页面的动作内容需要在子页面中进行管理")
-            info_text.setStyleSheet("color: #6c757d; font-style: italic; padding: 10px; background-color: #f8f9fa; border-radius: 4px;")
-            info_text.setWordWrap(True)
-            self.config_layout.addWidget(info_text)
-    
     def _load_data(self):
         """加载数据到界面"""
         # 基本信息
@@ -344,39 +191,9 @@ class ActionEditDialog(QDialog):
         self.hotkey_input.setText(self.action_config.get("hotkey", ""))
         
         # 根据类型加载特定数据
-        if self.action_type == "key" and self.command_input:
-            self.command_input.setPlainText(self.action_config.get("command", ""))
-            
-        elif self.action_type == "program" and self.command_line_input:
-            self.command_line_input.setText(self.action_config.get("command", ""))
-            
-        elif self.action_type == "url" and self.url_input:
-            self.url_input.setText(self.action_config.get("url", ""))
+        if self.type_editor is not None:
+            self.type_editor.load(self.action_config)
             
-        elif self.action_type == "text" and self.text_input:
-            self.text_input.setPlainText(self.action_config.get("text", ""))
-            
-        elif self.action_type == "input_output":
-            if self.input_source_combo:
-                # 设置输入源
-                input_source = self.action_config.get("input_source", "clipboard")
-                for i in range(self.input_source_combo.count()):
-                    if self.input_source_combo.itemData(i) == input_source:
-                        self.input_source_combo.setCurrentIndex(i)
-                        break
-                        
-            if self.output_target_combo:
-                # 设置输出目标
-                output_target = self.action_config.get("output_target", "text")
-                for i in range(self.output_target_combo.count()):
-                    if self.output_target_combo.itemData(i) == output_target:
-                        self.output_target_combo.setCurrentIndex(i)
-                        break
-                        
-            if self.script_input:
-                # 显示脚本文件
-                self.script_input.setText(self.action_config.get("script_file", ""))
-    
     def _select_icon(self):
         """选择图标"""
         from .icon_manager import icon_manager
@@ -392,7 +209,7 @@ class ActionEditDialog(QDialog):
             selected_icon = dialog.get_selected_icon()
             if selected_icon:
                 self.icon_input.setText(selected_icon)
-    
+                
     def _save_changes(self):
         """保存更改"""
         try:
@@ -402,46 +219,20 @@ class ActionEditDialog(QDialog):
                 QMessageBox.warning(self, "错误", "动作名称不能为空")
                 return
                 
-            self.action_config["name"] = name
-            self.action_config["icon_path"] = self.icon_input.text().strip()
-            self.action_config["hotkey"] = self.hotkey_input.text().strip()
+            # 先写入副本，校验通过后才修改配置（校验失败时保留对话框打开前的内容）
+            new_config = dict(self.action_config)
+            new_config["name"] = name
+            new_config["icon_path"] = self.icon_input.text().strip()
+            new_config["hotkey"] = self.hotkey_input.text().strip()
             
             # 根据类型保存特定数据
-            if self.action_type == "key" and self.command_input:
-                command = self.command_input.toPlainText().strip()
-                if not command:
-                    QMessageBox.warning(self, "错误", "按键序列不能为空")
-                    return
-                self.action_config["command"] = command
-                
-            elif self.action_type == "program" and self.command_line_input:
-                command = self.command_line_input.text().strip()
-                if not command:
-                    QMessageBox.warning(self, "错误", "程序路径不能为空")
-                    return
-                self.action_config["command"] = command
-                
-            elif self.action_type == "url" and self.url_input:
-                url = self.url_input.text().strip()
-                if not url:
-                    QMessageBox.warning(self, "错误", "网址不能为空")
+            if self.type_editor is not None:
+                error = self.type_editor.save(new_config) or self.handler.validate(new_config)
+                if error:
+                    QMessageBox.warning(self, "错误", error)
                     return
-                self.action_config["url"] = url
-                
-            elif self.action_type == "text" and self.text_input:
-                text = self.text_input.toPlainText().strip()
-                if not text:
-                    QMessageBox.warning(self, "错误", "文本内容不能为空")
-                    return
-                self.action_config["text"] = text
-                
-            elif self.action_type == "input_output":
-                if self.input_source_combo and self.output_target_combo:
-                    input_source = self.input_source_combo.currentData()
-                    output_target = self.output_target_combo.currentData()
-                    self.action_config["input_source"] = input_source
-                    self.action_config["output_target"] = output_target
-                    # 脚本文件路径不允许编辑
+                    
+            self.action_config.update(new_config)
             
             # 更新原始配置
             self.original_config.update(self.action_config)
@@ -468,46 +259,7 @@ class ActionEditDialog(QDialog):
             print("[DEBUG] 已标记快捷键需要刷新")
         except Exception as e:
             print(f"刷新快捷键失败: {e}")
-    
-    def _edit_script_file(self):
-        """编辑脚本文件"""
-        if not hasattr(self, 'script_input') or not self.script_input:
-            return
-            
-        script_file = self.script_input.text().strip()
-        if not script_file:
-            QMessageBox.warning(self, "错误", "未找到脚本文件路径")
-            return
             
-        # 获取完整的文件路径
-        script_path = config_manager.get_input_output_script_path(script_file)
-        
-        if not script_path.exists():
-            QMessageBox.warning(self, "错误", f"脚本文件不存在: {script_path}")
-            return
-            
-        try:
-            # 尝试使用默认编辑器打开文件
-            script_path_str = str(script_path)
-            if sys.platform == "win32":
-                # Windows
-                os.startfile(script_path_str)
-            elif sys.platform == "darwin":
-                # macOS
-                subprocess.run(["open", script_path_str])
-            else:
-                # Linux 和其他 Unix 系统
-                subprocess.run(["xdg-open", script_path_str])
-                
-        except Exception as e:
-            # 如果默认编辑器失败，使用内置编辑器
-            try:
-                from .script_editor_dialog import ScriptEditorDialog
-                dialog = ScriptEditorDialog(str(script_path), self)
-                dialog.exec()
-            except Exception as e2:
-                QMessageBox.warning(self, "错误", f"无法打开文件编辑器: {e2}\n\n文件路径: {script_path}")
-    
     def get_updated_config(self) -> Dict[str, Any]:
         """获取更新后的配置"""
         return self.action_config
\ No newline at end of file
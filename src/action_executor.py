@@ -0,0 +1,197 @@
+# 动作执行服务模块：在有界线程池中执行耗时的动作，结果通过Qt信号回到界面线程
+from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import subprocess
+import sys
+import threading
+import time
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+class ActionJob:
+    """一个提交到执行服务的任务"""
+    
+    def __init__(self, job_id: str, action_type: str, func: Callable, args: tuple,
+                 on_success: Optional[Callable[[Any], None]], on_error: Optional[Callable[[str], None]]):
+        self.job_id = job_id
+        self.action_type = action_type
+        self.func = func
+        self.args = args
+        self.on_success = on_success
+        self.on_error = on_error
+        self.submit_time = time.perf_counter()
+        self.start_time = 0.0
+        self.end_time = 0.0
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.timed_out = False
+
+
+class ActionExecutor(QObject):
+    """动作执行服务
+    
+    任务在有界线程池中执行，排队数超过上限时直接拒绝；
+    每个任务可设置超时，超时后结果被丢弃并按失败回调（线程本身无法强制终止）。
+    成功、失败的结果都通过信号回到界面线程，再调用提交时传入的回调。
+    """
+    
+    job_finished = Signal(str, str, object)  # 任务ID、动作类型、结果
+    job_failed = Signal(str, str, str)  # 任务ID、动作类型、错误信息
+    _job_done = Signal(object)  # 工作线程 -> 界面线程
+    
+    def __init__(self, max_workers: int = 4, max_queue: int = 32, parent=None):
+        super().__init__(parent)
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._job_counter = itertools.count(1)
+        self._lock = threading.Lock()
+        self._queued = 0  # 已提交但尚未开始执行的任务数
+        self._running = 0
+        self._jobs: Dict[str, ActionJob] = {}
+        self._latency_stats: Dict[str, List[float]] = {}  # 动作类型 -> [次数, 累计毫秒, 最大毫秒]
+        self._job_done.connect(self._on_job_done)
+        
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """首次提交任务时创建线程池"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ActionWorker")
+        return self._pool
+        
+    @property
+    def queue_depth(self) -> int:
+        """排队中（尚未开始执行）的任务数"""
+        return self._queued
+        
+    def submit(self, action_type: str, func: Callable, *args,
+               timeout_ms: Optional[int] = None,
+               on_success: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[str], None]] = None) -> Optional[str]:
+        """提交任务，返回任务ID；队列已满时调用失败回调并返回None"""
+        with self._lock:
+            if self._queued >= self.max_queue:
+                message = f"执行队列已满（{self.max_queue} 个任务排队中），请稍后重试"
+                print(f"❌ {message}")
+                if on_error:
+                    on_error(message)
+                return None
+            self._queued += 1
+            
+        job = ActionJob(f"job_{next(self._job_counter)}", action_type, func, args, on_success, on_error)
+        self._jobs[job.job_id] = job
+        self._get_pool().submit(self._run_job, job)
+        
+        if timeout_ms:
+            QTimer.singleShot(timeout_ms, lambda: self._on_job_timeout(job.job_id, timeout_ms))
+        return job.job_id
+        
+    def _run_job(self, job: ActionJob):
+        """工作线程中执行任务"""
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        job.start_time = time.perf_counter()
+        try:
+            job.result = job.func(*job.args)
+        except Exception as e:
+            job.error = str(e) or e.__class__.__name__
+        job.end_time = time.perf_counter()
+        with self._lock:
+            self._running -= 1
+        self._job_done.emit(job)
+        
+    def _on_job_timeout(self, job_id: str, timeout_ms: int):
+        """任务超时：从等待列表移除并按失败处理，之后到达的结果会被丢弃"""
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return
+        job.timed_out = True
+        message = f"执行超时（超过 {timeout_ms / 1000:.1f} 秒）"
+        print(f"❌ 动作执行超时 [{job.action_type}] {job_id}")
+        self._record_latency(job.action_type, (time.perf_counter() - job.submit_time) * 1000)
+        self.job_failed.emit(job_id, job.action_type, message)
+        if job.on_error:
+            job.on_error(message)
+            
+    def _on_job_done(self, job: ActionJob):
+        """界面线程中分发任务结果"""
+        if self._jobs.pop(job.job_id, None) is None:
+            # 已经按超时处理过
+            print(f"[DEBUG] 丢弃超时任务的结果: {job.job_id}")
+            return
+            
+        wait_ms = (job.start_time - job.submit_time) * 1000
+        run_ms = (job.end_time - job.start_time) * 1000
+        self._record_latency(job.action_type, wait_ms + run_ms)
+        print(f"[性能] 动作执行({job.action_type}): 排队 {wait_ms:.1f} ms，执行 {run_ms:.1f} ms，"
+              f"当前排队 {self._queued} 个")
+              
+        if job.error is None:
+            self.job_finished.emit(job.job_id, job.action_type, job.result)
+            if job.on_success:
+                job.on_success(job.result)
+        else:
+            self.job_failed.emit(job.job_id, job.action_type, job.error)
+            if job.on_error:
+                job.on_error(job.error)
+                
+    def _record_latency(self, action_type: str, latency_ms: float):
+        """记录每类动作的总耗时（排队 + 执行）"""
+        stats = self._latency_stats.setdefault(action_type, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += latency_ms
+        stats[2] = max(stats[2], latency_ms)
+        
+    def get_stats(self) -> Dict[str, Any]:
+        """获取队列深度和每类动作的耗时统计"""
+        return {
+            "queue_depth": self._queued,
+            "running": self._running,
+            "latency": {
+                action_type: {"count": count, "average_ms": total / count, "max_ms": max_ms}
+                for action_type, (count, total, max_ms) in self._latency_stats.items() if count
+            }
+        }
+        
+    def shutdown(self):
+        """关闭线程池（不等待仍在运行的任务）"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+class ProcessLauncher:
+    """子进程启动器：启动后不等待，定期回收已退出的子进程"""
+    
+    def __init__(self):
+        self._children: List[subprocess.Popen] = []
+        self._lock = threading.Lock()
+        
+    def launch(self, command: str) -> int:
+        """启动程序（与原实现一样通过shell解析命令），返回进程ID"""
+        kwargs = {}
+        if sys.platform == "win32":
+            kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            # 与本程序分离，避免关闭程序时连带结束已启动的程序
+            kwargs["start_new_session"] = True
+        process = subprocess.Popen(command, shell=True, **kwargs)
+        with self._lock:
+            self._children = [child for child in self._children if child.poll() is None]
+            self._children.append(process)
+        return process.pid
+
+
+def _create_action_executor() -> ActionExecutor:
+    """按配置创建全局执行服务"""
+    from .config_manager import config_manager
+    return ActionExecutor(
+        max_workers=config_manager.get("action_executor.max_workers", 4),
+        max_queue=config_manager.get("action_executor.max_queue", 32)
+    )
+
+
+# 全局执行服务和子进程启动器
+action_executor = _create_action_executor()
+process_launcher = ProcessLauncher()
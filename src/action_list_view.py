@@ -0,0 +1,247 @@
+# 虚拟化动作列表视图模块（大量动作时替代按钮网格）
+from typing import Dict, Any, List, Optional
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PySide6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QMimeData, QSize, QRect, QPoint, Signal
+)
+from PySide6.QtGui import QPainter, QColor, QPen, QFont, QTextOption
+from .config_manager import config_manager
+from .icon_manager import icon_manager
+
+ACTION_ROW_MIME_TYPE = "application/x-quicker-action-row"
+
+
+class ActionListModel(QAbstractListModel):
+    """动作列表模型（直接引用面板的 action_configs，不复制数据）"""
+    
+    ActionConfigRole = Qt.ItemDataRole.UserRole + 1
+    TypeIconRole = Qt.ItemDataRole.UserRole + 2
+    
+    def __init__(self, actions: Optional[List[Dict[str, Any]]] = None, parent=None):
+        super().__init__(parent)
+        self._actions: List[Dict[str, Any]] = actions if actions is not None else []
+        
+    def set_actions(self, actions: List[Dict[str, Any]]):
+        """替换动作列表（整体重置模型）"""
+        self.beginResetModel()
+        self._actions = actions
+        self.endResetModel()
+        
+    def refresh_row(self, row: int):
+        """通知视图某一行的数据已变化"""
+        if 0 <= row < len(self._actions):
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+            
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._actions)
+        
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._actions)):
+            return None
+            
+        action = self._actions[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return action.get("name", "未命名")
+        if role == Qt.ItemDataRole.DecorationRole:
+            # 只有可见单元格绘制时才会请求图标，图标由icon_manager缓存
+            icon_path = action.get("icon_path", "")
+            if icon_path and icon_manager.has_icon(icon_path):
+                icon = icon_manager.get_icon(icon_path, QSize(32, 32))
+                if not icon.isNull():
+                    return icon
+            return None
+        if role == self.TypeIconRole:
+            from .button_widget import get_action_type_icon
+            return get_action_type_icon(action.get("type", ""))
+        if role == self.ActionConfigRole:
+            return action
+        return None
+        
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled
+        return (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable |
+                Qt.ItemFlag.ItemIsDragEnabled | Qt.ItemFlag.ItemIsDropEnabled)
+                
+    def supportedDragActions(self) -> Qt.DropAction:
+        return Qt.DropAction.MoveAction | Qt.DropAction.CopyAction
+        
+    def supportedDropActions(self) -> Qt.DropAction:
+        return Qt.DropAction.MoveAction
+        
+    def mimeTypes(self) -> List[str]:
+        return [ACTION_ROW_MIME_TYPE]
+        
+    def mimeData(self, indexes) -> QMimeData:
+        mime_data = QMimeData()
+        if indexes:
+            mime_data.setData(ACTION_ROW_MIME_TYPE, str(indexes[0].row()).encode("ascii"))
+        return mime_data
+
+
+class ActionItemDelegate(QStyledItemDelegate):
+    """动作单元格绘制代理（按 action_buttons 配置绘制圆角按钮外观）"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        btn_config = config_manager.get("action_buttons", {})
+        style_config = btn_config.get("style", {})
+        
+        self.cell_size = btn_config.get("size", 66)
+        self.background_color = QColor(style_config.get("background_color", "#f8fbff"))
+        self.hover_background_color = QColor(style_config.get("hover_background_color", "#e6f0ff"))
+        self.pressed_background_color = QColor(style_config.get("pressed_background_color", "#e0f0ff"))
+        self.border_radius = style_config.get("border_radius", 12)
+        self.text_color = QColor(style_config.get("color", "#333"))
+        
+        self.text_font = QFont()
+        self.text_font.setPixelSize(style_config.get("font_size", 9))
+        self.icon_font = QFont()
+        self.icon_font.setPixelSize(20)
+        
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(self.cell_size, self.cell_size)
+        
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        
+        state = option.state
+        rect = QRect(option.rect.topLeft(), QSize(self.cell_size, self.cell_size)).adjusted(1, 1, -1, -1)
+        
+        # 背景与边框
+        if state & QStyle.StateFlag.State_Selected:
+            background = self.pressed_background_color
+        elif state & QStyle.StateFlag.State_MouseOver:
+            background = self.hover_background_color
+        else:
+            background = self.background_color
+        painter.setBrush(background)
+        if state & QStyle.StateFlag.State_HasFocus:
+            painter.setPen(QPen(QColor("#4f7cff"), 2, Qt.PenStyle.DashLine))
+        else:
+            painter.setPen(QPen(QColor("#ddd"), 1))
+        painter.drawRoundedRect(rect, self.border_radius, self.border_radius)
+        
+        # 图标区占60%，文字区占其余部分
+        content_rect = rect.adjusted(4, 4, -4, -4)
+        icon_height = int(self.cell_size * 0.6)
+        icon_rect = QRect(content_rect.left(), content_rect.top(), content_rect.width(), icon_height)
+        text_rect = QRect(content_rect.left(), icon_rect.bottom() + 2,
+                          content_rect.width(), content_rect.bottom() - icon_rect.bottom() - 2)
+                          
+        icon = index.data(Qt.ItemDataRole.DecorationRole)
+        if icon is not None:
+            icon.paint(painter, icon_rect, Qt.AlignmentFlag.AlignCenter)
+        else:
+            painter.setFont(self.icon_font)
+            painter.setPen(self.text_color)
+            painter.drawText(icon_rect, Qt.AlignmentFlag.AlignCenter,
+                             index.data(ActionListModel.TypeIconRole) or "")
+                             
+        painter.setFont(self.text_font)
+        painter.setPen(self.text_color)
+        text_option = QTextOption(Qt.AlignmentFlag.AlignCenter)
+        text_option.setWrapMode(QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere)
+        painter.drawText(text_rect, index.data(Qt.ItemDataRole.DisplayRole) or "", text_option)
+        
+        painter.restore()
+
+
+class ActionListView(QListView):
+    """虚拟化的动作网格视图（IconMode，只有可见单元格参与绘制）"""
+    
+    action_triggered = Signal(int)  # 执行动作（点击或回车）
+    reorder_requested = Signal(int, int)  # 拖拽交换：源行、目标行
+    context_menu_requested = Signal(int, QPoint)  # 右键菜单：行、全局坐标
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        btn_config = config_manager.get("action_buttons", {})
+        size = btn_config.get("size", 66)
+        spacing = btn_config.get("spacing", 10)
+        
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setMovement(QListView.Movement.Static)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setUniformItemSizes(True)
+        self.setGridSize(QSize(size + spacing, size + spacing))
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover, True)
+        self.setStyleSheet("QListView { background: transparent; border: none; }")
+        
+        # 拖拽交换由视图自行处理，不让模型删除源行
+        self.setDragEnabled(True)
+        self.setAcceptDrops(True)
+        self.setDropIndicatorShown(True)
+        self.setDragDropMode(QAbstractItemView.DragDropMode.DragDrop)
+        self.setDefaultDropAction(Qt.DropAction.MoveAction)
+        
+        self.setItemDelegate(ActionItemDelegate(self))
+        
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.customContextMenuRequested.connect(self._on_context_menu_requested)
+        self.clicked.connect(lambda index: self.action_triggered.emit(index.row()))
+        
+    def keyPressEvent(self, event):
+        """回车执行当前动作，菜单键弹出右键菜单，其余按键交给默认的方向键导航"""
+        index = self.currentIndex()
+        if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter) and index.isValid():
+            self.action_triggered.emit(index.row())
+            return
+        if event.key() == Qt.Key.Key_Menu and index.isValid():
+            center = self.visualRect(index).center()
+            self.context_menu_requested.emit(index.row(), self.viewport().mapToGlobal(center))
+            return
+        super().keyPressEvent(event)
+        
+    def _on_context_menu_requested(self, position: QPoint):
+        """右键菜单请求"""
+        index = self.indexAt(position)
+        if index.isValid():
+            self.setCurrentIndex(index)
+            self.context_menu_requested.emit(index.row(), self.viewport().mapToGlobal(position))
+            
+    def _get_drag_source_row(self, event) -> int:
+        """获取本视图内拖拽的源行，非本视图的拖拽返回-1"""
+        mime_data = event.mimeData()
+        if event.source() is not self or not mime_data.hasFormat(ACTION_ROW_MIME_TYPE):
+            return -1
+        try:
+            return int(bytes(mime_data.data(ACTION_ROW_MIME_TYPE)).decode("ascii"))
+        except ValueError:
+            return -1
+            
+    def dragEnterEvent(self, event):
+        if self._get_drag_source_row(event) >= 0:
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+            
+    def dragMoveEvent(self, event):
+        if self._get_drag_source_row(event) >= 0:
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+            
+    def dropEvent(self, event):
+        """拖放：与网格模式一致，交换源单元格与目标单元格"""
+        source_row = self._get_drag_source_row(event)
+        if source_row < 0:
+            event.ignore()
+            return
+            
+        target_index = self.indexAt(event.position().toPoint())
+        target_row = target_index.row() if target_index.isValid() else self.model().rowCount() - 1
+        
+        # 以复制动作结束拖拽，避免视图在拖拽完成后删除源行
+        event.setDropAction(Qt.DropAction.CopyAction)
+        event.accept()
+        
+        if target_row != source_row:
+            self.reorder_requested.emit(source_row, target_row)
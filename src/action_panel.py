@@ -6,23 +6,37 @@ from PySide6.QtWidgets import (
     QListWidget, QListWidgetItem, QHBoxLayout, QComboBox, QPlainTextEdit, QLineEdit,
     QTabWidget
 )
-from PySide6.QtCore import Qt, QPoint, Signal, QTimer
+from PySide6.QtCore import (
+    Qt, QPoint, Signal, QTimer, QPropertyAnimation, QParallelAnimationGroup,
+    QEasingCurve
+)
 from PySide6.QtGui import QCursor
 from .config_manager import config_manager
 import uuid
 import copy
+import json
+import time
+from collections import OrderedDict
 
 if TYPE_CHECKING:
     from .floating_button import FloatingButton
     from .button_widget import DraggableButton
 
 class SilentInfoDialog(QDialog):
-    """无声信息对话框（不播放系统提示音）"""
+    """无声信息对话框（不播放系统提示音）
+    
+    streaming 为 True 时是非模态的实时输出窗口：用 append_text 追加内容，
+    结束前按钮为“取消”（发出 cancel_requested），set_finished 后变为“确定”。
+    """
     
-    def __init__(self, title: str, message: str, parent=None):
+    cancel_requested = Signal()
+    
+    def __init__(self, title: str, message: str, parent=None, streaming: bool = False):
         super().__init__(parent)
         self.setWindowTitle(title)
-        self.setModal(True)
+        self.setModal(not streaming)
+        self._streaming = streaming
+        self._finished = False
         self.resize(500, 400)
         
         # 设置窗口标志，移除问号按钮
@@ -39,6 +53,7 @@ class SilentInfoDialog(QDialog):
         text_edit = QTextEdit()
         text_edit.setPlainText(message)
         text_edit.setReadOnly(True)
+        self.text_edit = text_edit
         text_edit.setStyleSheet("""
             QTextEdit {
                 background-color: #f8f9fa;
@@ -71,13 +86,47 @@ class SilentInfoDialog(QDialog):
                 background-color: #004085;
             }
         """)
-        ok_button.clicked.connect(self.accept)
+        ok_button.clicked.connect(self._on_button_clicked)
+        self.ok_button = ok_button
+        if streaming:
+            ok_button.setText("取消")
         
         # 按钮布局
         button_layout = QVBoxLayout()
         button_layout.addWidget(ok_button)
         button_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addLayout(button_layout)
+        
+    def append_text(self, text: str):
+        """在末尾追加文本（不换行），视图跟随到末尾"""
+        cursor = self.text_edit.textCursor()
+        cursor.movePosition(cursor.MoveOperation.End)
+        cursor.insertText(text)
+        self.text_edit.verticalScrollBar().setValue(self.text_edit.verticalScrollBar().maximum())
+        
+    def set_finished(self, message: str = ""):
+        """实时输出结束（message 非空时表示中止原因，重复调用无影响）"""
+        if self._finished:
+            return
+        self._finished = True
+        self._streaming = False
+        self.ok_button.setText("确定")
+        if message:
+            self.append_text(f"\n\n[{message}]")
+            
+    def _on_button_clicked(self):
+        if self._streaming:
+            self.cancel_requested.emit()
+            self.set_finished("已取消")
+        else:
+            self.accept()
+            
+    def closeEvent(self, event):
+        """实时输出时关闭窗口视为取消"""
+        if self._streaming:
+            self.cancel_requested.emit()
+            self._streaming = False
+        super().closeEvent(event)
 
 
 class BackupSelectionDialog(QDialog):
@@ -274,14 +323,28 @@ class ActionPanel(QWidget):
     _clipboard_operation: str = ""  # "copy" 或 "cut"
     _clipboard_source_panel: Optional['ActionPanel'] = None
     
-    def __init__(self, parent=None, actions: Optional[List[Dict[str, Any]]] = None, level: int = 0):
+    def __init__(self, parent=None, actions: Optional[List[Dict[str, Any]]] = None, level: int = 0,
+                 node_id: str = ""):
         super().__init__(parent)
         
         self.level = level
+        self._node_id = node_id  # 子面板对应的面板动作ID
         self.action_configs = actions if actions is not None else config_manager.get("actions", [])
         self.parent_panel = parent if isinstance(parent, ActionPanel) else None
-        self.sub_panels: List['ActionPanel'] = []
+        # 子面板缓存：面板动作ID -> 子面板（按最近使用顺序，超出上限时淘汰最久未用的）
+        self._sub_panel_cache: "OrderedDict[str, ActionPanel]" = OrderedDict()
+        self._subtree_signature = ""  # 作为子面板时，上次加载的子树签名
         self.buttons: List[DraggableButton] = []
+        self._button_pool: Dict[str, DraggableButton] = {}  # 按钮池：动作ID -> 按钮
+        self._grid_positions: Dict[QWidget, tuple] = {}  # 网格中各控件当前所在单元格
+        self._grid_placeholders: List[QWidget] = []  # 复用的空白占位符
+        self._add_button: Optional[QPushButton] = None
+        self._config_button: Optional[QPushButton] = None
+        self._swap_animation: Optional[QParallelAnimationGroup] = None
+        self._recent_strip: Optional[QWidget] = None  # 主面板的常用动作条
+        self._recent_buttons: List[QPushButton] = []
+        self.action_model = None  # 列表视图模式下的动作模型
+        self.action_view = None  # 列表视图模式下的虚拟化视图
         self._dragged_button: Optional[DraggableButton] = None
         self._current_placeholder_index = -1
         
@@ -310,6 +373,8 @@ class ActionPanel(QWidget):
     def showEvent(self, event):
         """面板显示事件（模仿1.94.py方式）"""
         super().showEvent(event)
+        if self._recent_strip is not None:
+            self._refresh_recent_strip()
         # 确保显示的面板在跟踪列表中
         if self not in ActionPanel._open_panels:
             ActionPanel._open_panels.append(self)
@@ -331,6 +396,51 @@ class ActionPanel(QWidget):
             print(f"[DEBUG] 面板关闭时从跟踪列表移除: {self._panel_id}")
         super().closeEvent(event)
         
+    def _refresh_recent_strip(self):
+        """按使用频近度刷新常用动作条（按钮复用，只更新文字）"""
+        from .action_search import action_search_index
+        from .usage_store import usage_store
+        from .button_widget import get_action_type_icon
+        
+        count = config_manager.get("action_panel.recent_strip_count", 5)
+        action_search_index.ensure_synced(config_manager.get("actions", []))
+        recent_actions = []
+        for action_id in usage_store.get_top_ids(count * 2):
+            action = action_search_index.get_action(action_id)
+            if action is not None:
+                recent_actions.append((action_id, action))
+            if len(recent_actions) >= count:
+                break
+                
+        strip_layout = self._recent_strip.layout()
+        while len(self._recent_buttons) < len(recent_actions):
+            button = QPushButton(self._recent_strip)
+            button.setCursor(Qt.CursorShape.PointingHandCursor)
+            button.clicked.connect(lambda checked=False, btn=button: self._execute_recent_action(btn.property("action_id")))
+            strip_layout.insertWidget(len(self._recent_buttons), button)
+            self._recent_buttons.append(button)
+            
+        for index, button in enumerate(self._recent_buttons):
+            if index < len(recent_actions):
+                action_id, action = recent_actions[index]
+                name = action.get("name", "未命名")
+                button.setText(f"{get_action_type_icon(action.get('type', ''))} {name[:6]}")
+                button.setToolTip(name)
+                button.setProperty("action_id", action_id)
+                button.show()
+            else:
+                button.hide()
+        self._recent_strip.setVisible(bool(recent_actions))
+        
+    def _execute_recent_action(self, action_id: str):
+        """执行常用动作条中的动作"""
+        from .action_search import action_search_index
+        action = action_search_index.get_action(action_id)
+        if action is None:
+            print(f"❌ 未找到动作 ID: {action_id}")
+            return
+        self._execute_action_config(action)
+        
     def _generate_panel_id(self) -> str:
         """生成面板唯一标识符"""
         parent = self.parent()
@@ -340,11 +450,7 @@ class ActionPanel(QWidget):
             return "main_panel"
         elif isinstance(parent, ActionPanel):
             parent_id = getattr(parent, '_panel_id', 'unknown')
-            try:
-                index = parent.sub_panels.index(self) if hasattr(parent, 'sub_panels') else 0
-            except (ValueError, AttributeError):
-                index = len(getattr(parent, 'sub_panels', []))
-            return f"{parent_id}_sub_{index}"
+            return f"{parent_id}_sub_{self._node_id or uuid.uuid4().hex[:8]}"
         else:
             return f"panel_{uuid.uuid4().hex[:8]}"
     
@@ -353,14 +459,16 @@ class ActionPanel(QWidget):
         panel_config = config_manager.get("action_panel", {})
         btn_config = config_manager.get("action_buttons", {})
         
-        # 设置面板样式（只对ActionPanel生效，不影响子组件）
+        # 设置面板样式（ActionPanel选择器只对面板本身生效），
+        # 动作按钮的共享样式表也在面板级别一次性设置
+        from .button_widget import build_action_button_stylesheet
         self.setStyleSheet(f"""
             ActionPanel {{
                 background-color: {panel_config.get("background_color", "rgba(240, 240, 240, 0.95)")};
                 border-radius: 10px;
                 border: 1px solid #ccc;
             }}
-        """)
+        """ + build_action_button_stylesheet(btn_config.get("style", {})))
         
         # 计算面板尺寸
         btn_size = btn_config.get("size", 80)
@@ -388,18 +496,61 @@ class ActionPanel(QWidget):
         )
         main_layout.addWidget(title_label)
         
+        # 常用动作条（仅主面板，按使用频近度排列）
+        if self.level == 0 and panel_config.get("show_recent_strip", False):
+            self._recent_strip = QWidget(self)
+            self._recent_strip.setStyleSheet("""
+                QPushButton {
+                    background-color: #ffffff;
+                    border: 1px solid #ddd;
+                    border-radius: 6px;
+                    padding: 2px 6px;
+                    font-size: 11px;
+                    color: #333;
+                }
+                QPushButton:hover {
+                    background-color: #e6f0ff;
+                    border-color: #4f7cff;
+                }
+            """)
+            strip_layout = QHBoxLayout(self._recent_strip)
+            strip_layout.setContentsMargins(0, 0, 0, 0)
+            strip_layout.setSpacing(4)
+            strip_layout.addStretch()
+            self._recent_strip.hide()
+            main_layout.addWidget(self._recent_strip)
+            
         # 网格布局
         self.grid_layout = QGridLayout()
         self.grid_layout.setSpacing(btn_config.get("spacing", 10))
         main_layout.addLayout(self.grid_layout)
         
+        # 列表视图模式：动作由虚拟化视图绘制，控制按钮固定在视图下方
+        if self._use_list_view():
+            from .action_list_view import ActionListModel, ActionListView
+            self.action_model = ActionListModel(self.action_configs, self)
+            self.action_view = ActionListView(self)
+            self.action_view.setModel(self.action_model)
+            self.action_view.action_triggered.connect(self._on_view_action_triggered)
+            self.action_view.reorder_requested.connect(self._swap_actions)
+            self.action_view.context_menu_requested.connect(self._show_view_context_menu)
+            main_layout.addWidget(self.action_view, 1)
+            
+            control_layout = QHBoxLayout()
+            add_btn, config_btn = self._ensure_control_buttons()
+            control_layout.addWidget(add_btn)
+            control_layout.addWidget(config_btn)
+            control_layout.addStretch()
+            main_layout.addLayout(control_layout)
+            
         # 返回按钮（如果不是主面板）
         if self.level > 0:
             back_button = QPushButton("返回")
             back_button.clicked.connect(self.go_back)
             main_layout.addWidget(back_button)
         
-        main_layout.addStretch()
+        if self.action_view is None:
+            main_layout.addStretch()
         
         # 占位符控件
         btn_size = btn_config.get("size", 80)
@@ -409,103 +560,188 @@ class ActionPanel(QWidget):
             "background-color: transparent; border: 2px dashed #999; border-radius: 8px;"
         )
         
+    def _use_list_view(self) -> bool:
+        """是否使用虚拟化列表视图（view_mode: grid / list_view / auto）"""
+        view_mode = config_manager.get("action_panel.view_mode", "grid")
+        if view_mode == "list_view":
+            return True
+        if view_mode == "auto":
+            threshold = config_manager.get("action_panel.list_view_threshold", 64)
+            return len(self.action_configs) > threshold
+        return False
+        
     def load_actions(self):
-        """刷新动作按钮界面（重新创建所有按钮和布局）"""
-        # 清除现有按钮
-        for button in self.buttons:
+        """刷新动作按钮界面（按动作ID复用已有按钮，只创建/销毁变化的部分）"""
+        start_time = time.perf_counter()
+        
+        if self.action_view is not None:
+            # 列表视图模式：只重置模型，不创建任何按钮控件
+            self.action_model.set_actions(self.action_configs)
+            self._prune_sub_panel_cache()
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            print(f"[DEBUG] 刷新动作列表视图: {len(self.action_configs)} 个动作，耗时 {elapsed_ms:.1f} ms")
+            return
+            
+        old_pool = self._button_pool
+        new_pool: Dict[str, 'DraggableButton'] = {}
+        new_buttons: List['DraggableButton'] = []
+        reused_count = 0
+        created_count = 0
+        
+        for index, action_config in enumerate(self.action_configs):
+            pool_key = action_config.get("id") or f"__index_{index}"
+            if pool_key in new_pool:
+                # 重复ID（如手工编辑的配置），按位置区分
+                pool_key = f"{pool_key}__{index}"
+                
+            button = old_pool.pop(pool_key, None)
+            if button is not None:
+                # 复用已有按钮，只重新绑定配置
+                button.rebind(action_config)
+                reused_count += 1
+            else:
+                button = self._create_action_button(action_config)
+                created_count += 1
+                
+            new_pool[pool_key] = button
+            new_buttons.append(button)
+            
+        # 销毁已不存在的动作对应的按钮
+        removed_count = len(old_pool)
+        for button in old_pool.values():
+            self.grid_layout.removeWidget(button)
+            self._grid_positions.pop(button, None)
+            button.hide()
             button.deleteLater()
-        self.buttons.clear()
-        self.sub_panels.clear()
-        
-        # 创建动作按钮
-        for action_config in self.action_configs:
-            from .button_widget import DraggableButton
-            button = DraggableButton(action_config, self)
-            
-            # 连接信号
-            button.rename_requested.connect(self.handle_rename_action)
-            button.icon_change_requested.connect(self.handle_icon_change)
-            button.delete_requested.connect(lambda btn=button: self.handle_delete_action(btn))
-            button.copy_requested.connect(lambda btn=button: self.handle_copy_action(btn))
-            button.cut_requested.connect(lambda btn=button: self.handle_cut_action(btn))
-            button.edit_requested.connect(lambda btn=button: self.handle_edit_action(btn))
-            
-            # 根据动作类型连接点击事件
-            action_type = action_config.get("type")
-            if action_type == "key":
-                cmd = action_config.get("command", "")
-                button.clicked.connect(lambda c=cmd: self.simulate_key(c))
-            elif action_type == "program":
-                cmd = action_config.get("command", "")
-                button.clicked.connect(lambda c=cmd: self.run_program(c))
-            elif action_type == "url":
-                url = action_config.get("url", "")
-                button.clicked.connect(lambda u=url: self.open_url(u))
-            elif action_type == "text":
-                txt = action_config.get("text", "")
-                button.clicked.connect(lambda t=txt: self.send_text(t))
-            elif action_type == "panel":
-                acts = action_config.get("actions", [])
-                button.clicked.connect(lambda a=acts: self.open_sub_panel(a))
-            elif action_type == "input_output":
-                script_file = action_config.get("script_file", "")
-                input_source = action_config.get("input_source", "clipboard")
-                output_target = action_config.get("output_target", "text")
-                button.clicked.connect(lambda sf=script_file, ins=input_source, out=output_target: 
-                                     self.execute_input_output(sf, ins, out))
-            elif action_type == "quick_send":
-                # 快捷发送动作 - 打开快捷发送面板
-                filename = action_config.get("filename", "")
-                button.clicked.connect(lambda f=filename: self.open_quick_send_panel(f))
-            
-            self.buttons.append(button)
+            
+        self._button_pool = new_pool
+        self.buttons = new_buttons
+        self._prune_sub_panel_cache()
         
         self._relayout_buttons()
         
-    def _relayout_buttons(self):
-        """重新布局按钮"""
-        # 清除现有布局
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().setParent(None)
-        
-        columns = config_manager.get("action_panel.columns", 4)
-        
-        # 放置动作按钮
-        for i, button in enumerate(self.buttons):
-            row = i // columns
-            col = i % columns
-            self.grid_layout.addWidget(button, row, col)
-        
-        # 添加空白占位符
-        num_buttons = len(self.buttons)
-        if columns > 0 and num_buttons % columns != 0:
-            placeholders_to_add = columns - (num_buttons % columns)
-            start_index = num_buttons
-            btn_size = config_manager.get("action_buttons.size", 66)  # 修改默认大小为66
-            
-            for i in range(placeholders_to_add):
-                placeholder = QWidget()
-                placeholder.setFixedSize(btn_size, btn_size)
-                placeholder.setStyleSheet(
-                    "background-color: transparent; border: 1px dashed #ccc; border-radius: 8px;"
-                )
-                
-                current_index = start_index + i
-                row = current_index // columns
-                col = current_index % columns
-                self.grid_layout.addWidget(placeholder, row, col)
-        
-        # 添加"新增动作"按钮
-        self._add_control_buttons(columns)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        print(f"[DEBUG] 刷新动作按钮: 复用 {reused_count}，新建 {created_count}，"
+              f"销毁 {removed_count}，耗时 {elapsed_ms:.1f} ms")
+        
+    def _create_action_button(self, action_config: Dict[str, Any]) -> 'DraggableButton':
+        """创建动作按钮并连接信号（信号只连接一次，复用时无需重连）"""
+        from .button_widget import DraggableButton
+        button = DraggableButton(action_config, self)
+        
+        # 连接信号
+        button.rename_requested.connect(self.handle_rename_action)
+        button.icon_change_requested.connect(self.handle_icon_change)
+        button.delete_requested.connect(lambda btn=button: self.handle_delete_action(btn))
+        button.copy_requested.connect(lambda btn=button: self.handle_copy_action(btn))
+        button.cut_requested.connect(lambda btn=button: self.handle_cut_action(btn))
+        button.edit_requested.connect(lambda btn=button: self.handle_edit_action(btn))
+        
+        # 点击时读取按钮当前绑定的配置，保证复用后执行的是最新动作
+        button.clicked.connect(lambda btn=button: self._execute_action_config(btn.action_config))
+        return button
+        
+    def _relayout_buttons(self, animate: bool = False):
+        """增量重新布局按钮（只移动位置发生变化的单元格，占位符和控制按钮跨布局复用）"""
+        columns = max(1, config_manager.get("action_panel.columns", 4))
+        
+        # 计算期望的单元格顺序：动作按钮 -> 新增/配置按钮 -> 补齐整行的占位符
+        add_btn, config_btn = self._ensure_control_buttons()
+        desired_widgets: List[QWidget] = list(self.buttons) + [add_btn, config_btn]
+        placeholders_needed = (-len(desired_widgets)) % columns
+        desired_widgets.extend(self._ensure_grid_placeholders(placeholders_needed))
+        
+        # 记录移动前的位置（用于动画）
+        old_positions = {widget: widget.pos() for widget in desired_widgets} if animate else {}
+        
+        # 移除不再需要的单元格（已删除的按钮、多余的占位符）
+        desired_set = set(desired_widgets)
+        for widget in list(self._grid_positions):
+            if widget not in desired_set:
+                self.grid_layout.removeWidget(widget)
+                del self._grid_positions[widget]
+                if widget in self._grid_placeholders:
+                    widget.hide()
+        
+        # 只移动位置发生变化的单元格
+        moved_widgets: List[QWidget] = []
+        for index, widget in enumerate(desired_widgets):
+            cell = divmod(index, columns)
+            current_cell = self._grid_positions.get(widget)
+            if current_cell == cell:
+                continue
+            if current_cell is not None:
+                self.grid_layout.removeWidget(widget)
+            self.grid_layout.addWidget(widget, cell[0], cell[1])
+            self._grid_positions[widget] = cell
+            if widget.isHidden() and widget in self._grid_placeholders:
+                widget.show()
+            moved_widgets.append(widget)
+            
+        if animate and moved_widgets:
+            self._animate_cell_moves(moved_widgets, old_positions)
+            
+    def _ensure_grid_placeholders(self, count: int) -> List[QWidget]:
+        """获取指定数量的空白占位符（不足时才创建）"""
+        btn_size = config_manager.get("action_buttons.size", 66)  # 修改默认大小为66
+        while len(self._grid_placeholders) < count:
+            placeholder = QWidget(self)
+            placeholder.setFixedSize(btn_size, btn_size)
+            placeholder.setStyleSheet(
+                "background-color: transparent; border: 1px dashed #ccc; border-radius: 8px;"
+            )
+            self._grid_placeholders.append(placeholder)
+        return self._grid_placeholders[:count]
         
-    def _add_control_buttons(self, columns: int):
-        """添加控制按钮（新增、设置等）"""
+    def _animate_cell_moves(self, widgets: List[QWidget], old_positions: Dict[QWidget, QPoint]):
+        """为位置变化的单元格播放移动动画"""
+        if not config_manager.get("action_panel.animate_swap", True) or not self.isVisible():
+            return
+            
+        # 立即应用新布局，得到目标位置
+        self.layout().activate()
+        
+        duration = config_manager.get("action_panel.swap_animation_ms", 150)
+        group = QParallelAnimationGroup(self)
+        for widget in widgets:
+            start_pos = old_positions.get(widget)
+            end_pos = widget.pos()
+            if start_pos is None or start_pos == end_pos:
+                continue
+            animation = QPropertyAnimation(widget, b"pos", group)
+            animation.setDuration(duration)
+            animation.setStartValue(start_pos)
+            animation.setEndValue(end_pos)
+            animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+            group.addAnimation(animation)
+            
+        if group.animationCount() == 0:
+            group.deleteLater()
+            return
+            
+        # 停止上一次未完成的动画，避免位置冲突
+        if self._swap_animation is not None:
+            self._swap_animation.stop()
+            self._swap_animation.deleteLater()
+        self._swap_animation = group
+        group.finished.connect(self._on_swap_animation_finished)
+        group.start()
+        
+    def _on_swap_animation_finished(self):
+        """交换动画结束后释放动画对象"""
+        if self._swap_animation is not None:
+            self._swap_animation.deleteLater()
+            self._swap_animation = None
+        
+    def _ensure_control_buttons(self):
+        """获取控制按钮（新增、设置等），只在首次布局时创建"""
+        if self._add_button is not None and self._config_button is not None:
+            return self._add_button, self._config_button
+            
         btn_size = config_manager.get("action_buttons.size", 66)  # 修改默认大小为66
         
         # 新增动作按钮
-        add_btn = QPushButton("+")
+        add_btn = QPushButton("+", self)
         add_btn.setFixedSize(btn_size, btn_size)
         add_btn.setStyleSheet("""
             QPushButton {
@@ -523,12 +759,8 @@ class ActionPanel(QWidget):
         add_btn.setToolTip("新增动作")
         add_btn.clicked.connect(self.add_new_action)
         
-        row = len(self.buttons) // columns
-        col = len(self.buttons) % columns
-        self.grid_layout.addWidget(add_btn, row, col)
-        
         # 配置管理按钮
-        config_btn = QPushButton("⚙")
+        config_btn = QPushButton("⚙", self)
         config_btn.setFixedSize(btn_size, btn_size)
         config_btn.setStyleSheet("""
             QPushButton {
@@ -547,115 +779,28 @@ class ActionPanel(QWidget):
         config_btn.setToolTip("配置管理")
         config_btn.clicked.connect(self.show_config_menu)
         
-        row = (len(self.buttons) + 1) // columns
-        col = (len(self.buttons) + 1) % columns
-        self.grid_layout.addWidget(config_btn, row, col)
+        self._add_button = add_btn
+        self._config_button = config_btn
+        return add_btn, config_btn
         
     def add_new_action(self):
         """添加新动作"""
+        from .action_types import get_action_types, get_handler
         menu = QMenu(self)
-        menu.addAction("模拟按键", lambda: self.create_new_action("key"))
-        menu.addAction("运行程序", lambda: self.create_new_action("program"))
-        menu.addAction("打开网址", lambda: self.create_new_action("url"))
-        menu.addAction("发送文本", lambda: self.create_new_action("text"))
-        menu.addAction("输入输出", lambda: self.create_new_action("input_output"))
-        menu.addAction("快捷发送", lambda: self.create_new_action("quick_send"))
-        menu.addAction("新建子页面", lambda: self.create_new_action("panel"))
+        for action_type in get_action_types():
+            handler = get_handler(action_type)
+            if handler is not None and handler.menu_label:
+                menu.addAction(handler.menu_label, lambda t=action_type: self.create_new_action(t))
         menu.exec(QCursor.pos())
         
     def create_new_action(self, action_type: str):
-        """创建新动作"""
-        action = None
-        
-        if action_type == "key":
-            text, ok = QInputDialog.getText(
-                self, "新增动作", 
-                "请输入要模拟的按键序列：\\n\\n"
-                "支持格式：\\n"
-                "• 组合键: ctrl+c, alt+tab\\n"
-                "• 单个按键: f5, enter, space\\n"
-                "• 文本串: \"hello world\"\\n"
-                "• 延时等待: wait(1000)\\n"
-                "• 序列组合: ctrl+c, wait(500), \"text\", enter"
-            )
-            if ok and text.strip():
-                action = config_manager.create_action("模拟按键", "key", command=text.strip())
-                
-        elif action_type == "program":
-            text, ok = QInputDialog.getText(self, "新增动作", "请输入程序路径或文件路径：")
-            if ok and text.strip():
-                action = config_manager.create_action("运行程序", "program", command=text.strip())
-                
-        elif action_type == "url":
-            text, ok = QInputDialog.getText(self, "新增动作", "请输入网址（URL）：")
-            if ok and text.strip():
-                action = config_manager.create_action("打开网址", "url", url=text.strip())
-                
-        elif action_type == "text":
-            text, ok = QInputDialog.getText(self, "新增动作", "请输入要发送的文本内容：")
-            if ok and text.strip():
-                action = config_manager.create_action("发送文本", "text", text=text.strip())
-                
-        elif action_type == "panel":
-            text, ok = QInputDialog.getText(self, "新增子页面", "请输入子页面名称：")
-            if ok and text.strip():
-                action = config_manager.create_action(text.strip(), "panel", actions=[])
-                
-        elif action_type == "input_output":
-            # 创建输入输出动作
-            from .input_output_dialog import InputOutputActionDialog
-            dialog = InputOutputActionDialog(self)
-            if dialog.exec() == QDialog.DialogCode.Accepted:
-                action_data = dialog.get_action_data()
-                if action_data:
-                    action = action_data
-                    
-        elif action_type == "quick_send":
-            # 创建快捷发送动作
-            name, ok = QInputDialog.getText(self, "新建快捷发送", "请输入快捷发送动作名称：")
-            if ok and name.strip():
-                import datetime
-                import uuid
-                import re
-                
-                # 清理用户输入的名称，生成合法的文件名
-                clean_name = name.strip()
-                # 移除非法字符，只保留中文、英文、数字、下划线和短横线
-                safe_filename = re.sub(r'[^\w\u4e00-\u9fff-]', '_', clean_name)
-                # 确保文件名不为空
-                if not safe_filename:
-                    safe_filename = f"quick_send_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                
-                # 检查文件名是否已存在，如果存在则添加序号
-                data_dir = config_manager.config_dir / "quick_send"
-                data_dir.mkdir(exist_ok=True)
-                
-                original_filename = safe_filename
-                counter = 1
-                while (data_dir / f"{safe_filename}.json").exists():
-                    safe_filename = f"{original_filename}_{counter}"
-                    counter += 1
-                
-                file_path = data_dir / f"{safe_filename}.json"
-                
-                try:
-                    import json
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump([], f, indent=2, ensure_ascii=False)
-                    
-                    # 创建动作配置，文件名就是清理后的用户名称
-                    action = config_manager.create_action(
-                        clean_name, 
-                        "quick_send", 
-                        filename=safe_filename,
-                        description=f"快捷发送: {clean_name}"
-                    )
-                    
-                    print(f"已创建快捷发送动作: {clean_name}, 文件: {safe_filename}.json")
-                    
-                except Exception as e:
-                    QMessageBox.warning(self, "错误", f"创建文件失败: {e}")
-                    return
+        """创建新动作（由动作类型处理器询问用户）"""
+        from .action_types import get_handler
+        handler = get_handler(action_type)
+        if handler is None:
+            print(f"❌ 不支持的动作类型: {action_type}")
+            return
+        action = handler.prompt_new(self)
         
         if action:
             # 添加到当前面板
@@ -674,17 +819,43 @@ class ActionPanel(QWidget):
     def handle_delete_action(self, button):
         """处理删除动作"""
         try:
-            index = self.buttons.index(button)
+            self._delete_action_at(self.buttons.index(button))
+        except ValueError:
+            pass
+            
+    def handle_copy_action(self, button):
+        """处理复制动作"""
+        try:
+            self._copy_action_at(self.buttons.index(button))
+        except ValueError:
+            pass
+            
+    def handle_cut_action(self, button):
+        """处理剪切动作"""
+        try:
+            self._cut_action_at(self.buttons.index(button))
+        except ValueError:
+            pass
+            
+    def handle_edit_action(self, button):
+        """处理编辑动作"""
+        try:
+            self._edit_action_at(self.buttons.index(button))
+        except ValueError:
+            pass
+            
+    def _delete_action_at(self, index: int):
+        """删除指定位置的动作"""
+        try:
             del self.action_configs[index]
             self.save_config()  # 标记配置变化
             self.load_actions()
-        except (ValueError, IndexError):
+        except IndexError:
             pass
             
-    def handle_copy_action(self, button):
-        """处理复制动作"""
+    def _copy_action_at(self, index: int):
+        """复制指定位置的动作到全局剪贴板"""
         try:
-            index = self.buttons.index(button)
             action_to_copy = copy.deepcopy(self.action_configs[index])
             
             # 更新全局剪贴板
@@ -694,13 +865,12 @@ class ActionPanel(QWidget):
             
             print(f"[复制] 动作 '{action_to_copy.get('name', '')}' 已复制到剪贴板")
             
-        except (ValueError, IndexError):
+        except IndexError:
             pass
             
-    def handle_cut_action(self, button):
-        """处理剪切动作"""
+    def _cut_action_at(self, index: int):
+        """剪切指定位置的动作到全局剪贴板"""
         try:
-            index = self.buttons.index(button)
             action_to_cut = copy.deepcopy(self.action_configs[index])
             
             # 更新全局剪贴板
@@ -715,13 +885,12 @@ class ActionPanel(QWidget):
             self.save_config()  # 标记配置变化
             self.load_actions()
             
-        except (ValueError, IndexError):
+        except IndexError:
             pass
             
-    def handle_edit_action(self, button):
-        """处理编辑动作"""
+    def _edit_action_at(self, index: int):
+        """编辑指定位置的动作"""
         try:
-            index = self.buttons.index(button)
             action_config = self.action_configs[index]
             
             # 创建编辑对话框
@@ -739,7 +908,7 @@ class ActionPanel(QWidget):
                 
                 print(f"[编辑] 动作 '{updated_config.get('name', '')}' 已更新")
                 
-        except (ValueError, IndexError, Exception) as e:
+        except (IndexError, Exception) as e:
             print(f"[编辑] 编辑动作失败: {e}")
             QMessageBox.warning(self, "错误", f"编辑动作失败: {e}")
             
@@ -791,7 +960,8 @@ class ActionPanel(QWidget):
                     self.action_configs[target_index], self.action_configs[source_index]
                 )
                 
-                self._relayout_buttons()
+                # 只移动交换的两个单元格，并播放位置动画
+                self._relayout_buttons(animate=True)
                 self.save_config()  # 标记配置变化
         except (ValueError, IndexError):
             pass
@@ -799,6 +969,85 @@ class ActionPanel(QWidget):
         # 清理拖拽状态
         self._dragged_button = None
         
+    def _swap_actions(self, source_index: int, target_index: int):
+        """交换两个动作的位置（列表视图模式的拖拽交换）"""
+        if not (0 <= source_index < len(self.action_configs) and
+                0 <= target_index < len(self.action_configs)) or source_index == target_index:
+            return
+        (self.action_configs[source_index], self.action_configs[target_index]) = (
+            self.action_configs[target_index], self.action_configs[source_index]
+        )
+        self.action_model.refresh_row(source_index)
+        self.action_model.refresh_row(target_index)
+        self.action_view.setCurrentIndex(self.action_model.index(target_index))
+        self.save_config()  # 标记配置变化
+        
+    def _on_view_action_triggered(self, index: int):
+        """列表视图中点击或回车执行动作"""
+        if 0 <= index < len(self.action_configs):
+            self._execute_action_config(self.action_configs[index])
+            
+    def _show_view_context_menu(self, index: int, global_pos: QPoint):
+        """列表视图的右键菜单（与动作按钮的右键菜单一致）"""
+        menu = QMenu(self)
+        menu.addAction("编辑", lambda: self._edit_action_at(index))
+        menu.addSeparator()
+        menu.addAction("重命名", lambda: self._rename_action_at(index))
+        menu.addAction("更改图标", lambda: self._change_icon_at(index))
+        menu.addSeparator()
+        menu.addAction("复制", lambda: self._copy_action_at(index))
+        menu.addAction("剪切", lambda: self._cut_action_at(index))
+        menu.addSeparator()
+        menu.addAction("删除", lambda: self._confirm_delete_action_at(index))
+        menu.exec(global_pos)
+        
+    def _rename_action_at(self, index: int):
+        """重命名指定位置的动作（列表视图模式）"""
+        if not (0 <= index < len(self.action_configs)):
+            return
+        action_config = self.action_configs[index]
+        current_name = action_config.get("name", "")
+        new_name, ok = QInputDialog.getText(
+            self, "重命名动作", "请输入新名称:", text=current_name
+        )
+        if ok and new_name.strip() and new_name.strip() != current_name:
+            action_config["name"] = new_name.strip()
+            self.action_model.refresh_row(index)
+            self.handle_rename_action(action_config.get("id", ""))
+            
+    def _change_icon_at(self, index: int):
+        """更改指定位置动作的图标（列表视图模式）"""
+        if not (0 <= index < len(self.action_configs)):
+            return
+        from .icon_manager import icon_manager
+        available_icons = icon_manager.get_available_icons()
+        if not available_icons:
+            QMessageBox.information(self, "提示", "没有可用的图标文件")
+            return
+            
+        from .icon_selector import IconSelector
+        dialog = IconSelector(available_icons, self)
+        if dialog.exec() == IconSelector.DialogCode.Accepted:
+            selected_icon = dialog.get_selected_icon()
+            if selected_icon:
+                action_config = self.action_configs[index]
+                action_config["icon_path"] = selected_icon
+                self.action_model.refresh_row(index)
+                self.handle_icon_change(action_config.get("id", ""))
+                
+    def _confirm_delete_action_at(self, index: int):
+        """确认后删除指定位置的动作（列表视图模式）"""
+        if not (0 <= index < len(self.action_configs)):
+            return
+        reply = QMessageBox.question(
+            self, "确认删除", 
+            f"确定要删除动作 '{self.action_configs[index].get('name', '')}' 吗？",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self._delete_action_at(index)
+            
     def get_grid_index(self, pos: QPoint) -> int:
         """获取网格索引"""
         layout_rect = self.grid_layout.geometry()
@@ -825,15 +1074,13 @@ class ActionPanel(QWidget):
         index = row * columns + col
         return min(index, len(self.buttons))
         
-    def open_sub_panel(self, actions: List[Dict[str, Any]]):
-        """打开子面板（模仿1.94.py方式）"""
+    def open_sub_panel(self, panel_action: Dict[str, Any]):
+        """打开子面板（按面板动作ID缓存复用子面板）"""
         if self.level >= 4:  # 最大5层
             QMessageBox.warning(self, "提示", "已达到最大层级。")
             return
             
-        # 创建子面板
-        sub_panel = ActionPanel(parent=self, actions=actions, level=self.level + 1)
-        self.sub_panels.append(sub_panel)
+        sub_panel = self._get_sub_panel(panel_action)
         
         # 确保子面板被正确跟踪（与1.94.py一致）
         if sub_panel not in ActionPanel._open_panels:
@@ -845,6 +1092,90 @@ class ActionPanel(QWidget):
         sub_panel.show()
         self.hide()
         
+    def _get_sub_panel(self, panel_action: Dict[str, Any]) -> 'ActionPanel':
+        """获取子面板：命中缓存时复用，只有子树发生变化时才刷新"""
+        node_id = self._get_node_id(panel_action)
+        # 保证子面板与配置共享同一个动作列表
+        actions = panel_action.setdefault("actions", [])
+        signature = self._get_subtree_signature(actions)
+        
+        sub_panel = self._sub_panel_cache.get(node_id)
+        if sub_panel is not None:
+            self._sub_panel_cache.move_to_end(node_id)
+            if sub_panel.action_configs is not actions or sub_panel._subtree_signature != signature:
+                sub_panel.action_configs = actions
+                sub_panel.load_actions()
+                print(f"[DEBUG] 子面板内容已变化，刷新缓存: {sub_panel._panel_id}")
+            else:
+                print(f"[DEBUG] 复用缓存的子面板: {sub_panel._panel_id}")
+        else:
+            sub_panel = ActionPanel(parent=self, actions=actions, level=self.level + 1, node_id=node_id)
+            self._sub_panel_cache[node_id] = sub_panel
+            self._evict_sub_panels()
+            
+        sub_panel._subtree_signature = signature
+        return sub_panel
+        
+    def prebuild_sub_panels(self) -> int:
+        """预先构建第一层子面板（受子面板缓存上限约束），返回构建的数量"""
+        max_cached = max(1, config_manager.get("action_panel.sub_panel_cache_size", 8))
+        count = 0
+        for action in self.action_configs:
+            if count >= max_cached:
+                break
+            if action.get("type") == "panel":
+                self._get_sub_panel(action)
+                count += 1
+        return count
+        
+    @staticmethod
+    def _get_node_id(panel_action: Dict[str, Any]) -> str:
+        """获取面板动作的缓存键（没有ID的旧配置按对象区分）"""
+        return panel_action.get("id") or f"__node_{id(panel_action)}"
+        
+    @staticmethod
+    def _get_subtree_signature(actions: List[Dict[str, Any]]) -> str:
+        """计算子树内容签名，用于判断缓存的子面板是否需要刷新"""
+        return json.dumps(actions, ensure_ascii=False, sort_keys=True, default=str)
+        
+    def _evict_sub_panels(self):
+        """按LRU淘汰超出数量上限的子面板（不淘汰正在显示的面板）"""
+        max_cached = max(1, config_manager.get("action_panel.sub_panel_cache_size", 8))
+        for node_id in list(self._sub_panel_cache):
+            if len(self._sub_panel_cache) <= max_cached:
+                break
+            panel = self._sub_panel_cache[node_id]
+            if panel._is_showing_branch():
+                continue
+            del self._sub_panel_cache[node_id]
+            print(f"[DEBUG] 淘汰缓存的子面板: {panel._panel_id}")
+            panel._dispose()
+            
+    def _prune_sub_panel_cache(self):
+        """移除已不存在的面板动作对应的缓存子面板"""
+        if not self._sub_panel_cache:
+            return
+        node_ids = {self._get_node_id(action) for action in self.action_configs if action.get("type") == "panel"}
+        for node_id in list(self._sub_panel_cache):
+            if node_id not in node_ids and not self._sub_panel_cache[node_id]._is_showing_branch():
+                self._sub_panel_cache.pop(node_id)._dispose()
+                
+    def _is_showing_branch(self) -> bool:
+        """本面板或其任意缓存的子面板是否正在显示"""
+        if self.isVisible():
+            return True
+        return any(panel._is_showing_branch() for panel in self._sub_panel_cache.values())
+        
+    def _dispose(self):
+        """销毁面板及其缓存的全部子面板"""
+        for panel in self._sub_panel_cache.values():
+            panel._dispose()
+        self._sub_panel_cache.clear()
+        if self in ActionPanel._open_panels:
+            ActionPanel._open_panels.remove(self)
+        self.hide()
+        self.deleteLater()
+        
     def go_back(self):
         """返回上级面板"""
         self.hide()
@@ -891,6 +1222,9 @@ class ActionPanel(QWidget):
         # 更新配置树
         root_config = self.get_root_config()
         config_manager.update_config(root_config)
+        # 编辑、重命名等就地修改不会改变动作列表对象，需要显式通知搜索索引
+        from .action_search import action_search_index
+        action_search_index.mark_dirty()
         # 只有在强制保存时才立即保存到文件
         if force:
             config_manager.save_config(force=True)
@@ -1025,12 +1359,13 @@ class ActionPanel(QWidget):
     def build_action_tree(self, panel: 'ActionPanel') -> List[Dict[str, Any]]:
         """构建动作树"""
         actions = []
-        for i, action in enumerate(panel.action_configs):
+        for action in panel.action_configs:
             action_copy = action.copy()
             if action.get("type") == "panel":
                 # 如果有对应的子面板实例，使用其动作
-                if i < len(panel.sub_panels):
-                    action_copy["actions"] = self.build_action_tree(panel.sub_panels[i])
+                sub_panel = panel._sub_panel_cache.get(self._get_node_id(action))
+                if sub_panel is not None:
+                    action_copy["actions"] = self.build_action_tree(sub_panel)
                 elif "actions" not in action_copy:
                     action_copy["actions"] = []
             actions.append(action_copy)
@@ -1049,40 +1384,27 @@ class ActionPanel(QWidget):
             print(f"❌ 未找到动作 ID: {action_id}")
             return
             
-        # 执行动作
-        action_type = action.get('type')
-        print(f"[DEBUG] 执行动作 [{action.get('name', '未命名')}] 类型: {action_type}")
+        print(f"[DEBUG] 执行动作 [{action.get('name', '未命名')}] 类型: {action.get('type')}")
         
         try:
-            if action_type == "key":
-                command = action.get("command", "")
-                self.simulate_key(command)
-            elif action_type == "program":
-                command = action.get("command", "")
-                self.run_program(command)
-            elif action_type == "url":
-                url = action.get("url", "")
-                self.open_url(url)
-            elif action_type == "text":
-                text = action.get("text", "")
-                self.send_text(text)
-            elif action_type == "input_output":
-                script_file = action.get("script_file", "")
-                input_source = action.get("input_source", "clipboard")
-                output_target = action.get("output_target", "text")
-                self.execute_input_output(script_file, input_source, output_target)
-            elif action_type == "quick_send":
-                filename = action.get("filename", "")
-                self.open_quick_send_panel(filename)
-            elif action_type == "panel":
-                actions = action.get("actions", [])
-                self.open_sub_panel(actions)
-            else:
-                print(f"❌ 不支持的动作类型: {action_type}")
-                
+            self._execute_action_config(action)
         except Exception as e:
             print(f"❌ 执行动作失败 [{action.get('name', '未命名')}]: {e}")
             
+    def _execute_action_config(self, action: Dict[str, Any]):
+        """根据动作配置执行动作"""
+        # 记录使用统计（文件写入在后台线程批量完成）
+        from .usage_store import usage_store
+        usage_store.record_use(action.get('id', ''))
+        
+        action_type = action.get('type')
+        from .action_types import get_handler
+        handler = get_handler(action_type)
+        if handler is None:
+            print(f"❌ 不支持的动作类型: {action_type}")
+            return
+        handler.execute(self, action)
+            
     def refresh_action_hotkeys(self):
         """刷新动作快捷键注册（从外部调用）"""
         # 这个方法由main.py中的QuickerApp调用
@@ -1092,16 +1414,8 @@ class ActionPanel(QWidget):
     def simulate_key(self, command: str):
         """模拟按键"""
         # 隐藏面板并切换到上一个窗口
-        self.hide()
-        QTimer.singleShot(100, lambda: self._switch_and_simulate_key(command))
+        self._run_in_previous_window("key", lambda: self._execute_simulate_key(command))
         
-    def _switch_and_simulate_key(self, command: str):
-        """切换窗口并模拟按键"""
-        if self._switch_to_previous_window():
-            QTimer.singleShot(200, lambda: self._execute_simulate_key(command))
-        else:
-            self._execute_simulate_key(command)
-            
     def open_quick_send_panel(self, filename: str = ""):
         """打开快捷发送面板
         
@@ -1145,115 +1459,68 @@ class ActionPanel(QWidget):
             QMessageBox.warning(self, "错误", f"打开快捷发送面板失败: {e}")
             
     def _execute_simulate_key(self, command: str):
-        """执行按键模拟"""
+        """执行按键模拟
+        
+        按键序列格式（逗号或换行分隔，引号内的逗号不分割）：
+        组合键 ctrl+c、单个按键 f5、文本串 "hello, world"、延时 wait(1000)
+        相同的序列只编译一次（按命令文本缓存），延时由QTimer完成，不阻塞界面。
+        """
+        from .key_sequence import get_compiled_sequence, KeySequenceRunner, KeySequenceError
         try:
             import pyautogui
-            
-            # 解析输入序列，支持以下格式：
-            # 1. 组合键: ctrl+c, alt+tab
-            # 2. 单个按键: f5, enter, space
-            # 3. 文本串: "hello world"
-            # 4. 延时等待: wait(1000) 表示等待1秒
-            # 5. 序列组合: ctrl+c, wait(500), "pasted text", enter
-            
-            # 分割序列，支持逗号分隔
-            sequence = [item.strip() for item in command.split(',')]
-            
-            for item in sequence:
-                item = item.strip()
-                if not item:
-                    continue
-                
-                # 处理延时等待
-                if item.startswith('wait(') and item.endswith(')'):
-                    try:
-                        delay_ms = int(item[5:-1])  # 提取括号内的数字
-                        pyautogui.sleep(delay_ms / 1000.0)
-                        continue
-                    except ValueError:
-                        print(f"延时格式错误: {item}，应为 wait(毫秒数)")
-                        continue
-                
-                # 处理文本串（用引号包围的内容）
-                if ((item.startswith('"') and item.endswith('"')) or 
-                    (item.startswith("'") and item.endswith("'"))):
-                    text = item[1:-1]  # 去掉引号
-                    pyautogui.write(text)
-                    continue
-                
-                # 处理组合键（包含+号）
-                if '+' in item:
-                    keys = [k.strip() for k in item.split('+')]
-                    pyautogui.hotkey(*keys)
-                else:
-                    # 单个按键
-                    pyautogui.press(item)
+            ops = get_compiled_sequence(command)
         except ImportError:
             QMessageBox.critical(self, "依赖缺失", 
                                "需要安装 'pyautogui' 库来执行此操作。\n请运行: pip install pyautogui")
-        except Exception as e:
-            QMessageBox.warning(self, "错误", f"模拟按键失败：{e}")
+            return
+        except KeySequenceError as e:
+            QMessageBox.warning(self, "错误", f"按键序列格式错误：{e}")
+            return
+            
+        runner = KeySequenceRunner(
+            ops, on_error=lambda e: QMessageBox.warning(self, "错误", f"模拟按键失败：{e}")
+        )
+        runner.start()
         
     def run_program(self, command: str):
         """运行程序"""
         # 隐藏面板并切换到上一个窗口
-        self.hide()
-        QTimer.singleShot(100, lambda: self._switch_and_run_program(command))
+        self._run_in_previous_window("program", lambda: self._execute_run_program(command))
         
-    def _switch_and_run_program(self, command: str):
-        """切换窗口并运行程序"""
-        if self._switch_to_previous_window():
-            QTimer.singleShot(200, lambda: self._execute_run_program(command))
-        else:
-            self._execute_run_program(command)
-            
     def _execute_run_program(self, command: str):
-        """执行运行程序"""
-        try:
-            import subprocess
-            subprocess.Popen(command, shell=True)
-        except Exception as e:
-            QMessageBox.warning(self, "错误", f"无法启动程序：{e}")
+        """执行运行程序（在执行服务的工作线程中启动子进程）"""
+        from .action_executor import action_executor, process_launcher
+        action_executor.submit(
+            "program", process_launcher.launch, command,
+            on_error=lambda error: QMessageBox.warning(self, "错误", f"无法启动程序：{error}")
+        )
         
     def open_url(self, url: str):
         """打开网址"""
         # 隐藏面板并切换到上一个窗口
-        self.hide()
-        QTimer.singleShot(100, lambda: self._switch_and_open_url(url))
+        self._run_in_previous_window("url", lambda: self._execute_open_url(url))
         
-    def _switch_and_open_url(self, url: str):
-        """切换窗口并打开网址"""
-        if self._switch_to_previous_window():
-            QTimer.singleShot(200, lambda: self._execute_open_url(url))
-        else:
-            self._execute_open_url(url)
-            
     def _execute_open_url(self, url: str):
-        """执行打开网址"""
-        try:
-            import webbrowser
-            webbrowser.open(url)
-        except Exception as e:
-            QMessageBox.warning(self, "错误", f"无法打开网址：{e}")
+        """执行打开网址（浏览器启动可能较慢，在执行服务的工作线程中进行）"""
+        import webbrowser
+        from .action_executor import action_executor
+        action_executor.submit(
+            "url", webbrowser.open, url,
+            on_error=lambda error: QMessageBox.warning(self, "错误", f"无法打开网址：{error}")
+        )
         
     def send_text(self, text: str):
         """发送文本"""
         # 隐藏面板并切换到上一个窗口
-        self.hide()
-        QTimer.singleShot(100, lambda: self._switch_and_send_text(text))
+        self._run_in_previous_window("text", lambda: self._execute_send_text(text))
         
-    def _switch_and_send_text(self, text: str):
-        """切换窗口并发送文本"""
-        if self._switch_to_previous_window():
-            QTimer.singleShot(200, lambda: self._execute_send_text(text))
-        else:
-            self._execute_send_text(text)
-            
     def _execute_send_text(self, text: str):
-        """执行发送文本"""
+        """执行发送文本（长文本或非ASCII文本通过剪贴板粘贴）"""
         try:
-            import pyautogui
-            pyautogui.write(text)
+            from .text_injection import text_injector
+            text_injector.inject_async(
+                text, on_error=lambda error: QMessageBox.warning(self, "错误", f"发送文本失败：{error}")
+            )
         except ImportError:
             QMessageBox.critical(self, "依赖缺失", 
                                "需要安装 'pyautogui' 库来执行此操作。\n请运行: pip install pyautogui")
@@ -1263,34 +1530,56 @@ class ActionPanel(QWidget):
     def execute_input_output(self, script_file: str, input_source: str, output_target: str):
         """执行输入输出动作"""
         # 隐藏面板并切换到上一个窗口
-        self.hide()
-        QTimer.singleShot(100, lambda: self._switch_and_execute_input_output(script_file, input_source, output_target))
+        self._run_in_previous_window(
+            "input_output",
+            lambda: self._execute_input_output_action(script_file, input_source, output_target)
+        )
         
-    def _switch_and_execute_input_output(self, script_file: str, input_source: str, output_target: str):
-        """切换窗口并执行输入输出动作"""
-        if self._switch_to_previous_window():
-            QTimer.singleShot(200, lambda: self._execute_input_output_action(script_file, input_source, output_target))
-        else:
-            self._execute_input_output_action(script_file, input_source, output_target)
-            
     def _execute_input_output_action(self, script_file: str, input_source: str, output_target: str):
         """执行输入输出动作的具体实现"""
-        try:
-            # 获取输入文本
-            input_text = self._get_input_text(input_source)
-            
-            # 执行脚本
-            result = self._execute_script(script_file, input_text, input_source, output_target)
+        def run_script(input_text: str):
+            # 在执行服务的工作线程中执行脚本，完成后回到界面线程处理输出
+            self._submit_script(
+                script_file, input_text, input_source, output_target,
+                on_success=lambda result: self._handle_output(result, output_target) if result is not None else None,
+                on_error=lambda error: QMessageBox.warning(self, "错误", f"执行输入输出动作失败：{error}"),
+                stream_output=True
+            )
             
-            # 处理输出
-            if result is not None:
-                self._handle_output(result, output_target)
-                
+        try:
+            # 获取输入文本（剪贴板和对话框需要在界面线程，选中文本需要等待复制完成）
+            self._request_input_text(input_source, run_script)
         except Exception as e:
             QMessageBox.warning(self, "错误", f"执行输入输出动作失败：{e}")
             
-    def _get_input_text(self, input_source: str) -> str:
-        """根据输入源获取输入文本"""
+    def _request_input_text(self, input_source: str, callback):
+        """获取输入文本后调用 callback(文本)
+        
+        选中文本需要发送复制快捷键并等待剪贴板变化，等待期间不阻塞界面，
+        完成后恢复原来的剪贴板内容；其他输入源立即回调。
+        超过 large_input.spill_kb 的文本写入临时文件，callback 收到 FileInput（脚本结束后删除）。
+        """
+        from .large_input import spill_text
+        spill_kb = config_manager.get("large_input.spill_kb", 1024)
+        
+        def deliver(text):
+            # 大段文本写入临时文件，只把路径交给脚本进程
+            callback(spill_text(text, spill_kb))
+            
+        if input_source != "selection":
+            deliver(self._get_input_text(input_source))
+            return
+        from .clipboard_capture import selection_capture
+        try:
+            selection_capture.capture(deliver)
+        except ImportError as e:
+            if "pyautogui" in str(e):
+                QMessageBox.warning(self, "依赖缺失", 
+                                   "需要安装 'pyautogui' 库来支持选中文本功能。\n请运行: pip install pyautogui")
+            callback("")
+            
+    def _get_input_text(self, input_source: str):
+        """根据输入源获取输入文本，文件输入源返回 FileInput（选中文本需要等待复制完成，使用 _request_input_text）"""
         try:
             if input_source == "clipboard":
                 # 从剪贴板获取文本
@@ -1298,78 +1587,229 @@ class ActionPanel(QWidget):
                 clipboard = QApplication.clipboard()
                 return clipboard.text()
                 
-            elif input_source == "selection":
-                # 从选中文本获取（模拟Ctrl+C然后获取剪贴板）
-                import pyautogui
-                pyautogui.hotkey('ctrl', 'c')
-                QTimer.singleShot(100, lambda: None)  # 等待剪贴操作完成
-                from PySide6.QtWidgets import QApplication
-                clipboard = QApplication.clipboard()
-                return clipboard.text()
-                
             elif input_source == "manual":
                 # 手动输入
                 text, ok = QInputDialog.getText(self, "输入文本", "请输入文本内容：")
                 return text if ok else ""
                 
+            elif input_source == "file":
+                # 选择文件，脚本进程直接读取文件，不经过界面
+                from PySide6.QtWidgets import QFileDialog
+                from .large_input import FileInput
+                path, _ = QFileDialog.getOpenFileName(self, "选择输入文件", "", "文本文件 (*.txt *.csv *.log *.json);;所有文件 (*)")
+                return FileInput(path) if path else ""
+                
             elif input_source == "none":
                 # 无输入
                 return ""
             else:
                 return ""
                 
-        except ImportError as e:
-            if "pyautogui" in str(e) and input_source == "selection":
-                QMessageBox.warning(self, "依赖缺失", 
-                                   "需要安装 'pyautogui' 库来支持选中文本功能。\n请运行: pip install pyautogui")
-            return ""
         except Exception as e:
             print(f"获取输入文本失败: {e}")
             return ""
             
-    def _execute_script(self, script_file: str, input_text: str, input_source: str, output_target: str) -> str:
-        """执行脚本文件"""
+    def _submit_script(self, script_file: str, input_text: str, input_source: str, output_target: str,
+                       on_success, on_error, stream_output: bool = False, execute=None):
+        """提交脚本到执行服务
+        
+        启用脚本进程时由进程池负责超时（结束进程），执行超过0.5秒时显示可取消的进度框；
+        否则在本进程的线程中执行，超时只能丢弃结果。
+        stream_output 为 True 时，返回生成器的脚本输出逐块交给 output_target 对应的输出目标，
+        结束后 on_success 收到None。
+        execute 替换默认的 _execute_script（参数相同），如脚本管道。
+        """
+        from .action_executor import action_executor
+        from .script_worker_pool import ScriptJob
+        from .large_input import release_input
+        timeout_ms = config_manager.get("action_executor.script_timeout_ms", 30000)
+        use_workers = config_manager.get("script_workers.enabled", True)
+        job = ScriptJob()
+        progress = self._create_script_progress(script_file, job) if use_workers else None
+        
+        def close_progress(*args):
+            nonlocal progress
+            if progress is not None:
+                progress.canceled.disconnect()
+                progress.close()
+                progress.deleteLater()
+                progress = None
+                
+        channel = None
+        if stream_output:
+            from .output_sinks import ChunkChannel, WindowOutputSink, create_output_sink
+            channel = ChunkChannel(
+                lambda: create_output_sink(output_target, self, job), job,
+                max_pending=config_manager.get("script_workers.stream_max_pending", 8),
+                # 实时输出窗口自带取消按钮，不再需要进度框
+                on_open=lambda sink: close_progress() if isinstance(sink, WindowOutputSink) else None
+            )
+            
+        def run_script(*args):
+            # 在执行线程中真正结束后才删除溢出的临时文件：本进程执行超时时
+            # finish 会先被调用，而线程可能还在读取输入
+            try:
+                return (execute or self._execute_script)(*args)
+            finally:
+                release_input(input_text)
+                
+        def finish(callback, value, error=None):
+            close_progress()
+            if channel is not None and channel.opened:
+                if error is None:
+                    channel.close()
+                    print(f"[脚本] 流式输出完成: {script_file}，共 {channel.chunk_count} 块")
+                else:
+                    channel.abort("已取消" if job.cancelled else error)
+            if job.cancelled:
+                print(f"[脚本] 已取消: {script_file}")
+                return
+            callback(value)
+            
+        action_executor.submit(
+            "input_output", run_script, script_file, input_text, input_source, output_target, job,
+            channel.put if channel is not None else None,
+            timeout_ms=None if use_workers else timeout_ms,
+            on_success=lambda result: finish(on_success, result),
+            on_error=lambda error: finish(on_error, error, error)
+        )
+        
+    def _create_script_progress(self, script_file: str, job):
+        """创建脚本执行进度框（执行超过0.5秒才显示，点击取消会结束脚本进程）"""
+        from PySide6.QtWidgets import QProgressDialog
+        if isinstance(script_file, list):
+            script_file = " → ".join(script_file)
+        progress = QProgressDialog(f"正在执行脚本 {script_file}…", "取消", 0, 0)
+        progress.setWindowTitle("输入输出动作")
+        progress.setMinimumDuration(500)
+        progress.setWindowModality(Qt.WindowModality.NonModal)
+        progress.canceled.connect(job.cancel)
+        progress.setValue(0)  # 开始计时，超过最短时间后显示
+        return progress
+        
+    def _execute_script(self, script_file: str, input_text: str, input_source: str, output_target: str,
+                        job=None, on_chunk=None) -> Optional[str]:
+        """执行脚本文件
+        
+        默认在常驻的脚本进程中执行（可超时结束、取消），script_workers.enabled 为 false 时
+        在本进程中执行；两种方式下脚本都只在首次运行和文件变化后重新编译加载。
+        process 返回生成器或迭代器时为流式输出：各块交给 on_chunk 并返回None，
+        没有 on_chunk 时拼接为完整文本返回。
+        顶层声明 PURE = True 的脚本，相同输入直接返回缓存的结果（此时不流式输出）。
+        每次执行的耗时、CPU时间、输入输出大小和异常记录到脚本运行统计。
+        """
+        start_time = time.perf_counter()
+        meta = {"cached": False, "output_size": 0}
+        result = None
+        error = ""
+        
+        if on_chunk is not None:
+            stream_chunk = on_chunk
+            
+            def count_chunk(chunk: str):
+                meta["output_size"] += len(chunk)
+                stream_chunk(chunk)
+                
+            on_chunk = count_chunk
+            
         try:
             script_path = config_manager.get_input_output_script_path(script_file)
-            if not script_path.exists():
-                raise FileNotFoundError(f"脚本文件不存在: {script_path}")
+            cache_key = None
+            if config_manager.get("script_cache.enabled", True):
+                from .script_result_cache import script_result_cache
+                cache_key = script_result_cache.make_key(script_path, input_text, input_source, output_target)
+            if cache_key is None:
+                result = self._run_script_file(script_path, input_text, input_source, output_target, job, on_chunk, meta)
+                return result
                 
-            # 读取脚本内容
-            with open(script_path, 'r', encoding='utf-8') as f:
-                script_content = f.read()
+            result = script_result_cache.get(cache_key)
+            if result is not None:
+                meta["cached"] = True
+                stats = script_result_cache.get_stats()
+                print(f"[性能] 脚本结果缓存命中: {script_file}，命中率 {stats['hit_ratio']:.0%}")
+                return result
                 
-            # 执行脚本
-            namespace = {
-                'input_text': input_text,
-                'input_source': input_source,
-                'output_target': output_target
-            }
+            chunks = []
             
-            exec(script_content, namespace)
-            
-            # 调用process函数
-            if 'process' in namespace and callable(namespace['process']):
-                result = namespace['process'](input_text, input_source, output_target)
-                return str(result) if result is not None else ""
-            else:
-                raise ValueError("脚本中未找到process函数")
+            def collect_chunk(chunk: str):
+                chunks.append(chunk)
+                on_chunk(chunk)
+                
+            result = self._run_script_file(script_path, input_text, input_source, output_target, job,
+                                           collect_chunk if on_chunk is not None else None, meta)
+            script_result_cache.put(cache_key, "".join(chunks) if result is None else result)
+            return result
                 
         except Exception as e:
+            error = str(e)
             print(f"执行脚本失败: {e}")
             raise
+        finally:
+            self._record_script_run(script_file, start_time, input_text, result, error, meta)
+            
+    def _run_script_file(self, script_path, input_text: str, input_source: str, output_target: str,
+                         job=None, on_chunk=None, meta: Optional[dict] = None) -> Optional[str]:
+        """在脚本进程或本进程中执行脚本的 process 函数（meta 中填入CPU时间和性能分析结果）"""
+        if meta is None:
+            meta = {}
+        profile = script_path.name in config_manager.get("script_stats.profile_scripts", [])
+        if config_manager.get("script_workers.enabled", True):
+            from .script_worker_pool import get_script_worker_pool
+            return get_script_worker_pool().run(
+                script_path, input_text, input_source, output_target,
+                timeout_ms=config_manager.get("action_executor.script_timeout_ms", 30000),
+                job=job, on_chunk=on_chunk, profile=profile, meta=meta
+            )
+            
+        from .script_loader import script_loader, iter_output_chunks, ScriptProfiler
+        from .large_input import prepare_input, close_input
+        script = script_loader.get_script(script_path)
+        input_text = prepare_input(input_text, script.large_input)
+        
+        try:
+            with ScriptProfiler(profile) as profiler:
+                # 调用process函数
+                result = script.process(input_text, input_source, output_target)
+                chunks = iter_output_chunks(result)
+                if chunks is None:
+                    result = str(result) if result is not None else ""
+                elif on_chunk is None:
+                    result = "".join(chunks)
+                else:
+                    for chunk in chunks:
+                        on_chunk(chunk)
+                    result = None
+        finally:
+            close_input(input_text)
+        meta["cpu_ms"] = profiler.cpu_ms
+        meta["profile"] = profiler.profile_text
+        return result
+        
+    def _record_script_run(self, script_file: str, start_time: float, input_text: str, result: Optional[str],
+                           error: str, meta: dict):
+        """记录一次脚本执行到运行统计"""
+        from .script_stats import script_stats, ScriptRun
+        from .large_input import input_size
+        wall_ms = (time.perf_counter() - start_time) * 1000
+        output_size = len(result) if result is not None else meta["output_size"]
+        script_stats.record(ScriptRun(
+            script_file, time.time(), wall_ms, meta.get("cpu_ms"), input_size(input_text), output_size,
+            error=error, cached=meta["cached"]
+        ))
+        if meta.get("profile"):
+            script_stats.record_profile(script_file, meta["profile"])
             
     def _handle_output(self, result: str, output_target: str):
         """处理输出结果"""
         try:
             if output_target == "text":
-                # 发送文本
-                import pyautogui
-                pyautogui.write(result)
+                # 发送文本（长文本或非ASCII文本通过剪贴板粘贴）
+                from .text_injection import text_injector
+                text_injector.inject_async(result, on_error=lambda error: print(f"处理输出失败: {error}"))
                 
             elif output_target == "url":
                 # 打开网址
-                import webbrowser
-                webbrowser.open(result)
+                self._execute_open_url(result)
                 
             elif output_target == "clipboard":
                 # 复制到剪贴板
@@ -1378,13 +1818,9 @@ class ActionPanel(QWidget):
                 clipboard.setText(result)
                 
             elif output_target == "file":
-                # 保存到文件
-                import datetime
-                timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f"output_{timestamp}.txt"
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(result)
-                print(f"结果已保存到: {filename}")
+                # 保存到文件（后台线程写入，文件名不重复）
+                from .file_output import file_output_writer
+                file_output_writer.save(result)
                 
             elif output_target == "window":
                 # 显示窗口
@@ -1398,36 +1834,24 @@ class ActionPanel(QWidget):
         except Exception as e:
             print(f"处理输出失败: {e}")
             
-    def _switch_to_previous_window(self) -> bool:
-        """切换到上一个活动窗口"""
-        # 获取浮动按钮的上一个活动窗口
+    def _run_in_previous_window(self, action_type: str, callback):
+        """隐藏面板，确认上一个活动窗口回到前台（或超时）后执行回调"""
+        from .focus_restore import focus_restorer
+        self.hide()
         floating_button = self._get_floating_button()
-        if not floating_button:
-            return False
-            
-        last_window = getattr(floating_button, 'last_foreground_window', None)
-        if not last_window:
-            return False
-            
-        # Windows平台特定代码
-        import sys
-        if sys.platform == "win32":
-            try:
-                import win32gui
-                import win32con
-                
-                # 检查窗口句柄是否仍然有效
-                if win32gui.IsWindow(last_window):
-                    # 如果被最小化则恢复
-                    if win32gui.IsIconic(last_window):
-                        win32gui.ShowWindow(last_window, win32con.SW_RESTORE)
-                    # 设置为前台窗口
-                    win32gui.SetForegroundWindow(last_window)
-                    return True
-            except Exception as e:
-                print(f"切换窗口失败: {e}")
-                
-        return False
+        last_window = getattr(floating_button, 'last_foreground_window', None) if floating_button else None
+        focus_restorer.restore(last_window, callback, action_type)
+        
+    def keyPressEvent(self, event):
+        """在主面板中直接输入文字时打开命令面板"""
+        text = event.text()
+        modifiers = event.modifiers() & (Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.AltModifier)
+        if self.level == 0 and text and text.isprintable() and not text.isspace() and not modifiers:
+            floating_button = self._get_floating_button()
+            if floating_button is not None:
+                floating_button.show_command_palette(text)
+                return
+        super().keyPressEvent(event)
         
     def _get_floating_button(self):
         """获取浮动按钮实例"""
@@ -1437,4 +1861,63 @@ class ActionPanel(QWidget):
             if hasattr(parent, '__class__') and parent.__class__.__name__ == 'FloatingButton':
                 return parent
             parent = parent.parent()
-        return None
\ No newline at end of file
+        return None
+
+
+def benchmark(count: int = 200, runs: int = 20):
+    """比较按钮池复用与每次重建全部按钮时 load_actions 的耗时（修改一个动作后刷新）
+    
+    用法：python -m src.action_panel [按钮数] [次数]（无显示器时加环境变量 QT_QPA_PLATFORM=offscreen）
+    """
+    import contextlib
+    import io
+    import sys
+    from PySide6.QtCore import QEventLoop
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv)
+    if sys.version_info < (3, 12):
+        # 部分 PySide6 版本按 None 永生（Python 3.12+）构建，在旧解释器上每次无返回值的调用都会少计一次 None 的引用，
+        # 重建模式的大量调用会触发 "none_dealloc" 崩溃；基准前先补足引用计数
+        import ctypes
+        for singleton in (None, True, False):
+            ctypes.c_ssize_t.from_address(id(singleton)).value += 1 << 30
+    # 只修改内存中的配置，不保存：按钮池只用于网格视图
+    config_manager._config.setdefault("action_panel", {})["view_mode"] = "grid"
+    actions = [{"id": f"bench-{index}", "type": "command", "name": f"动作{index}", "command": "echo"}
+               for index in range(count)]
+    panel = ActionPanel(actions=actions)
+    
+    def measure(rebuild: bool) -> List[float]:
+        times = []
+        for run in range(runs):
+            actions[run % count]["name"] = f"动作{run}-{rebuild}"
+            if rebuild:
+                # 模拟没有按钮池时的刷新：先销毁全部按钮
+                for button in panel._button_pool.values():
+                    panel.grid_layout.removeWidget(button)
+                    panel._grid_positions.pop(button, None)
+                    button.deleteLater()
+                panel._button_pool = {}
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                panel.load_actions()
+                app.processEvents()
+            times.append((time.perf_counter() - start) * 1000)
+            # deleteLater 只在事件循环中处理（processEvents 和无参数的 sendPostedEvents 都不会执行）
+            loop = QEventLoop()
+            QTimer.singleShot(0, loop.quit)
+            loop.exec()
+        return sorted(times)
+        
+    with contextlib.redirect_stdout(io.StringIO()):
+        panel.load_actions()
+    pooled = measure(rebuild=False)
+    rebuilt = measure(rebuild=True)
+    print(f"{count} 个按钮，修改一个动作后刷新 {runs} 次")
+    print(f"重建全部按钮: 中位数 {rebuilt[runs // 2]:.1f} ms，最小 {rebuilt[0]:.1f} ms")
+    print(f"按钮池复用:   中位数 {pooled[runs // 2]:.1f} ms，最小 {pooled[0]:.1f} ms")
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,332 @@
+# 动作搜索索引模块（命令面板使用，不依赖Qt）
+from typing import Dict, Any, List, Optional, Tuple
+from bisect import bisect_left, bisect_right
+import heapq
+import time
+from .usage_store import usage_store
+
+# GB2312一级汉字拼音首字母分界（按GBK编码排序），pypinyin不可用时的回退方案
+_GBK_INITIAL_BOUNDARIES = [
+    45217, 45253, 45761, 46318, 46826, 47010, 47297, 47614, 48119, 49062,
+    49324, 49896, 50371, 50614, 50622, 50906, 51387, 51446, 52218, 52698,
+    52980, 53689, 54481
+]
+_GBK_INITIAL_LETTERS = "abcdefghjklmnopqrstwxyz"
+_GBK_INITIAL_END = 55290
+
+_KEY_SEPARATOR = "\x00"  # 分隔同一动作的各个搜索字段
+_ENTRY_SEPARATOR = "\x01"  # 分隔不同动作，查询串中不会出现
+
+_pypinyin_checked = False
+_lazy_pinyin = None
+
+
+def _get_lazy_pinyin():
+    """延迟导入pypinyin（可选依赖）"""
+    global _pypinyin_checked, _lazy_pinyin
+    if not _pypinyin_checked:
+        _pypinyin_checked = True
+        try:
+            from pypinyin import lazy_pinyin
+            _lazy_pinyin = lazy_pinyin
+        except ImportError:
+            _lazy_pinyin = None
+    return _lazy_pinyin
+
+
+def _gbk_initial(char: str) -> str:
+    """根据GBK编码区间取汉字拼音首字母，无法识别时返回空串"""
+    try:
+        encoded = char.encode("gbk")
+    except UnicodeEncodeError:
+        return ""
+    if len(encoded) != 2:
+        return ""
+    code = encoded[0] * 256 + encoded[1]
+    if code < _GBK_INITIAL_BOUNDARIES[0] or code >= _GBK_INITIAL_END:
+        return ""
+    return _GBK_INITIAL_LETTERS[bisect_right(_GBK_INITIAL_BOUNDARIES, code) - 1]
+
+
+def get_pinyin_keys(text: str) -> Tuple[str, str]:
+    """获取文本的拼音首字母和全拼（小写）；不含汉字时返回空串"""
+    if not any("一" <= char <= "鿿" for char in text):
+        return "", ""
+        
+    lazy_pinyin = _get_lazy_pinyin()
+    if lazy_pinyin is not None:
+        syllables = [s.lower() for s in lazy_pinyin(text) if s.strip()]
+        initials = "".join(s[0] for s in syllables if s)
+        return initials, "".join(syllables)
+        
+    # 回退：只能得到首字母，非汉字字符原样保留
+    initials = []
+    for char in text.lower():
+        if "一" <= char <= "鿿":
+            initials.append(_gbk_initial(char))
+        elif char.isalnum():
+            initials.append(char)
+    return "".join(initials), ""
+
+
+class SearchEntry:
+    """索引中的一个动作"""
+    
+    __slots__ = ("action_id", "action", "path", "signature", "name", "pinyin_initials",
+                 "pinyin_full", "haystack", "prefix_words")
+                 
+    def __init__(self, action_id: str, action: Dict[str, Any], path: str, signature: tuple):
+        self.action_id = action_id
+        self.action = action
+        self.path = path
+        self.signature = signature
+        
+        name = str(action.get("name", "")).lower()
+        self.name = name
+        self.pinyin_initials, self.pinyin_full = get_pinyin_keys(name)
+        
+        keys = [name, self.pinyin_initials, self.pinyin_full,
+                str(action.get("type", "")).lower(),
+                str(action.get("url", "")).lower(),
+                str(action.get("command", "")).lower()]
+        # 分隔符保证查询串不会跨字段匹配
+        self.haystack = _KEY_SEPARATOR.join(keys).replace(_ENTRY_SEPARATOR, " ")
+        
+        # 参与前缀匹配的词：名称本身、名称中的每个词、拼音首字母、全拼
+        words = set(name.split())
+        words.update(key for key in (name, self.pinyin_initials, self.pinyin_full) if key)
+        self.prefix_words = sorted(words)
+
+
+class ActionSearchIndex:
+    """动作树的搜索索引
+    
+    名称、拼音的前缀匹配通过排序词表二分查找；其余子串匹配在所有动作
+    搜索字段拼接成的字符串上用 str.find 在C层扫描，再用偏移表定位到动作。
+    索引按动作签名增量更新，只有变化的动作才重新计算拼音。
+    """
+    
+    def __init__(self):
+        self._entries: Dict[str, SearchEntry] = {}
+        self._source_actions: Optional[List[Dict[str, Any]]] = None
+        self._dirty = True
+        
+        # 拼接后的搜索文本及每个动作在其中的起始偏移
+        self._blob = ""
+        self._blob_offsets: List[int] = []
+        self._blob_entries: List[SearchEntry] = []
+        # 排序后的词前缀表（名称的每个词、拼音首字母、全拼），用二分查找前缀匹配
+        self._prefix_keys: List[str] = []
+        self._prefix_entries: List[SearchEntry] = []
+        
+        # 增量输入时的缩小范围缓存：上一次查询串及其全部匹配项（未截断时才可复用）
+        self._last_query = ""
+        self._last_matches: Optional[List[SearchEntry]] = None
+        
+        # 每类匹配最多收集的候选数，保证大索引下查询耗时有上界
+        self.max_candidates = 500
+        
+        self.last_search_ms = 0.0
+        
+    def mark_dirty(self):
+        """标记动作树已变化，下次查询前重新同步"""
+        self._dirty = True
+        
+    def ensure_synced(self, actions: List[Dict[str, Any]]) -> bool:
+        """动作列表对象变化或被标记时才同步，返回是否执行了同步"""
+        if not self._dirty and actions is self._source_actions:
+            return False
+        self.sync(actions)
+        return True
+        
+    def sync(self, actions: List[Dict[str, Any]]) -> Tuple[int, int, int]:
+        """与动作树同步，返回（新增/变化，未变，删除）数量"""
+        start_time = time.perf_counter()
+        old_entries = self._entries
+        new_entries: Dict[str, SearchEntry] = {}
+        added_entries: List[SearchEntry] = []
+        reused = 0
+        
+        stack = [(actions, "", "")]
+        while stack:
+            action_list, path, key_prefix = stack.pop()
+            for index, action in enumerate(action_list):
+                action_id = action.get("id") or f"{key_prefix}__index_{index}"
+                if action.get("type") == "panel":
+                    # 文件夹本身不作为结果，只展开其子动作
+                    name = action.get("name", "")
+                    stack.append((action.get("actions", []),
+                                  f"{path} / {name}" if path else name,
+                                  action_id))
+                    continue
+                    
+                signature = (action.get("name", ""), action.get("type", ""),
+                             action.get("url", ""), action.get("command", ""), path)
+                entry = old_entries.get(action_id)
+                if entry is not None and entry.signature == signature:
+                    entry.action = action
+                    reused += 1
+                else:
+                    entry = SearchEntry(action_id, action, path, signature)
+                    added_entries.append(entry)
+                new_entries[action_id] = entry
+                
+        removed_entries = [entry for action_id, entry in old_entries.items()
+                           if new_entries.get(action_id) is not entry]
+        changed = len(added_entries)
+        removed = len(old_entries.keys() - new_entries.keys())
+        
+        self._entries = new_entries
+        self._source_actions = actions
+        self._dirty = False
+        if added_entries or removed_entries:
+            self._rebuild_blob()
+            if len(added_entries) + len(removed_entries) > self.max_candidates:
+                self._rebuild_prefix_table()
+            else:
+                self._update_prefix_table(added_entries, removed_entries)
+        self._last_query = ""
+        self._last_matches = None
+        
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        print(f"[DEBUG] 搜索索引同步: 更新 {changed}，未变 {reused}，删除 {removed}，耗时 {elapsed_ms:.1f} ms")
+        return changed, reused, removed
+        
+    def _rebuild_blob(self):
+        """重建拼接文本和偏移表（只做字符串拼接，不重新计算拼音）"""
+        entries = list(self._entries.values())
+        offsets = []
+        position = 0
+        for entry in entries:
+            offsets.append(position)
+            position += len(entry.haystack) + 1
+            
+        self._blob = _ENTRY_SEPARATOR.join(entry.haystack for entry in entries)
+        self._blob_offsets = offsets
+        self._blob_entries = entries
+        
+    def _rebuild_prefix_table(self):
+        """整体重建排序词前缀表"""
+        prefix_pairs = [(word, entry) for entry in self._entries.values() for word in entry.prefix_words]
+        prefix_pairs.sort(key=lambda pair: pair[0])
+        self._prefix_keys = [pair[0] for pair in prefix_pairs]
+        self._prefix_entries = [pair[1] for pair in prefix_pairs]
+        
+    def _update_prefix_table(self, added_entries: List[SearchEntry], removed_entries: List[SearchEntry]):
+        """少量动作变化时就地更新排序词前缀表"""
+        keys = self._prefix_keys
+        prefix_entries = self._prefix_entries
+        for entry in removed_entries:
+            for word in entry.prefix_words:
+                position = bisect_left(keys, word)
+                while position < len(keys) and keys[position] == word:
+                    if prefix_entries[position] is entry:
+                        del keys[position]
+                        del prefix_entries[position]
+                        break
+                    position += 1
+        for entry in added_entries:
+            for word in entry.prefix_words:
+                position = bisect_right(keys, word)
+                keys.insert(position, word)
+                prefix_entries.insert(position, entry)
+                
+    def __len__(self) -> int:
+        return len(self._entries)
+        
+    def get_action(self, action_id: str) -> Optional[Dict[str, Any]]:
+        """按ID获取动作配置"""
+        entry = self._entries.get(action_id)
+        return entry.action if entry else None
+        
+    def get_path(self, action_id: str) -> str:
+        """获取动作所在的文件夹路径"""
+        entry = self._entries.get(action_id)
+        return entry.path if entry else ""
+        
+    def _find_prefix_matches(self, query: str) -> List[SearchEntry]:
+        """二分查找词前缀匹配（名称的词、拼音首字母、全拼）"""
+        keys = self._prefix_keys
+        start = bisect_left(keys, query)
+        end = min(bisect_left(keys, query + "\uffff", start), start + self.max_candidates)
+        return self._prefix_entries[start:end]
+        
+    def _find_substring_matches(self, query: str) -> Tuple[List[SearchEntry], bool]:
+        """扫描拼接文本查找子串匹配，返回（匹配项，是否因数量上限被截断）"""
+        # 输入是上一次查询的延续时，只需在上一次的完整结果中过滤
+        if self._last_matches is not None and self._last_query and query.startswith(self._last_query):
+            return [entry for entry in self._last_matches if query in entry.haystack], False
+            
+        blob = self._blob
+        offsets = self._blob_offsets
+        entries = self._blob_entries
+        matches = []
+        position = blob.find(query)
+        while position >= 0:
+            if len(matches) >= self.max_candidates:
+                return matches, True
+            slot = bisect_right(offsets, position) - 1
+            matches.append(entries[slot])
+            # 跳到下一个动作，避免同一动作重复命中
+            next_start = offsets[slot + 1] if slot + 1 < len(offsets) else len(blob)
+            position = blob.find(query, next_start)
+        return matches, False
+        
+    def _score(self, entry: SearchEntry, query: str, now: float) -> float:
+        """计算匹配质量得分（名称 > 拼音 > 其他字段），叠加最近使用加成"""
+        name = entry.name
+        if name == query:
+            score = 100.0
+        elif name.startswith(query):
+            score = 80.0
+        elif entry.pinyin_initials.startswith(query) or entry.pinyin_full.startswith(query):
+            score = 70.0
+        elif (" " + query) in name:
+            score = 65.0
+        elif query in name:
+            score = 60.0
+        elif query in entry.pinyin_initials or query in entry.pinyin_full:
+            score = 50.0
+        else:
+            score = 30.0
+            
+        frecency = usage_store.get_frecency(entry.action_id, now)
+        if frecency > 0:
+            # 频近度加成，上限40分
+            score += 40.0 * frecency / (frecency + 1.0)
+        # 同分时名称越短越靠前
+        return score - len(name) * 0.01
+        
+    def search(self, query: str, limit: int = 50) -> List[SearchEntry]:
+        """搜索动作，返回按得分排序的前 limit 个结果"""
+        start_time = time.perf_counter()
+        query = query.strip().lower().replace(_ENTRY_SEPARATOR, "").replace(_KEY_SEPARATOR, "")
+        if not query:
+            # 空查询时按频近度排序
+            results = [self._entries[action_id] for action_id in usage_store.get_top_ids(limit * 2)
+                       if action_id in self._entries][:limit]
+            self.last_search_ms = (time.perf_counter() - start_time) * 1000
+            return results
+            
+        substring_matches, truncated = self._find_substring_matches(query)
+        self._last_query = query
+        self._last_matches = None if truncated else substring_matches
+        
+        # 合并候选：前缀匹配、子串匹配、以及包含查询串的常用动作
+        candidates = {id(entry): entry for entry in self._find_prefix_matches(query)}
+        for entry in substring_matches:
+            candidates[id(entry)] = entry
+        for action_id in usage_store.get_top_ids(self.max_candidates):
+            entry = self._entries.get(action_id)
+            if entry is not None and query in entry.haystack:
+                candidates[id(entry)] = entry
+        matches = candidates.values()
+        
+        now = time.time()
+        results = heapq.nlargest(limit, matches, key=lambda entry: self._score(entry, query, now))
+        self.last_search_ms = (time.perf_counter() - start_time) * 1000
+        return results
+
+
+# 全局搜索索引实例
+action_search_index = ActionSearchIndex()
@@ -0,0 +1,74 @@
+# 动作类型注册表：每种动作类型对应一个处理器模块，首次用到时才导入
+from typing import Dict, List, Optional
+import importlib
+from .base import ActionTypeHandler, TypeEditor
+
+# 动作类型 -> 处理器模块（以“.”开头表示本包内的模块），顺序即“添加动作”菜单中的顺序
+_handler_modules: Dict[str, str] = {
+    "key": ".key",
+    "program": ".program",
+    "url": ".url",
+    "text": ".text",
+    "input_output": ".input_output",
+    "quick_send": ".quick_send",
+    "sequence": ".sequence",
+    "pipeline": ".pipeline",
+    "panel": ".panel",
+}
+
+# 已导入的处理器实例
+_handlers: Dict[str, ActionTypeHandler] = {}
+
+# 不在注册表中的类型使用的图标
+DEFAULT_ICON = "🔘"
+
+# 没有处理器、只用于显示的类型（旧配置中的 command/clipboard 和占位按钮）的图标
+_FALLBACK_ICONS: Dict[str, str] = {
+    "command": "⚡",
+    "clipboard": "📋",
+    "placeholder": "🔄",
+}
+
+
+def register_action_type(action_type: str, module_path: str):
+    """注册动作类型（模块中需定义 HANDLER_CLASS），已导入的同名处理器会被替换"""
+    _handler_modules[action_type] = module_path
+    _handlers.pop(action_type, None)
+
+
+def get_action_types() -> List[str]:
+    """获取已注册的动作类型（不导入处理器模块）"""
+    return list(_handler_modules)
+
+
+def get_handler(action_type: str) -> Optional[ActionTypeHandler]:
+    """获取动作类型的处理器，首次调用时导入对应模块；未注册的类型返回None"""
+    handler = _handlers.get(action_type)
+    if handler is not None:
+        return handler
+        
+    module_path = _handler_modules.get(action_type)
+    if module_path is None:
+        return None
+    try:
+        module = importlib.import_module(module_path, __name__)
+        handler = module.HANDLER_CLASS()
+    except Exception as e:
+        print(f"❌ 加载动作类型 [{action_type}] 失败: {e}")
+        return None
+    _handlers[action_type] = handler
+    return handler
+
+
+def get_type_icon(action_type: str) -> str:
+    """获取动作类型的文本图标"""
+    handler = get_handler(action_type)
+    if handler is not None:
+        return handler.icon
+    return _FALLBACK_ICONS.get(action_type, DEFAULT_ICON)
+
+
+def get_type_name(action_type: str) -> str:
+    """获取动作类型的显示名称"""
+    handler = get_handler(action_type)
+    return handler.display_name if handler is not None else "未知类型"
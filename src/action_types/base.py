@@ -0,0 +1,66 @@
+# 动作类型处理器基类
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QVBoxLayout, QWidget
+    from ..action_panel import ActionPanel
+
+# 编辑对话框中类型配置区域的通用样式
+LABEL_STYLE = "font-size: 12px; color: #555; margin-bottom: 5px;"
+INPUT_STYLE = """
+    QLineEdit, QTextEdit, QComboBox {
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        padding: 8px;
+        font-size: 12px;
+        background-color: white;
+    }
+    QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
+        border-color: #007bff;
+    }
+"""
+
+
+class TypeEditor:
+    """编辑对话框中某种动作类型的配置区域"""
+    
+    def load(self, action: Dict[str, Any]):
+        """把动作配置加载到控件"""
+        
+    def save(self, action: Dict[str, Any]) -> Optional[str]:
+        """把控件内容写回动作配置，出错时返回错误信息"""
+        return None
+
+
+class ActionTypeHandler:
+    """动作类型处理器
+    
+    每种动作类型一个子类，放在 action_types 包中的独立模块里，并在模块中用
+    HANDLER_CLASS 指明处理器类。模块只在首次用到该类型时导入，
+    pyautogui、webbrowser 等较重的依赖应在方法内部导入。
+    """
+    
+    type_name = ""  # 配置中的 type 字段
+    display_name = "未知类型"  # 编辑对话框中显示的类型名称
+    icon = "🔘"  # 按钮和列表中的文本图标
+    menu_label: Optional[str] = None  # “添加动作”菜单中的文字，None表示不在菜单中显示
+    
+    def create_config(self, **kwargs) -> Dict[str, Any]:
+        """返回新动作的类型特定字段（由 ConfigManager.create_action 合并到通用字段中）"""
+        return {}
+        
+    def prompt_new(self, panel: "ActionPanel") -> Optional[Dict[str, Any]]:
+        """从“添加动作”菜单新建时询问用户，返回新动作配置，取消时返回None"""
+        return None
+        
+    def validate(self, action: Dict[str, Any]) -> Optional[str]:
+        """检查动作配置，合法时返回None，否则返回错误信息"""
+        return None
+        
+    def execute(self, panel: "ActionPanel", action: Dict[str, Any]):
+        """在面板上执行动作"""
+        raise NotImplementedError
+        
+    def create_editor(self, parent: "QWidget", layout: "QVBoxLayout") -> Optional[TypeEditor]:
+        """在编辑对话框的类型配置区域中创建控件，返回None表示该类型没有可编辑的字段"""
+        return None
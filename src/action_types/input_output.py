@@ -0,0 +1,206 @@
+# 输入输出动作
+from typing import Any, Dict, Optional
+from .base import ActionTypeHandler, TypeEditor, LABEL_STYLE, INPUT_STYLE
+
+INPUT_SOURCES = [
+    ("剪贴板内容", "clipboard"),
+    ("鼠标选中文本", "selection"),
+    ("手动输入", "manual"),
+    ("文件", "file"),
+    ("无输入", "none")
+]
+
+OUTPUT_TARGETS = [
+    ("发送文本", "text"),
+    ("打开网址", "url"),
+    ("复制到剪贴板", "clipboard"),
+    ("保存到文件", "file"),
+    ("显示窗口", "window")
+]
+
+
+class InputOutputEditor(TypeEditor):
+    """输入源、输出目标和脚本文件编辑区域"""
+    
+    def __init__(self, parent, layout):
+        from PySide6.QtWidgets import QComboBox, QHBoxLayout, QLabel, QLineEdit, QPushButton
+        self.parent = parent
+        
+        # 输入源
+        input_label = QLabel("输入源:")
+        input_label.setStyleSheet(LABEL_STYLE)
+        layout.addWidget(input_label)
+        
+        self.input_source_combo = QComboBox(parent)
+        self.input_source_combo.setStyleSheet(INPUT_STYLE)
+        for text, value in INPUT_SOURCES:
+            self.input_source_combo.addItem(text, value)
+        layout.addWidget(self.input_source_combo)
+        
+        # 输出目标
+        output_label = QLabel("输出目标:")
+        output_label.setStyleSheet(LABEL_STYLE)
+        layout.addWidget(output_label)
+        
+        self.output_target_combo = QComboBox(parent)
+        self.output_target_combo.setStyleSheet(INPUT_STYLE)
+        for text, value in OUTPUT_TARGETS:
+            self.output_target_combo.addItem(text, value)
+        layout.addWidget(self.output_target_combo)
+        
+        # 脚本文件路径（只读显示）
+        script_label = QLabel("脚本文件:")
+        script_label.setStyleSheet(LABEL_STYLE)
+        layout.addWidget(script_label)
+        
+        script_file_layout = QHBoxLayout()
+        
+        self.script_input = QLineEdit(parent)
+        self.script_input.setStyleSheet(INPUT_STYLE + "QLineEdit { background-color: #f8f9fa; }")
+        self.script_input.setReadOnly(True)
+        self.script_input.setPlaceholderText("脚本文件路径 (只读)")
+        script_file_layout.addWidget(self.script_input)
+        
+        # 添加编辑脚本按钮
+        edit_script_button = QPushButton("编辑脚本", parent)
+        edit_script_button.setFixedSize(80, 32)
+        edit_script_button.setStyleSheet("""
+            QPushButton {
+                background-color: #28a745;
+                color: white;
+                border: none;
+                border-radius: 4px;
+                font-size: 12px;
+            }
+            QPushButton:hover {
+                background-color: #218838;
+            }
+        """)
+        edit_script_button.clicked.connect(self._edit_script_file)
+        script_file_layout.addWidget(edit_script_button)
+        
+        # 运行统计按钮
+        stats_button = QPushButton("运行统计", parent)
+        stats_button.setFixedSize(80, 32)
+        stats_button.setStyleSheet("""
+            QPushButton {
+                background-color: #6c757d;
+                color: white;
+                border: none;
+                border-radius: 4px;
+                font-size: 12px;
+            }
+            QPushButton:hover {
+                background-color: #5a6268;
+            }
+        """)
+        stats_button.clicked.connect(self._show_script_stats)
+        script_file_layout.addWidget(stats_button)
+        
+        layout.addLayout(script_file_layout)
+        
+    def load(self, action: Dict[str, Any]):
+        # 设置输入源
+        index = self.input_source_combo.findData(action.get("input_source", "clipboard"))
+        if index >= 0:
+            self.input_source_combo.setCurrentIndex(index)
+            
+        # 设置输出目标
+        index = self.output_target_combo.findData(action.get("output_target", "text"))
+        if index >= 0:
+            self.output_target_combo.setCurrentIndex(index)
+            
+        # 显示脚本文件
+        self.script_input.setText(action.get("script_file", ""))
+        
+    def save(self, action: Dict[str, Any]) -> Optional[str]:
+        action["input_source"] = self.input_source_combo.currentData()
+        action["output_target"] = self.output_target_combo.currentData()
+        # 脚本文件路径不允许编辑
+        return None
+        
+    def _edit_script_file(self):
+        """编辑脚本文件（优先使用系统默认编辑器，失败时使用内置编辑器）"""
+        import os
+        import subprocess
+        import sys
+        from PySide6.QtWidgets import QMessageBox
+        from ..config_manager import config_manager
+        
+        script_file = self.script_input.text().strip()
+        if not script_file:
+            QMessageBox.warning(self.parent, "错误", "未找到脚本文件路径")
+            return
+            
+        # 获取完整的文件路径
+        script_path = config_manager.get_input_output_script_path(script_file)
+        
+        if not script_path.exists():
+            QMessageBox.warning(self.parent, "错误", f"脚本文件不存在: {script_path}")
+            return
+            
+        try:
+            # 尝试使用默认编辑器打开文件
+            script_path_str = str(script_path)
+            if sys.platform == "win32":
+                # Windows
+                os.startfile(script_path_str)
+            elif sys.platform == "darwin":
+                # macOS
+                subprocess.run(["open", script_path_str])
+            else:
+                # Linux 和其他 Unix 系统
+                subprocess.run(["xdg-open", script_path_str])
+                
+        except Exception as e:
+            # 如果默认编辑器失败，使用内置编辑器
+            try:
+                from ..script_editor_dialog import ScriptEditorDialog
+                dialog = ScriptEditorDialog(str(script_path), self.parent)
+                dialog.exec()
+            except Exception as e2:
+                QMessageBox.warning(self.parent, "错误", f"无法打开文件编辑器: {e2}\n\n文件路径: {script_path}")
+                
+    def _show_script_stats(self):
+        """显示脚本的运行耗时、最近记录和性能分析结果"""
+        from ..script_stats_dialog import ScriptStatsDialog
+        dialog = ScriptStatsDialog(self.script_input.text().strip(), self.parent)
+        dialog.exec()
+
+
+class InputOutputHandler(ActionTypeHandler):
+    """输入输出：获取输入 -> 执行脚本 -> 处理输出"""
+    
+    type_name = "input_output"
+    display_name = "输入输出"
+    icon = "🔄"
+    menu_label = "输入输出"
+    
+    def create_config(self, **kwargs) -> Dict[str, Any]:
+        return {
+            "script_file": kwargs.get("script_file", ""),
+            "input_source": kwargs.get("input_source", "clipboard"),  # clipboard, selection, manual, none
+            "output_target": kwargs.get("output_target", "text"),  # text, url, clipboard, file
+            "description": kwargs.get("description", "")
+        }
+        
+    def prompt_new(self, panel) -> Optional[Dict[str, Any]]:
+        from PySide6.QtWidgets import QDialog
+        from ..input_output_dialog import InputOutputActionDialog
+        dialog = InputOutputActionDialog(panel)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            return dialog.get_action_data() or None
+        return None
+        
+    def execute(self, panel, action: Dict[str, Any]):
+        panel.execute_input_output(
+            action.get("script_file", ""),
+            action.get("input_source", "clipboard"),
+            action.get("output_target", "text")
+        )
+        
+    def create_editor(self, parent, layout) -> Optional[TypeEditor]:
+        return InputOutputEditor(parent, layout)
+
+
+HANDLER_CLASS = InputOutputHandler
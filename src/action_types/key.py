@@ -0,0 +1,74 @@
+# 模拟按键动作
+from typing import Any, Dict, Optional
+from .base import ActionTypeHandler, TypeEditor, LABEL_STYLE, INPUT_STYLE
+
+
+class KeyEditor(TypeEditor):
+    """按键序列编辑区域"""
+    
+    def __init__(self, parent, layout):
+        from PySide6.QtWidgets import QLabel, QTextEdit
+        command_label = QLabel("按键序列:")
+        command_label.setStyleSheet(LABEL_STYLE)
+        layout.addWidget(command_label)
+        
+        self.command_input = QTextEdit(parent)
+        self.command_input.setStyleSheet(INPUT_STYLE)
+        self.command_input.setMaximumHeight(100)
+        self.command_input.setPlaceholderText("支持格式:\n• 组合键: ctrl+c, alt+tab\n• 单个按键: f5, enter\n• 文本串: \"hello, world\"\n• 延时: wait(1000)\n多个步骤用逗号或换行分隔")
+        layout.addWidget(self.command_input)
+        
+    def load(self, action: Dict[str, Any]):
+        self.command_input.setPlainText(action.get("command", ""))
+        
+    def save(self, action: Dict[str, Any]) -> Optional[str]:
+        action["command"] = self.command_input.toPlainText().strip()
+        return None
+
+
+class KeyHandler(ActionTypeHandler):
+    """模拟按键：执行按键序列"""
+    
+    type_name = "key"
+    display_name = "模拟按键"
+    icon = "⌨️"
+    menu_label = "模拟按键"
+    
+    def create_config(self, **kwargs) -> Dict[str, Any]:
+        return {"command": kwargs.get("command", "")}
+        
+    def prompt_new(self, panel) -> Optional[Dict[str, Any]]:
+        from PySide6.QtWidgets import QInputDialog
+        from ..config_manager import config_manager
+        text, ok = QInputDialog.getText(
+            panel, "新增动作", 
+            "请输入要模拟的按键序列：\\n\\n"
+            "支持格式：\\n"
+            "• 组合键: ctrl+c, alt+tab\\n"
+            "• 单个按键: f5, enter, space\\n"
+            "• 文本串: \"hello world\"\\n"
+            "• 延时等待: wait(1000)\\n"
+            "• 序列组合: ctrl+c, wait(500), \"text\", enter"
+        )
+        if ok and text.strip():
+            return config_manager.create_action("模拟按键", "key", command=text.strip())
+        return None
+        
+    def validate(self, action: Dict[str, Any]) -> Optional[str]:
+        command = action.get("command", "")
+        if not command:
+            return "按键序列不能为空"
+        from ..key_sequence import validate_key_sequence
+        error = validate_key_sequence(command)
+        if error:
+            return f"按键序列格式错误：{error}"
+        return None
+        
+    def execute(self, panel, action: Dict[str, Any]):
+        panel.simulate_key(action.get("command", ""))
+        
+    def create_editor(self, parent, layout) -> Optional[TypeEditor]:
+        return KeyEditor(parent, layout)
+
+
+HANDLER_CLASS = KeyHandler
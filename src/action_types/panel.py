@@ -0,0 +1,42 @@
+# 子页面动作
+from typing import Any, Dict, Optional
+from .base import ActionTypeHandler, TypeEditor, LABEL_STYLE
+
+
+class PanelHandler(ActionTypeHandler):
+    """子页面：打开包含子动作的面板"""
+    
+    type_name = "panel"
+    display_name = "子页面"
+    icon = "📁"
+    menu_label = "新建子页面"
+    
+    def create_config(self, **kwargs) -> Dict[str, Any]:
+        return {"actions": kwargs.get("actions", [])}
+        
+    def prompt_new(self, panel) -> Optional[Dict[str, Any]]:
+        from PySide6.QtWidgets import QInputDialog
+        from ..config_manager import config_manager
+        text, ok = QInputDialog.getText(panel, "新增子页面", "请输入子页面名称：")
+        if ok and text.strip():
+            return config_manager.create_action(text.strip(), "panel", actions=[])
+        return None
+        
+    def execute(self, panel, action: Dict[str, Any]):
+        panel.open_sub_panel(action)
+        
+    def create_editor(self, parent, layout) -> Optional[TypeEditor]:
+        # 子页面 - 只显示提示信息
+        from PySide6.QtWidgets import QLabel
+        info_label = QLabel("子页面动作配置:")
+        info_label.setStyleSheet(LABEL_STYLE)
+        layout.addWidget(info_label)
+        
+        info_text = QLabel("子页面的动作内容需要在子页面中进行管理")
+        info_text.setStyleSheet("color: #6c757d; font-style: italic; padding: 10px; background-color: #f8f9fa; border-radius: 4px;")
+        info_text.setWordWrap(True)
+        layout.addWidget(info_text)
+        return None
+
+
+HANDLER_CLASS = PanelHandler
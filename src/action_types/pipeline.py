@@ -0,0 +1,176 @@
+# 脚本管道：获取一次输入，依次交给多个输入输出脚本处理，最后处理一次输出
+from typing import Any, Dict, List, Optional
+import time
+from .base import ActionTypeHandler, TypeEditor, LABEL_STYLE, INPUT_STYLE
+from .input_output import INPUT_SOURCES, OUTPUT_TARGETS
+
+
+def parse_scripts(text: str) -> List[str]:
+    """每行一个脚本文件名，忽略空行"""
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def execute_pipeline(panel, script_files: List[str], input_text: str, input_source: str, output_target: str,
+                     job=None, on_chunk=None) -> str:
+    """依次执行各脚本（在执行服务的工作线程中调用），返回最后一个脚本的结果
+    
+    每一段都经过 panel._execute_script，与单独的输入输出动作相同：使用脚本进程（每段单独计算超时）、
+    记录运行统计，声明 PURE 的脚本使用结果缓存。
+    第一个脚本收到真正的输入源，之后的脚本输入源为 previous；只有最后一个脚本收到真正的输出目标，
+    之前的为 next。流式输出的脚本结果拼接后再交给下一个。
+    """
+    from ..script_worker_pool import ScriptCancelledError
+    start_time = time.perf_counter()
+    value = input_text
+    timings = []
+    for index, script_file in enumerate(script_files):
+        if job is not None and job.cancelled:
+            raise ScriptCancelledError("脚本已取消")
+        stage_start = time.perf_counter()
+        stage_target = output_target if index == len(script_files) - 1 else "next"
+        value = panel._execute_script(
+            script_file, value, input_source if index == 0 else "previous", stage_target, job
+        ) or ""
+        timings.append((script_file, (time.perf_counter() - stage_start) * 1000))
+        
+    result = value
+    total_ms = (time.perf_counter() - start_time) * 1000
+    breakdown = "，".join(f"{index}.{name} {elapsed_ms:.1f} ms" for index, (name, elapsed_ms) in enumerate(timings, 1))
+    print(f"[性能] 脚本管道: {len(timings)} 段，共 {total_ms:.1f} ms（{breakdown}）")
+    return result
+
+
+class PipelineEditor(TypeEditor):
+    """输入源、输出目标和脚本列表编辑区域"""
+    
+    def __init__(self, parent, layout):
+        from PySide6.QtWidgets import QComboBox, QLabel, QTextEdit
+        input_label = QLabel("输入源:")
+        input_label.setStyleSheet(LABEL_STYLE)
+        layout.addWidget(input_label)
+        
+        self.input_source_combo = QComboBox(parent)
+        self.input_source_combo.setStyleSheet(INPUT_STYLE)
+        for text, value in INPUT_SOURCES:
+            self.input_source_combo.addItem(text, value)
+        layout.addWidget(self.input_source_combo)
+        
+        output_label = QLabel("输出目标:")
+        output_label.setStyleSheet(LABEL_STYLE)
+        layout.addWidget(output_label)
+        
+        self.output_target_combo = QComboBox(parent)
+        self.output_target_combo.setStyleSheet(INPUT_STYLE)
+        for text, value in OUTPUT_TARGETS:
+            self.output_target_combo.addItem(text, value)
+        layout.addWidget(self.output_target_combo)
+        
+        scripts_label = QLabel("脚本 (每行一个，按顺序执行):")
+        scripts_label.setStyleSheet(LABEL_STYLE)
+        layout.addWidget(scripts_label)
+        
+        self.scripts_input = QTextEdit(parent)
+        self.scripts_input.setStyleSheet(INPUT_STYLE)
+        self.scripts_input.setMinimumHeight(120)
+        self.scripts_input.setPlaceholderText("example_text_formatter.py\nexample_uppercase.py")
+        layout.addWidget(self.scripts_input)
+        
+    def load(self, action: Dict[str, Any]):
+        index = self.input_source_combo.findData(action.get("input_source", "clipboard"))
+        if index >= 0:
+            self.input_source_combo.setCurrentIndex(index)
+        index = self.output_target_combo.findData(action.get("output_target", "text"))
+        if index >= 0:
+            self.output_target_combo.setCurrentIndex(index)
+        self.scripts_input.setPlainText("\n".join(action.get("scripts", [])))
+        
+    def save(self, action: Dict[str, Any]) -> Optional[str]:
+        action["input_source"] = self.input_source_combo.currentData()
+        action["output_target"] = self.output_target_combo.currentData()
+        action["scripts"] = parse_scripts(self.scripts_input.toPlainText())
+        return None
+
+
+class PipelineHandler(ActionTypeHandler):
+    """脚本管道：一次输入 -> 多个脚本依次处理 -> 一次输出"""
+    
+    type_name = "pipeline"
+    display_name = "脚本管道"
+    icon = "⛓"
+    menu_label = "脚本管道"
+    
+    def create_config(self, **kwargs) -> Dict[str, Any]:
+        return {
+            "scripts": kwargs.get("scripts", []),
+            "input_source": kwargs.get("input_source", "clipboard"),
+            "output_target": kwargs.get("output_target", "text")
+        }
+        
+    def prompt_new(self, panel) -> Optional[Dict[str, Any]]:
+        from PySide6.QtWidgets import QInputDialog, QMessageBox
+        from ..config_manager import config_manager
+        name, ok = QInputDialog.getText(panel, "新增脚本管道", "请输入脚本管道名称：")
+        if not ok or not name.strip():
+            return None
+            
+        available = sorted(path.name for path in config_manager.input_output_dir.glob("*.py"))
+        text = ""
+        while True:
+            text, ok = QInputDialog.getMultiLineText(
+                panel, "新增脚本管道",
+                f"请输入脚本文件名，每行一个，按顺序执行：\n（可用脚本：{', '.join(available) or '无'}）", text
+            )
+            if not ok:
+                return None
+            action = self.create_config(scripts=parse_scripts(text))
+            error = self.validate(action)
+            if error:
+                QMessageBox.warning(panel, "错误", error)
+                continue
+            break
+            
+        labels = [label for label, _ in INPUT_SOURCES]
+        label, ok = QInputDialog.getItem(panel, "新增脚本管道", "输入源：", labels, 0, False)
+        if not ok:
+            return None
+        input_source = INPUT_SOURCES[labels.index(label)][1]
+        labels = [label for label, _ in OUTPUT_TARGETS]
+        label, ok = QInputDialog.getItem(panel, "新增脚本管道", "输出目标：", labels, 0, False)
+        if not ok:
+            return None
+        output_target = OUTPUT_TARGETS[labels.index(label)][1]
+        return config_manager.create_action(
+            name.strip(), "pipeline", scripts=action["scripts"], input_source=input_source, output_target=output_target
+        )
+        
+    def validate(self, action: Dict[str, Any]) -> Optional[str]:
+        from ..config_manager import config_manager
+        scripts = action.get("scripts")
+        if not isinstance(scripts, list) or not scripts:
+            return "脚本管道至少需要一个脚本"
+        for script_file in scripts:
+            if not config_manager.get_input_output_script_path(script_file).is_file():
+                return f"脚本文件不存在: {script_file}"
+        return None
+        
+    def execute(self, panel, action: Dict[str, Any]):
+        panel._run_in_previous_window("pipeline", lambda: self._run(panel, action))
+        
+    def _run(self, panel, action: Dict[str, Any]):
+        """只获取一次输入，全部脚本完成后只处理一次输出"""
+        from PySide6.QtWidgets import QMessageBox
+        scripts = list(action.get("scripts", []))
+        input_source = action.get("input_source", "clipboard")
+        output_target = action.get("output_target", "text")
+        panel._request_input_text(input_source, lambda input_text: panel._submit_script(
+            scripts, input_text, input_source, output_target,
+            on_success=lambda result: panel._handle_output(result, output_target),
+            on_error=lambda error: QMessageBox.warning(panel, "错误", f"执行脚本管道失败：{error}"),
+            execute=lambda *args: execute_pipeline(panel, *args)
+        ))
+        
+    def create_editor(self, parent, layout) -> Optional[TypeEditor]:
+        return PipelineEditor(parent, layout)
+
+
+HANDLER_CLASS = PipelineHandler
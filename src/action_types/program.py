@@ -0,0 +1,57 @@
+# 运行程序动作
+from typing import Any, Dict, Optional
+from .base import ActionTypeHandler, TypeEditor, LABEL_STYLE, INPUT_STYLE
+
+
+class ProgramEditor(TypeEditor):
+    """程序路径编辑区域"""
+    
+    def __init__(self, parent, layout):
+        from PySide6.QtWidgets import QLabel, QLineEdit
+        command_label = QLabel("程序路径:")
+        command_label.setStyleSheet(LABEL_STYLE)
+        layout.addWidget(command_label)
+        
+        self.command_line_input = QLineEdit(parent)
+        self.command_line_input.setStyleSheet(INPUT_STYLE)
+        self.command_line_input.setPlaceholderText("如: notepad.exe 或完整路径")
+        layout.addWidget(self.command_line_input)
+        
+    def load(self, action: Dict[str, Any]):
+        self.command_line_input.setText(action.get("command", ""))
+        
+    def save(self, action: Dict[str, Any]) -> Optional[str]:
+        action["command"] = self.command_line_input.text().strip()
+        return None
+
+
+class ProgramHandler(ActionTypeHandler):
+    """运行程序：通过shell启动命令"""
+    
+    type_name = "program"
+    display_name = "运行程序"
+    icon = "⚙️"
+    menu_label = "运行程序"
+    
+    def create_config(self, **kwargs) -> Dict[str, Any]:
+        return {"command": kwargs.get("command", ""), "args": kwargs.get("args", [])}
+        
+    def prompt_new(self, panel) -> Optional[Dict[str, Any]]:
+        from PySide6.QtWidgets import QInputDialog
+        from ..config_manager import config_manager
+        text, ok = QInputDialog.getText(panel, "新增动作", "请输入程序路径或文件路径：")
+        if ok and text.strip():
+            return config_manager.create_action("运行程序", "program", command=text.strip())
+        return None
+        
+    def validate(self, action: Dict[str, Any]) -> Optional[str]:
+        return None if action.get("command") else "程序路径不能为空"
+        
+    def execute(self, panel, action: Dict[str, Any]):
+        panel.run_program(action.get("command", ""))
+        
+    def create_editor(self, parent, layout) -> Optional[TypeEditor]:
+        return ProgramEditor(parent, layout)
+
+
+HANDLER_CLASS = ProgramHandler
@@ -0,0 +1,74 @@
+# 快捷发送动作
+from typing import Any, Dict, Optional
+from .base import ActionTypeHandler
+
+
+class QuickSendHandler(ActionTypeHandler):
+    """快捷发送：打开指定数据文件的快捷发送面板"""
+    
+    type_name = "quick_send"
+    display_name = "快捷发送"
+    icon = "🔘"
+    menu_label = "快捷发送"
+    
+    def create_config(self, **kwargs) -> Dict[str, Any]:
+        return {
+            "filename": kwargs.get("filename", ""),
+            "description": kwargs.get("description", "快捷发送文本内容")
+        }
+        
+    def prompt_new(self, panel) -> Optional[Dict[str, Any]]:
+        from PySide6.QtWidgets import QInputDialog, QMessageBox
+        from ..config_manager import config_manager
+        
+        # 创建快捷发送动作
+        name, ok = QInputDialog.getText(panel, "新建快捷发送", "请输入快捷发送动作名称：")
+        if not ok or not name.strip():
+            return None
+            
+        import datetime
+        import json
+        import re
+        
+        # 清理用户输入的名称，生成合法的文件名
+        clean_name = name.strip()
+        # 移除非法字符，只保留中文、英文、数字、下划线和短横线
+        safe_filename = re.sub(r'[^\w\u4e00-\u9fff-]', '_', clean_name)
+        # 确保文件名不为空
+        if not safe_filename:
+            safe_filename = f"quick_send_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            
+        # 检查文件名是否已存在，如果存在则添加序号
+        data_dir = config_manager.config_dir / "quick_send"
+        data_dir.mkdir(exist_ok=True)
+        
+        original_filename = safe_filename
+        counter = 1
+        while (data_dir / f"{safe_filename}.json").exists():
+            safe_filename = f"{original_filename}_{counter}"
+            counter += 1
+            
+        file_path = data_dir / f"{safe_filename}.json"
+        
+        try:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump([], f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            QMessageBox.warning(panel, "错误", f"创建文件失败: {e}")
+            return None
+            
+        print(f"已创建快捷发送动作: {clean_name}, 文件: {safe_filename}.json")
+        
+        # 创建动作配置，文件名就是清理后的用户名称
+        return config_manager.create_action(
+            clean_name, 
+            "quick_send", 
+            filename=safe_filename,
+            description=f"快捷发送: {clean_name}"
+        )
+        
+    def execute(self, panel, action: Dict[str, Any]):
+        panel.open_quick_send_panel(action.get("filename", ""))
+
+
+HANDLER_CLASS = QuickSendHandler
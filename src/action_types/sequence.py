@@ -0,0 +1,254 @@
+# 组合动作：依次执行多个子步骤，只切换一次焦点，步骤之间在内存中传递输出
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import time
+from .base import ActionTypeHandler, TypeEditor, LABEL_STYLE, INPUT_STYLE
+
+# 可以作为步骤的动作类型
+STEP_TYPES = ("key", "text", "url", "program", "input_output")
+
+# 新建组合动作时的步骤模板：复制选中文本 -> 脚本处理 -> 发送结果
+STEPS_TEMPLATE = [
+    {"type": "input_output", "script_file": "", "input_source": "selection", "output_target": "next"},
+    {"type": "text", "text": "{input}"}
+]
+
+
+class SequenceRunner:
+    """按顺序执行组合动作的步骤
+    
+    每一步完成（执行服务的回调或按键序列结束）后才开始下一步；
+    上一步的输出保存在 value 中，文本、网址和命令里的 {input} 会被替换为它，
+    留空的文本和网址直接使用它。
+    """
+    
+    _running: List["SequenceRunner"] = []  # 保持运行中实例的引用
+    
+    def __init__(self, panel, action: Dict[str, Any]):
+        self.panel = panel
+        self.name = action.get("name", "未命名")
+        self.steps: List[Dict[str, Any]] = action.get("steps", [])
+        self.value = ""  # 上一步的输出
+        self._index = 0
+        self._failed = False
+        self._start_time = 0.0
+        self._step_start = 0.0
+        self._timings: List[Tuple[str, float]] = []
+        
+    def start(self):
+        """开始执行"""
+        SequenceRunner._running.append(self)
+        self._start_time = time.perf_counter()
+        self._next_step()
+        
+    def _next_step(self):
+        """执行下一步，全部完成时输出耗时明细"""
+        if self._failed:
+            return
+        if self._index >= len(self.steps):
+            self._finish()
+            return
+            
+        step = self.steps[self._index]
+        self._step_start = time.perf_counter()
+        run_step = getattr(self, f"_run_{step.get('type')}", None)
+        if run_step is None:
+            self._fail(f"不支持的步骤类型: {step.get('type')}")
+            return
+        try:
+            run_step(step)
+        except ImportError:
+            self._fail("需要安装 'pyautogui' 库来执行此操作。\n请运行: pip install pyautogui")
+        except Exception as e:
+            self._fail(str(e))
+            
+    def _step_done(self, value: Optional[str] = None):
+        """当前步骤完成，记录耗时并继续"""
+        if self._failed:
+            return
+        if value is not None:
+            self.value = value
+        step_type = self.steps[self._index].get("type", "")
+        self._timings.append((step_type, (time.perf_counter() - self._step_start) * 1000))
+        self._index += 1
+        self._next_step()
+        
+    def _fill(self, template: str) -> str:
+        """替换 {input} 为上一步的输出，留空时直接使用上一步的输出"""
+        if not template:
+            return self.value
+        return template.replace("{input}", self.value)
+        
+    def _submit(self, action_type: str, func, *args, **kwargs):
+        """提交到执行服务，完成后继续下一步"""
+        from ..action_executor import action_executor
+        on_success = kwargs.pop("on_success", lambda result: self._step_done())
+        action_executor.submit(action_type, func, *args, on_success=on_success, on_error=self._fail, **kwargs)
+        
+    def _run_key(self, step: Dict[str, Any]):
+        from ..key_sequence import get_compiled_sequence, KeySequenceRunner
+        import pyautogui
+        ops = get_compiled_sequence(step.get("command", ""))
+        KeySequenceRunner(
+            ops, on_error=lambda e: self._fail(f"模拟按键失败：{e}"), on_finished=self._step_done
+        ).start()
+        
+    def _run_text(self, step: Dict[str, Any]):
+        from ..text_injection import text_injector
+        import pyautogui
+        text = self._fill(step.get("text", ""))
+        if text_injector.choose_strategy(text) == text_injector.STRATEGY_PASTE:
+            # 粘贴需要剪贴板，在界面线程排队完成，粘贴快捷键发出后执行下一步
+            text_injector.inject(text, on_done=self._step_done, on_error=self._fail)
+        else:
+            self._submit("text", text_injector.type_text, text)
+            
+    def _run_url(self, step: Dict[str, Any]):
+        import webbrowser
+        self._submit("url", webbrowser.open, self._fill(step.get("url", "")))
+        
+    def _run_program(self, step: Dict[str, Any]):
+        from ..action_executor import process_launcher
+        self._submit("program", process_launcher.launch, self._fill(step.get("command", "")))
+        
+    def _run_input_output(self, step: Dict[str, Any]):
+        input_source = step.get("input_source", "previous")
+        output_target = step.get("output_target", "next")
+        
+        def on_script_done(result):
+            result = result or ""
+            if output_target != "next":
+                self.panel._handle_output(result, output_target)
+            self._step_done(result)
+            
+        def run_script(input_text: str):
+            self.panel._submit_script(
+                step.get("script_file", ""), input_text, input_source, output_target,
+                on_success=on_script_done, on_error=self._fail
+            )
+            
+        if input_source == "previous":
+            run_script(self.value)
+        else:
+            self.panel._request_input_text(input_source, run_script)
+        
+    def _release(self):
+        """释放引用"""
+        if self in SequenceRunner._running:
+            SequenceRunner._running.remove(self)
+            
+    def _finish(self):
+        """全部步骤完成"""
+        self._release()
+        total_ms = (time.perf_counter() - self._start_time) * 1000
+        breakdown = "，".join(
+            f"{index}.{step_type} {elapsed_ms:.1f} ms" for index, (step_type, elapsed_ms) in enumerate(self._timings, 1)
+        )
+        print(f"[性能] 组合动作 [{self.name}]: {len(self._timings)} 步，共 {total_ms:.1f} ms（{breakdown}）")
+        
+    def _fail(self, message: str):
+        """某一步失败，停止后续步骤"""
+        if self._failed:
+            return
+        self._failed = True
+        self._release()
+        print(f"❌ 组合动作 [{self.name}] 第 {self._index + 1} 步失败: {message}")
+        from PySide6.QtWidgets import QMessageBox
+        QMessageBox.warning(self.panel, "错误", f"组合动作第 {self._index + 1} 步失败：{message}")
+
+
+def validate_steps(steps: Any) -> Optional[str]:
+    """检查步骤列表，合法时返回None，否则返回错误信息"""
+    if not isinstance(steps, list) or not steps:
+        return "组合动作至少需要一个步骤"
+    for index, step in enumerate(steps, 1):
+        if not isinstance(step, dict) or step.get("type") not in STEP_TYPES:
+            return f"第 {index} 步的类型必须是 {', '.join(STEP_TYPES)} 之一"
+        step_type = step["type"]
+        if step_type == "key":
+            from . import get_handler
+            error = get_handler("key").validate(step)
+            if error:
+                return f"第 {index} 步: {error}"
+        elif step_type == "program" and not step.get("command"):
+            return f"第 {index} 步: 程序路径不能为空"
+        elif step_type == "input_output" and not step.get("script_file"):
+            return f"第 {index} 步: 脚本文件不能为空"
+    return None
+
+
+class SequenceEditor(TypeEditor):
+    """步骤列表编辑区域（JSON）"""
+    
+    def __init__(self, parent, layout):
+        from PySide6.QtWidgets import QLabel, QTextEdit
+        steps_label = QLabel("步骤 (JSON列表，{input} 表示上一步的输出):")
+        steps_label.setStyleSheet(LABEL_STYLE)
+        layout.addWidget(steps_label)
+        
+        self.steps_input = QTextEdit(parent)
+        self.steps_input.setStyleSheet(INPUT_STYLE)
+        self.steps_input.setMinimumHeight(180)
+        self.steps_input.setPlaceholderText(json.dumps(STEPS_TEMPLATE, ensure_ascii=False, indent=2))
+        layout.addWidget(self.steps_input)
+        
+    def load(self, action: Dict[str, Any]):
+        self.steps_input.setPlainText(json.dumps(action.get("steps", []), ensure_ascii=False, indent=2))
+        
+    def save(self, action: Dict[str, Any]) -> Optional[str]:
+        try:
+            action["steps"] = json.loads(self.steps_input.toPlainText() or "[]")
+        except json.JSONDecodeError as e:
+            return f"步骤格式错误：{e}"
+        return None
+
+
+class SequenceHandler(ActionTypeHandler):
+    """组合动作：一次焦点切换后依次执行多个步骤"""
+    
+    type_name = "sequence"
+    display_name = "组合动作"
+    icon = "🔗"
+    menu_label = "组合动作"
+    
+    def create_config(self, **kwargs) -> Dict[str, Any]:
+        return {"steps": kwargs.get("steps", [])}
+        
+    def prompt_new(self, panel) -> Optional[Dict[str, Any]]:
+        from PySide6.QtWidgets import QInputDialog, QMessageBox
+        from ..config_manager import config_manager
+        name, ok = QInputDialog.getText(panel, "新增组合动作", "请输入组合动作名称：")
+        if not ok or not name.strip():
+            return None
+            
+        text = json.dumps(STEPS_TEMPLATE, ensure_ascii=False, indent=2)
+        while True:
+            text, ok = QInputDialog.getMultiLineText(
+                panel, "新增组合动作",
+                f"请输入步骤（JSON列表，类型可以是 {', '.join(STEP_TYPES)}）：", text
+            )
+            if not ok:
+                return None
+            try:
+                steps = json.loads(text)
+            except json.JSONDecodeError as e:
+                QMessageBox.warning(panel, "错误", f"步骤格式错误：{e}")
+                continue
+            error = validate_steps(steps)
+            if error:
+                QMessageBox.warning(panel, "错误", error)
+                continue
+            return config_manager.create_action(name.strip(), "sequence", steps=steps)
+            
+    def validate(self, action: Dict[str, Any]) -> Optional[str]:
+        return validate_steps(action.get("steps"))
+        
+    def execute(self, panel, action: Dict[str, Any]):
+        # 整个组合只切换一次焦点
+        panel._run_in_previous_window("sequence", lambda: SequenceRunner(panel, action).start())
+        
+    def create_editor(self, parent, layout) -> Optional[TypeEditor]:
+        return SequenceEditor(parent, layout)
+
+
+HANDLER_CLASS = SequenceHandler
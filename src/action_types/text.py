@@ -0,0 +1,58 @@
+# 发送文本动作
+from typing import Any, Dict, Optional
+from .base import ActionTypeHandler, TypeEditor, LABEL_STYLE, INPUT_STYLE
+
+
+class TextEditor(TypeEditor):
+    """文本内容编辑区域"""
+    
+    def __init__(self, parent, layout):
+        from PySide6.QtWidgets import QLabel, QTextEdit
+        text_label = QLabel("文本内容:")
+        text_label.setStyleSheet(LABEL_STYLE)
+        layout.addWidget(text_label)
+        
+        self.text_input = QTextEdit(parent)
+        self.text_input.setStyleSheet(INPUT_STYLE)
+        self.text_input.setMaximumHeight(150)
+        self.text_input.setPlaceholderText("要发送的文本内容")
+        layout.addWidget(self.text_input)
+        
+    def load(self, action: Dict[str, Any]):
+        self.text_input.setPlainText(action.get("text", ""))
+        
+    def save(self, action: Dict[str, Any]) -> Optional[str]:
+        action["text"] = self.text_input.toPlainText().strip()
+        return None
+
+
+class TextHandler(ActionTypeHandler):
+    """发送文本：向上一个窗口输入文本"""
+    
+    type_name = "text"
+    display_name = "发送文本"
+    icon = "📝"
+    menu_label = "发送文本"
+    
+    def create_config(self, **kwargs) -> Dict[str, Any]:
+        return {"text": kwargs.get("text", "")}
+        
+    def prompt_new(self, panel) -> Optional[Dict[str, Any]]:
+        from PySide6.QtWidgets import QInputDialog
+        from ..config_manager import config_manager
+        text, ok = QInputDialog.getText(panel, "新增动作", "请输入要发送的文本内容：")
+        if ok and text.strip():
+            return config_manager.create_action("发送文本", "text", text=text.strip())
+        return None
+        
+    def validate(self, action: Dict[str, Any]) -> Optional[str]:
+        return None if action.get("text") else "文本内容不能为空"
+        
+    def execute(self, panel, action: Dict[str, Any]):
+        panel.send_text(action.get("text", ""))
+        
+    def create_editor(self, parent, layout) -> Optional[TypeEditor]:
+        return TextEditor(parent, layout)
+
+
+HANDLER_CLASS = TextHandler
@@ -0,0 +1,57 @@
+# 打开网址动作
+from typing import Any, Dict, Optional
+from .base import ActionTypeHandler, TypeEditor, LABEL_STYLE, INPUT_STYLE
+
+
+class UrlEditor(TypeEditor):
+    """网址编辑区域"""
+    
+    def __init__(self, parent, layout):
+        from PySide6.QtWidgets import QLabel, QLineEdit
+        url_label = QLabel("网址 (URL):")
+        url_label.setStyleSheet(LABEL_STYLE)
+        layout.addWidget(url_label)
+        
+        self.url_input = QLineEdit(parent)
+        self.url_input.setStyleSheet(INPUT_STYLE)
+        self.url_input.setPlaceholderText("如: https://www.google.com")
+        layout.addWidget(self.url_input)
+        
+    def load(self, action: Dict[str, Any]):
+        self.url_input.setText(action.get("url", ""))
+        
+    def save(self, action: Dict[str, Any]) -> Optional[str]:
+        action["url"] = self.url_input.text().strip()
+        return None
+
+
+class UrlHandler(ActionTypeHandler):
+    """打开网址：用默认浏览器打开"""
+    
+    type_name = "url"
+    display_name = "打开网址"
+    icon = "🌐"
+    menu_label = "打开网址"
+    
+    def create_config(self, **kwargs) -> Dict[str, Any]:
+        return {"url": kwargs.get("url", "")}
+        
+    def prompt_new(self, panel) -> Optional[Dict[str, Any]]:
+        from PySide6.QtWidgets import QInputDialog
+        from ..config_manager import config_manager
+        text, ok = QInputDialog.getText(panel, "新增动作", "请输入网址（URL）：")
+        if ok and text.strip():
+            return config_manager.create_action("打开网址", "url", url=text.strip())
+        return None
+        
+    def validate(self, action: Dict[str, Any]) -> Optional[str]:
+        return None if action.get("url") else "网址不能为空"
+        
+    def execute(self, panel, action: Dict[str, Any]):
+        panel.open_url(action.get("url", ""))
+        
+    def create_editor(self, parent, layout) -> Optional[TypeEditor]:
+        return UrlEditor(parent, layout)
+
+
+HANDLER_CLASS = UrlHandler
@@ -0,0 +1,161 @@
+# 批量执行模块（不依赖Qt）：在命令行中用输入输出脚本处理文件或标准输入中的每条记录
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+import argparse
+import os
+import sys
+import time
+
+USAGE_EXAMPLE = """示例:
+  python main.py run-script example_uppercase.py --input-file names.txt --lines --jobs 4
+  type data.txt | python main.py run-script example_text_formatter --stdin --output result.txt
+"""
+
+
+def resolve_script(name: str) -> Path:
+    """按名称查找脚本：可以是路径，也可以是 input_output_actions 中的文件名（可省略 .py）"""
+    path = Path(name)
+    if path.is_file():
+        return path.resolve()
+    from .config_manager import config_manager
+    for candidate in (name, f"{name}.py"):
+        path = config_manager.get_input_output_script_path(candidate)
+        if path.is_file():
+            return path.resolve()
+    raise FileNotFoundError(f"找不到脚本: {name}")
+
+
+def read_records(stream: TextIO, lines: bool) -> Iterator[str]:
+    """逐条读取记录：按行拆分时每行一条（去掉换行符），否则整个输入为一条"""
+    if not lines:
+        yield stream.read()
+        return
+    for line in stream:
+        yield line.rstrip("\r\n")
+
+
+class BatchRunner:
+    """批量执行输入输出脚本
+    
+    记录交给脚本进程池（与界面使用同一套加载器和 process 函数约定）并行处理，
+    按输入顺序输出：最多 jobs * 4 条在途，先完成的结果等待前面的记录完成后再写出，
+    因此输入可以是很大的文件或持续的流。
+    """
+    
+    def __init__(self, script_path: Path, jobs: int = 1, input_source: str = "manual",
+                 output_target: str = "text", timeout_ms: Optional[int] = None, memory_limit_mb: int = 1024):
+        from .script_worker_pool import ScriptWorkerPool
+        self.script_path = script_path
+        self.jobs = max(1, jobs)
+        self.input_source = input_source
+        self.output_target = output_target
+        self.timeout_ms = timeout_ms
+        self.pool = ScriptWorkerPool(size=self.jobs, memory_limit_mb=memory_limit_mb)
+        self.failed = 0
+        
+    def _process(self, input_text: str) -> str:
+        return self.pool.run(self.script_path, input_text, self.input_source, self.output_target,
+                             timeout_ms=self.timeout_ms)
+                             
+    def run(self, records: Iterable[str]) -> Iterator[Tuple[int, Optional[str], Optional[str]]]:
+        """按输入顺序产出 (序号, 结果, 错误信息)"""
+        self.pool.start()
+        max_pending = self.jobs * 4
+        pending: "deque[Tuple[int, Future]]" = deque()
+        with ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix="BatchRunner") as executor:
+            try:
+                for index, record in enumerate(records, 1):
+                    pending.append((index, executor.submit(self._process, record)))
+                    while len(pending) >= max_pending or (pending and pending[0][1].done()):
+                        yield self._result(*pending.popleft())
+                while pending:
+                    yield self._result(*pending.popleft())
+            finally:
+                for _, future in pending:
+                    future.cancel()
+                self.pool.shutdown()
+                
+    def _result(self, index: int, future: Future) -> Tuple[int, Optional[str], Optional[str]]:
+        try:
+            return index, future.result(), None
+        except Exception as e:
+            self.failed += 1
+            return index, None, str(e)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="main.py run-script",
+        description="用输入输出脚本批量处理文件或标准输入（不启动界面）",
+        epilog=USAGE_EXAMPLE,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("script", help="脚本文件名（input_output_actions 目录中，可省略 .py）或路径")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--input-file", help="从文件读取输入")
+    source.add_argument("--stdin", action="store_true", help="从标准输入读取（默认）")
+    parser.add_argument("--lines", action="store_true", help="每行作为一条记录分别处理，每条结果输出一行（结果中的换行替换为空格）")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="并行的脚本进程数（默认CPU核数）")
+    parser.add_argument("--output", "-o", help="结果写入文件（默认输出到标准输出）")
+    parser.add_argument("--input-source", default="manual", help="传给 process 的 input_source（默认 manual）")
+    parser.add_argument("--output-target", default="text", help="传给 process 的 output_target（默认 text）")
+    parser.add_argument("--timeout", type=float, help="每条记录的超时秒数（默认使用配置中的脚本超时）")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """命令行入口，返回退出码：0 全部成功，1 有记录处理失败，2 参数或脚本错误"""
+    args = build_parser().parse_args(argv)
+    from .config_manager import config_manager
+    try:
+        script_path = resolve_script(args.script)
+    except FileNotFoundError as e:
+        print(f"错误: {e}", file=sys.stderr)
+        return 2
+        
+    timeout_ms = int(args.timeout * 1000) if args.timeout else config_manager.get("action_executor.script_timeout_ms", 30000)
+    runner = BatchRunner(
+        script_path, jobs=args.jobs, input_source=args.input_source, output_target=args.output_target,
+        timeout_ms=timeout_ms, memory_limit_mb=config_manager.get("script_workers.memory_limit_mb", 1024)
+    )
+    
+    if args.input_file and not args.lines:
+        # 整个文件为一条记录：只把路径交给脚本进程读取（声明 LARGE_INPUT 的脚本按需映射）
+        from .large_input import FileInput
+        input_stream = None
+        records: Iterable = [FileInput(args.input_file)]
+    else:
+        input_stream = open(args.input_file, "r", encoding="utf-8") if args.input_file else sys.stdin
+        records = read_records(input_stream, args.lines)
+    output_stream = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    start_time = time.perf_counter()
+    count = 0
+    try:
+        for index, result, error in runner.run(records):
+            count += 1
+            if error is not None:
+                print(f"[第 {index} 条] 处理失败: {error}", file=sys.stderr)
+                result = ""
+            if args.lines:
+                # 失败的记录输出空行，保持输出行与输入行对应
+                output_stream.write(result.replace("\n", " ") + "\n")
+            else:
+                output_stream.write(result)
+            if output_stream is sys.stdout:
+                output_stream.flush()
+    except KeyboardInterrupt:
+        print("已中断", file=sys.stderr)
+        return 130
+    finally:
+        if input_stream is not None and input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+            
+    elapsed = time.perf_counter() - start_time
+    rate = count / elapsed if elapsed > 0 else 0
+    print(f"[性能] 批量执行 {script_path.name}: {count} 条，{runner.jobs} 个进程，"
+          f"耗时 {elapsed:.2f} 秒（{rate:.0f} 条/秒），失败 {runner.failed} 条", file=sys.stderr)
+    return 1 if runner.failed else 0
@@ -9,6 +9,69 @@ from .icon_manager import icon_manager
 if TYPE_CHECKING:
     from .action_panel import ActionPanel
 
+_stylesheet_cache: Dict[str, str] = {}
+
+
+def get_action_type_icon(action_type: str) -> str:
+    """根据动作类型获取文本图标（emoji），按钮和列表视图共用"""
+    from .action_types import get_type_icon
+    return get_type_icon(action_type)
+
+
+def build_action_button_stylesheet(style_config: Optional[Dict[str, Any]] = None) -> str:
+    """根据 action_buttons.style 配置编译动作按钮的共享样式表
+    
+    样式表只需在面板级别设置一次，悬停、按下、拖拽状态通过动态属性
+    （hovered / pressed / dragging）切换，避免逐个按钮调用 setStyleSheet。
+    """
+    if style_config is None:
+        style_config = config_manager.get("action_buttons.style", {})
+        
+    cache_key = repr(sorted(style_config.items()))
+    if cache_key in _stylesheet_cache:
+        return _stylesheet_cache[cache_key]
+        
+    bg_color = style_config.get("background_color", "#f8fbff")
+    hover_bg_color = style_config.get("hover_background_color", "#e6f0ff")
+    hover_border_color = style_config.get("hover_border_color", "#4f7cff")
+    pressed_bg_color = style_config.get("pressed_background_color", "#e0f0ff")
+    border_radius = style_config.get("border_radius", 12)
+    font_size = style_config.get("font_size", 9)
+    color = style_config.get("color", "#333")
+    
+    stylesheet = f"""
+        DraggableButton {{
+            background-color: {bg_color};
+            border: 1px solid #ddd;
+            border-radius: {border_radius}px;
+        }}
+        DraggableButton[hovered="true"] {{
+            background-color: {hover_bg_color};
+            border-color: {hover_border_color};
+        }}
+        DraggableButton[pressed="true"] {{
+            background-color: {pressed_bg_color};
+        }}
+        DraggableButton[dragging="true"] {{
+            border: 2px dashed #4f7cff;
+        }}
+        DraggableButton QLabel {{
+            background: transparent;
+            border: none;
+            padding: 0px;
+        }}
+        DraggableButton QLabel#actionButtonText {{
+            font-size: {font_size}px;
+            color: {color};
+        }}
+        DraggableButton QLabel#actionButtonIcon {{
+            font-size: 20px;
+        }}
+    """
+    _stylesheet_cache[cache_key] = stylesheet
+    return stylesheet
+
+
 class DraggableButton(QWidget):
     """可拖拽的动作按钮（使用QWidget实现真正的垂直布局）"""
     
@@ -28,6 +91,7 @@ class DraggableButton(QWidget):
         self._is_dragging = False
         self.start_pos = None
         self._is_hovered = False
+        self._display_signature: Optional[tuple] = None  # 上次显示内容签名，用于跳过无变化的刷新
         
         self.setup_ui()
         self.setup_context_menu()
@@ -35,15 +99,11 @@ class DraggableButton(QWidget):
     def setup_ui(self):
         """设置UI（使用QWidget+QVBoxLayout实现真正的垂直布局）"""
         btn_config = config_manager.get("action_buttons", {})
-        style_config = btn_config.get("style", {})
         
         size = btn_config.get("size", 66)
         self.setFixedSize(size, size)
         
-        # 强制设置背景填充
-        self.setAutoFillBackground(True)
-        
-        # 强制设置样式属性
+        # 由所在面板的共享样式表绘制背景（见 build_action_button_stylesheet）
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         
         # 创建垂直布局
@@ -53,80 +113,36 @@ class DraggableButton(QWidget):
         
         # 图标标签
         self.icon_label = QLabel()
+        self.icon_label.setObjectName("actionButtonIcon")
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.icon_label.setFixedHeight(int(size * 0.6))  # 图标区卆60%
         layout.addWidget(self.icon_label)
         
         # 文字标签
         self.text_label = QLabel()
+        self.text_label.setObjectName("actionButtonText")
         self.text_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.text_label.setWordWrap(True)
         layout.addWidget(self.text_label)
         
-        # 保存样式配置以便动态更新
-        self.style_config = style_config
-        
         # 初始样式
         self.update_style()
         self.update_display()
         
     def update_style(self):
-        """更新样式（支持悬停效果）"""
-        if self._is_hovered:
-            bg_color = self.style_config.get("hover_background_color", "#e6f0ff")
-            border_color = self.style_config.get("hover_border_color", "#4f7cff")
-        else:
-            bg_color = self.style_config.get("background_color", "#f8fbff")
-            # 使用配置中的边框颜色，默认为蓝色
-            border_color = "#4f7cff"  # 与控制按钮一致的蓝色边框
-            
-        font_size = self.style_config.get("font_size", 9)
-        color = self.style_config.get("color", "#333")
-        border_radius = self.style_config.get("border_radius", 12)
-        
-        # 使用更强制的QWidget样式设置，确保背景色显示（添加浅色边框）
-        style = f"""
-            DraggableButton {{
-                background-color: {bg_color} !important;
-                border: 1px solid #ddd !important;
-                border-radius: {border_radius}px !important;
-            }}
-            QWidget {{
-                background-color: {bg_color} !important;
-                border: 1px solid #ddd !important;
-                border-radius: {border_radius}px !important;
-            }}
-        """
-        self.setStyleSheet(style)
-        
-        # 额外设置调色板确保背景生效
-        from PySide6.QtGui import QPalette, QColor
-        palette = self.palette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(bg_color))
-        palette.setColor(QPalette.ColorRole.Base, QColor(bg_color))
-        palette.setColor(QPalette.ColorRole.Button, QColor(bg_color))
-        self.setPalette(palette)
-        
-        # 设置文字标签样式
-        self.text_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: {font_size}px;
-                color: {color};
-                background: transparent;
-                border: none;
-                padding: 0px;
-            }}
-        """)
-        
-        # 设置图标标签样式
-        self.icon_label.setStyleSheet("""
-            QLabel {
-                background: transparent;
-                border: none;
-                padding: 0px;
-                font-size: 20px;
-            }
-        """)
+        """同步悬停/拖拽状态到动态属性（样式由共享样式表中的属性选择器决定）"""
+        self._set_style_state("hovered", self._is_hovered)
+        self._set_style_state("dragging", self._is_dragging)
+        
+    def _set_style_state(self, name: str, value: bool):
+        """设置样式状态属性，只在值变化时重新polish本控件"""
+        if self.property(name) == value:
+            return
+        self.setProperty(name, value)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+        self.update()
         
     def setup_context_menu(self):
         """设置右键菜单"""
@@ -229,11 +245,25 @@ class DraggableButton(QWidget):
         """编辑动作"""
         self.edit_requested.emit()
             
+    def rebind(self, action_config: Dict[str, Any]):
+        """重新绑定动作配置（按钮池复用按钮时调用，显示内容未变化则不刷新）"""
+        self.action_config = action_config
+        self.action_id = action_config.get("id", "")
+        if self._get_display_signature() != self._display_signature:
+            self.update_display()
+            
+    def _get_display_signature(self) -> tuple:
+        """获取影响显示内容的配置签名"""
+        return (
+            self.action_config.get("name", "未命名"),
+            self.action_config.get("type", ""),
+            self.action_config.get("icon_path", "")
+        )
+            
     def update_display(self):
         """更新显示内容（实现真正的垂直布局：图标在上文字在下）"""
-        name = self.action_config.get("name", "未命名")
-        action_type = self.action_config.get("type", "")
-        icon_path = self.action_config.get("icon_path", "")
+        self._display_signature = self._get_display_signature()
+        name, action_type, icon_path = self._display_signature
         
         # 如果有自定义SVG图标路径，尝试使用SVG图标
         if icon_path and icon_manager.has_icon(icon_path):
@@ -264,18 +294,7 @@ class DraggableButton(QWidget):
         
     def get_type_icon(self, action_type: str) -> str:
         """根据动作类型获取图标（使用更大的emoji）"""
-        type_icons = {
-            "key": "⌨️",      # 键盘emoji
-            "program": "⚙️",  # 齿轮emoji 
-            "url": "🌐",       # 地球emoji
-            "text": "📝",      # 笔记emoji
-            "panel": "📁",     # 文件夹emoji
-            "command": "⚡",    # 闪电emoji
-            "clipboard": "📋", # 剪贴板emoji
-            "input_output": "🔄", # 输入输出emoji
-            "placeholder": "🔄" # 循环emoji
-        }
-        return type_icons.get(action_type, "🔘")  # 默认使用小圆点emoji
+        return get_action_type_icon(action_type)
         
     def enterEvent(self, event):
         """鼠标进入事件"""
@@ -294,6 +313,7 @@ class DraggableButton(QWidget):
         if event.button() == Qt.MouseButton.LeftButton:
             self.start_pos = event.position().toPoint()
             self._is_dragging = False
+            self._set_style_state("pressed", True)
         super().mousePressEvent(event)
         
     def mouseMoveEvent(self, event):
@@ -304,24 +324,24 @@ class DraggableButton(QWidget):
         if (self.start_pos and 
             (event.position().toPoint() - self.start_pos).manhattanLength() >= 10):
             
+            if self._is_dragging:
+                return
+                
             self._is_dragging = True
             parent = self.parent()
             if hasattr(parent, '_dragged_button'):
                 setattr(parent, '_dragged_button', self)
             
             # 高亮拖拽状态
-            current_style = self.styleSheet()
-            # 移除原有边框设置，添加拖拽样式
-            new_style = current_style.replace("border: 1px solid", "border: 2px dashed")
-            if "2px dashed" not in new_style:
-                new_style += "border: 2px dashed #4f7cff;"
-            self.setStyleSheet(new_style)
+            self.update_style()
             
     def mouseReleaseEvent(self, event):
         """鼠标释放事件"""
         if event.button() == Qt.MouseButton.LeftButton:
+            self._set_style_state("pressed", False)
             if self._is_dragging:
                 # 恢复正常样式
+                self._is_dragging = False
                 self.update_style()
                 
                 # 处理拖拽结束逻辑
@@ -341,10 +361,81 @@ class DraggableButton(QWidget):
                             handle_button_drop(self, pos_in_panel)
                     except Exception as e:
                         print(f"处理按钮拖拽失败: {e}")
-                    
-                self._is_dragging = False
             else:
                 # 如果不是拖拽，则是点击
                 self.clicked.emit()
                 
-        super().mouseReleaseEvent(event)
\ No newline at end of file
+        super().mouseReleaseEvent(event)
+
+
+def benchmark(count: int = 100, pairs: int = 500):
+    """悬停风暴基准：鼠标在按钮间快速划过时，比较切换动态属性与逐个按钮重设样式表的耗时
+    
+    用法：python -m src.button_widget [按钮数] [进入/离开次数]（无显示器时加环境变量 QT_QPA_PLATFORM=offscreen）
+    """
+    import contextlib
+    import io
+    import sys
+    import time
+    from PySide6.QtCore import QEvent, QPointF
+    from PySide6.QtGui import QEnterEvent
+    from PySide6.QtWidgets import QApplication, QGridLayout
+    app = QApplication.instance() or QApplication(sys.argv)
+    style_config = config_manager.get("action_buttons.style", {})
+    
+    def build_panel():
+        panel = QWidget()
+        panel.setStyleSheet(build_action_button_stylesheet(style_config))
+        layout = QGridLayout(panel)
+        buttons = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for index in range(count):
+                button = DraggableButton({"id": f"bench-{index}", "type": "command", "name": f"动作{index}"}, panel)
+                layout.addWidget(button, index // 10, index % 10)
+                buttons.append(button)
+        panel.show()
+        app.processEvents()
+        return panel, buttons
+        
+    def legacy_sheet(hovered: bool) -> str:
+        # 共享样式表之前的做法：每次进入/离开都为按钮生成并设置自己的样式表
+        bg_color = style_config.get("hover_background_color" if hovered else "background_color",
+                                    "#e6f0ff" if hovered else "#f8fbff")
+        border_color = style_config.get("hover_border_color", "#4f7cff") if hovered else "#ddd"
+        return (f"DraggableButton {{ background-color: {bg_color}; border: 1px solid {border_color}; "
+                f"border-radius: {style_config.get('border_radius', 12)}px; }}")
+                
+    def run_storm(buttons, hover) -> float:
+        start = time.perf_counter()
+        for index in range(pairs):
+            button = buttons[index % count]
+            hover(button, True)
+            app.processEvents()
+            hover(button, False)
+            app.processEvents()
+        return (time.perf_counter() - start) * 1000
+        
+    def hover_by_property(button, entered: bool):
+        if entered:
+            point = QPointF(5, 5)
+            QApplication.sendEvent(button, QEnterEvent(point, point, button.mapToGlobal(point)))
+        else:
+            QApplication.sendEvent(button, QEvent(QEvent.Type.Leave))
+            
+    def hover_by_stylesheet(button, entered: bool):
+        button.setStyleSheet(legacy_sheet(entered))
+        
+    panel, buttons = build_panel()
+    shared_ms = run_storm(buttons, hover_by_property)
+    panel.close()
+    panel, buttons = build_panel()
+    legacy_ms = run_storm(buttons, hover_by_stylesheet)
+    panel.close()
+    print(f"{count} 个按钮，{pairs} 次进入/离开")
+    print(f"逐个按钮重设样式表: {legacy_ms:.1f} ms（每次 {legacy_ms / pairs:.3f} ms）")
+    print(f"共享样式表+动态属性: {shared_ms:.1f} ms（每次 {shared_ms / pairs:.3f} ms）")
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(*(int(arg) for arg in sys.argv[1:3]))
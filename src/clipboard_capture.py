@@ -0,0 +1,247 @@
+# 选中文本获取模块：发送复制快捷键后等待剪贴板真正变化，再恢复用户原来的剪贴板内容
+from typing import Callable, Deque, List, Optional
+from collections import deque
+import sys
+import time
+from PySide6.QtCore import QObject, QTimer, QMimeData, Signal
+from PySide6.QtWidgets import QApplication
+
+
+class ClipboardBackend(QObject):
+    """剪贴板平台接口：内容变化时发出 changed"""
+    
+    name = "base"
+    changed = Signal()
+    
+    def sequence(self) -> int:
+        """剪贴板变化序号（每次内容变化后增大）"""
+        return 0
+        
+    def text(self) -> str:
+        return ""
+        
+    def save(self) -> Optional[QMimeData]:
+        """保存当前内容（用于之后恢复）"""
+        return None
+        
+    def restore(self, saved: Optional[QMimeData]):
+        """恢复保存的内容"""
+        
+    def send_copy(self, on_error: Callable[[str], None]):
+        """向前台窗口发送复制快捷键（缺少pyautogui时抛出ImportError）"""
+
+
+class QtClipboardBackend(ClipboardBackend):
+    """系统剪贴板（QClipboard）
+    
+    序号由 dataChanged 计数；Windows 上同时读取系统的剪贴板序号，
+    复制在 dataChanged 送达之前完成时也能判断出来。
+    """
+    
+    name = "qt"
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.clipboard = QApplication.clipboard()
+        self._sequence = 0
+        self._win32_sequence = None
+        if sys.platform == "win32":
+            try:
+                import ctypes
+                self._win32_sequence = ctypes.windll.user32.GetClipboardSequenceNumber
+            except (ImportError, AttributeError, OSError):
+                pass
+        self.clipboard.dataChanged.connect(self._on_data_changed)
+        
+    def _on_data_changed(self):
+        self._sequence += 1
+        self.changed.emit()
+        
+    def sequence(self) -> int:
+        if self._win32_sequence is not None:
+            return self._win32_sequence()
+        return self._sequence
+        
+    def text(self) -> str:
+        return self.clipboard.text()
+        
+    def save(self) -> Optional[QMimeData]:
+        mime_data = self.clipboard.mimeData()
+        if mime_data is None or not mime_data.formats():
+            return None
+        # 剪贴板持有的对象在内容变化后会失效，需要复制
+        copied = QMimeData()
+        for mime_format in mime_data.formats():
+            copied.setData(mime_format, mime_data.data(mime_format))
+        return copied
+        
+    def restore(self, saved: Optional[QMimeData]):
+        if saved is None:
+            self.clipboard.clear()
+        else:
+            self.clipboard.setMimeData(saved)
+            
+    def send_copy(self, on_error: Callable[[str], None]):
+        import pyautogui
+        from .action_executor import action_executor
+        keys = ("command", "c") if sys.platform == "darwin" else ("ctrl", "c")
+        # pyautogui 每次按键后会暂停，放到工作线程中发送，等待期间界面不阻塞
+        action_executor.submit("selection", pyautogui.hotkey, *keys, on_error=on_error)
+
+
+class FakeClipboardBackend(ClipboardBackend):
+    """模拟实现（测试和基准用）：send_copy 后经过 copy_delay 秒剪贴板才变为 selection
+    
+    selection 为 None 表示没有选中文本，复制不会改变剪贴板。
+    """
+    
+    name = "fake"
+    
+    def __init__(self, copy_delay: float = 0.05, selection: Optional[str] = "", initial: str = "", parent=None):
+        super().__init__(parent)
+        self.copy_delay = copy_delay
+        self.selection = selection
+        self._text = initial
+        self._sequence = 0
+        self.copy_calls = 0
+        
+    def sequence(self) -> int:
+        return self._sequence
+        
+    def text(self) -> str:
+        return self._text
+        
+    def set_text(self, text: str):
+        self._text = text
+        self._sequence += 1
+        self.changed.emit()
+        
+    def save(self) -> Optional[str]:
+        return self._text
+        
+    def restore(self, saved: Optional[str]):
+        self.set_text(saved or "")
+        
+    def send_copy(self, on_error: Callable[[str], None]):
+        self.copy_calls += 1
+        if self.selection is not None:
+            selection = self.selection
+            QTimer.singleShot(int(self.copy_delay * 1000), lambda: self.set_text(selection))
+
+
+_clipboard_backend: Optional[ClipboardBackend] = None
+
+
+def get_clipboard_backend() -> ClipboardBackend:
+    """获取全局剪贴板后端（首次调用时按 selection_capture.backend 创建：auto / fake）"""
+    global _clipboard_backend
+    if _clipboard_backend is None:
+        from .config_manager import config_manager
+        if config_manager.get("selection_capture.backend", "auto") == "fake":
+            _clipboard_backend = FakeClipboardBackend()
+        else:
+            _clipboard_backend = QtClipboardBackend()
+    return _clipboard_backend
+
+
+def set_clipboard_backend(backend: ClipboardBackend):
+    """替换全局剪贴板后端（测试时注入FakeClipboardBackend）"""
+    global _clipboard_backend
+    _clipboard_backend = backend
+
+
+class _CaptureRequest:
+    """一次进行中的选中文本获取"""
+    
+    def __init__(self, callback: Callable[[str], None]):
+        self.callback = callback
+        self.start_time = 0.0
+        self.start_sequence = 0
+        self.saved = None
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+
+
+class SelectionCapture(QObject):
+    """获取选中文本：记录剪贴板序号 -> 发送复制快捷键 -> 等待剪贴板变化（或超时）-> 恢复原内容
+    
+    等待期间不阻塞事件循环；多个请求依次进行，避免互相把对方的恢复当成复制结果。
+    超时（通常是没有选中任何内容）时返回空文本，而不是剪贴板里原有的旧内容。
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        from .config_manager import config_manager
+        self.timeout_ms = config_manager.get("selection_capture.timeout_ms", 500)
+        self.restore_clipboard = config_manager.get("selection_capture.restore_clipboard", True)
+        self._queue: Deque[_CaptureRequest] = deque()
+        self._active: Optional[_CaptureRequest] = None
+        self._backend: Optional[ClipboardBackend] = None
+        self._waits: List[float] = []
+        
+    def capture(self, callback: Callable[[str], None]):
+        """获取选中文本，完成后在界面线程调用 callback(文本)（缺少pyautogui时抛出ImportError）"""
+        if get_clipboard_backend().name == "qt":
+            import pyautogui  # 缺少依赖时立即报错，而不是等到超时
+        self._queue.append(_CaptureRequest(callback))
+        if self._active is None:
+            self._start_next()
+            
+    def _start_next(self):
+        if not self._queue:
+            return
+        request = self._active = self._queue.popleft()
+        self._backend = backend = get_clipboard_backend()
+        request.start_time = time.perf_counter()
+        request.start_sequence = backend.sequence()
+        request.saved = backend.save() if self.restore_clipboard else None
+        backend.changed.connect(self._on_changed)
+        request.timer.timeout.connect(lambda: self._finish(request, timed_out=True))
+        request.timer.start(self.timeout_ms)
+        try:
+            backend.send_copy(on_error=lambda error: self._on_copy_error(request, error))
+        except Exception as e:
+            self._on_copy_error(request, str(e))
+            
+    def _on_changed(self):
+        request = self._active
+        if request is None or self._backend.sequence() == request.start_sequence:
+            return
+        # 有的程序复制时先清空剪贴板再写入，等到有文本时才算完成
+        if self._backend.text():
+            self._finish(request, timed_out=False)
+            
+    def _on_copy_error(self, request: _CaptureRequest, error: str):
+        print(f"[剪贴板] 发送复制快捷键失败: {error}")
+        self._finish(request, timed_out=True)
+        
+    def _finish(self, request: _CaptureRequest, timed_out: bool):
+        """结束当前请求：取出文本、恢复原剪贴板内容，然后回调"""
+        if request is not self._active:
+            return
+        backend = self._backend
+        request.timer.stop()
+        backend.changed.disconnect(self._on_changed)
+        changed = backend.sequence() != request.start_sequence
+        text = backend.text() if changed else ""
+        if changed and self.restore_clipboard:
+            backend.restore(request.saved)
+            
+        elapsed_ms = (time.perf_counter() - request.start_time) * 1000
+        if timed_out and not text:
+            print(f"[剪贴板] 等待复制超时（{self.timeout_ms} ms），没有获取到选中文本")
+        else:
+            self._waits.append(elapsed_ms)
+            print(f"[性能] 获取选中文本: 等待剪贴板变化 {elapsed_ms:.1f} ms，{len(text)} 字符"
+                  f"（平均 {sum(self._waits) / len(self._waits):.1f} ms）")
+                  
+        self._active = None
+        self._backend = None
+        try:
+            request.callback(text)
+        finally:
+            self._start_next()
+
+
+# 全局选中文本获取实例
+selection_capture = SelectionCapture()
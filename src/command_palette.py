@@ -0,0 +1,152 @@
+# 命令面板模块（输入即搜索整棵动作树）
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem, QLabel
+)
+from PySide6.QtCore import Qt, QEvent, Signal
+from PySide6.QtGui import QCursor, QGuiApplication
+from .config_manager import config_manager
+from .action_search import action_search_index
+
+
+class CommandPalette(QDialog):
+    """命令面板：按名称、类型、网址、命令和拼音首字母搜索所有动作"""
+    
+    action_chosen = Signal(dict)  # 选中的动作配置
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.result_limit = config_manager.get("command_palette.max_results", 50)
+        
+        self.setWindowTitle("命令面板")
+        self.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint |
+            Qt.WindowType.WindowStaysOnTopHint |
+            Qt.WindowType.Tool
+        )
+        self.resize(520, 380)
+        self._setup_ui()
+        
+    def _setup_ui(self):
+        """设置用户界面"""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(6)
+        
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("搜索动作（名称 / 类型 / 网址 / 命令 / 拼音首字母）")
+        self.search_edit.textChanged.connect(self._on_search_text_changed)
+        self.search_edit.installEventFilter(self)
+        layout.addWidget(self.search_edit)
+        
+        self.result_list = QListWidget()
+        self.result_list.itemClicked.connect(self._on_item_activated)
+        layout.addWidget(self.result_list)
+        
+        self.status_label = QLabel()
+        self.status_label.setStyleSheet("color: #888; font-size: 11px;")
+        layout.addWidget(self.status_label)
+        
+        self.setStyleSheet("""
+            CommandPalette {
+                background-color: #ffffff;
+                border: 1px solid #ccc;
+                border-radius: 8px;
+            }
+            QLineEdit {
+                border: 1px solid #ddd;
+                border-radius: 4px;
+                padding: 6px 8px;
+                font-size: 14px;
+            }
+            QLineEdit:focus {
+                border-color: #4f7cff;
+            }
+            QListWidget {
+                border: none;
+                font-size: 13px;
+            }
+            QListWidget::item {
+                padding: 4px 6px;
+            }
+            QListWidget::item:selected {
+                background-color: #e6f0ff;
+                color: #333;
+            }
+        """)
+        
+    def open_with_text(self, text: str = ""):
+        """同步索引后显示面板，可带入初始输入"""
+        action_search_index.ensure_synced(config_manager.get("actions", []))
+        
+        self.search_edit.blockSignals(True)
+        self.search_edit.setText(text)
+        self.search_edit.blockSignals(False)
+        self._refresh_results()
+        
+        # 显示在鼠标所在屏幕的上方居中
+        screen = QGuiApplication.screenAt(QCursor.pos()) or QGuiApplication.primaryScreen()
+        geo = screen.availableGeometry()
+        self.move(geo.center().x() - self.width() // 2, geo.top() + geo.height() // 5)
+        
+        self.show()
+        self.raise_()
+        self.activateWindow()
+        self.search_edit.setFocus()
+        self.search_edit.end(False)
+        
+    def _on_search_text_changed(self, text: str):
+        """输入变化时立即刷新结果（索引查询为毫秒级，无需防抖）"""
+        self._refresh_results()
+        
+    def _refresh_results(self):
+        """按当前输入刷新结果列表"""
+        from .button_widget import get_action_type_icon
+        
+        results = action_search_index.search(self.search_edit.text(), self.result_limit)
+        
+        self.result_list.setUpdatesEnabled(False)
+        self.result_list.clear()
+        for entry in results:
+            action = entry.action
+            text = f"{get_action_type_icon(action.get('type', ''))}  {action.get('name', '未命名')}"
+            if entry.path:
+                text += f"    — {entry.path}"
+            item = QListWidgetItem(text)
+            item.setData(Qt.ItemDataRole.UserRole, entry.action_id)
+            self.result_list.addItem(item)
+        self.result_list.setUpdatesEnabled(True)
+        
+        if self.result_list.count() > 0:
+            self.result_list.setCurrentRow(0)
+        self.status_label.setText(
+            f"共 {len(action_search_index)} 个动作，{len(results)} 个结果，"
+            f"查询耗时 {action_search_index.last_search_ms:.1f} ms"
+        )
+        
+    def _on_item_activated(self, item: QListWidgetItem):
+        """执行选中的动作"""
+        action_id = item.data(Qt.ItemDataRole.UserRole)
+        action = action_search_index.get_action(action_id)
+        if action is None:
+            return
+        self.hide()
+        self.action_chosen.emit(action)
+        
+    def eventFilter(self, obj, event):
+        """在搜索框中用上下键选择结果、回车执行、Esc关闭"""
+        if obj is self.search_edit and event.type() == QEvent.Type.KeyPress:
+            key = event.key()
+            if key in (Qt.Key.Key_Down, Qt.Key.Key_Up):
+                row = self.result_list.currentRow() + (1 if key == Qt.Key.Key_Down else -1)
+                if 0 <= row < self.result_list.count():
+                    self.result_list.setCurrentRow(row)
+                return True
+            if key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+                item = self.result_list.currentItem()
+                if item is not None:
+                    self._on_item_activated(item)
+                return True
+            if key == Qt.Key.Key_Escape:
+                self.hide()
+                return True
+        return super().eventFilter(obj, event)
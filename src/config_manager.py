@@ -48,7 +48,16 @@ class ConfigManager:
                 "width": 380,
                 "height": 300,
                 "columns": 4,
-                "background_color": "rgba(240, 240, 240, 0.95)"
+                "background_color": "rgba(240, 240, 240, 0.95)",
+                "animate_swap": True,  # 拖拽交换按钮时播放位置动画
+                "swap_animation_ms": 150,
+                "sub_panel_cache_size": 8,  # 每个面板最多缓存的子面板数量
+                "prewarm": True,  # 启动后空闲时预热主面板
+                "prewarm_sub_panels": False,  # 预热时同时预建第一层子面板
+                "view_mode": "grid",  # grid: 按钮网格; list_view: 虚拟化列表视图; auto: 动作数超过阈值时使用列表视图
+                "list_view_threshold": 64,
+                "show_recent_strip": False,  # 主面板顶部显示常用动作条
+                "recent_strip_count": 5
             },
             "action_buttons": {
                 "size": 66,
@@ -67,6 +76,68 @@ class ConfigManager:
             "hotkeys": {
                 "toggle_panel": "ctrl+alt+q"
             },
+            "command_palette": {
+                "max_results": 50
+            },
+            "focus_restore": {
+                "backend": "auto",  # auto / win32 / x11 / fake / null
+                "poll_interval_ms": 10,  # 轮询前台窗口的间隔
+                "timeout_ms": 300  # 目标窗口未到达前台时最多等待的时间
+            },
+            "selection_capture": {
+                "backend": "auto",  # auto / fake
+                "timeout_ms": 500,  # 发送复制快捷键后等待剪贴板变化的最长时间
+                "restore_clipboard": True  # 获取选中文本后恢复原来的剪贴板内容
+            },
+            "script_workers": {
+                "enabled": True,  # 在常驻的脚本进程中执行输入输出脚本
+                "count": 2,  # 脚本进程数
+                "memory_limit_mb": 1024,  # 每个脚本进程的内存上限（仅Linux/macOS，0表示不限制）
+                "stream_max_pending": 8  # 流式输出时最多积压的块数，超过时脚本等待
+            },
+            "script_cache": {
+                "enabled": True,  # 缓存声明了 PURE = True 的脚本的结果
+                "max_kb": 4096,  # 缓存结果的总大小上限，超过时淘汰最久未用的
+                "max_entry_kb": 256,  # 单个结果超过该大小时不缓存
+                "persist": False  # 退出时把缓存写入文件，下次启动继续使用
+            },
+            "script_editor": {
+                "lint_delay_ms": 500,  # 停止输入多久后在后台检查脚本
+                "lint_subprocess_lines": 2000  # 达到该行数的脚本在子进程中检查，避免解析时界面卡顿，0 表示不使用子进程
+            },
+            "file_output": {
+                "directory": "",  # 保存到文件的目录，为空时使用配置目录下的 output（相对路径相对于配置目录）
+                "mode": "separate",  # separate：每个结果一个文件；append：追加到 output.log
+                "rotate_kb": 10240,  # 追加模式下 output.log 超过该大小后滚动，0 表示不滚动
+                "backup_count": 5,  # 保留的旧日志数量
+                "gzip": False  # 用 gzip 压缩单独的结果文件和滚动后的旧日志
+            },
+            "large_input": {
+                "spill_kb": 1024  # 输入文本超过该大小（K字符）时写入临时文件再交给脚本，0 表示不启用
+            },
+            "script_stats": {
+                "history_size": 50,  # 每个脚本保留的最近执行记录数
+                "profile_scripts": []  # 用 cProfile 记录的脚本（在脚本的运行统计中勾选）
+            },
+            "script_loader": {
+                "warm_up": False  # 启动后在后台预加载配置中引用的输入输出脚本
+            },
+            "action_executor": {
+                "max_workers": 4,  # 执行动作的工作线程数
+                "max_queue": 32,  # 排队任务数上限，超过时拒绝新任务
+                "script_timeout_ms": 30000  # 输入输出脚本的执行超时
+            },
+            "text_injection": {
+                "strategy": "auto",  # auto: 超过阈值或含非ASCII字符时粘贴; type: 总是逐字输入; paste: 总是粘贴
+                "paste_threshold": 32,  # 字符数达到该值时改用剪贴板粘贴
+                "restore_delay_ms": 150,  # 粘贴后等待多久恢复原剪贴板内容
+                "stream_flush_ms": 100,  # 流式输出发送文本时，各块合并多久后输入一次
+                "stream_flush_chars": 4096  # 合并的字符数达到该值时立即输入
+            },
+            "usage_stats": {
+                "half_life_days": 7.0,  # 频近度分数的半衰期
+                "flush_interval": 2.0  # 后台批量写入间隔（秒）
+            },
             "actions": []
         }
     
@@ -235,26 +306,11 @@ class ConfigManager:
             "enabled": True
         }
         
-        # 根据类型添加特定配置
-        if action_type == "key":
-            action["command"] = kwargs.get("command", "")
-        elif action_type == "program":
-            action["command"] = kwargs.get("command", "")
-            action["args"] = kwargs.get("args", [])
-        elif action_type == "url":
-            action["url"] = kwargs.get("url", "")
-        elif action_type == "text":
-            action["text"] = kwargs.get("text", "")
-        elif action_type == "panel":
-            action["actions"] = kwargs.get("actions", [])
-        elif action_type == "input_output":
-            action["script_file"] = kwargs.get("script_file", "")
-            action["input_source"] = kwargs.get("input_source", "clipboard")  # clipboard, selection, manual, none
-            action["output_target"] = kwargs.get("output_target", "text")  # text, url, clipboard, file
-            action["description"] = kwargs.get("description", "")
-        elif action_type == "quick_send":
-            action["filename"] = kwargs.get("filename", "")
-            action["description"] = kwargs.get("description", "快捷发送文本内容")
+        # 根据类型添加特定配置（由动作类型处理器提供）
+        from .action_types import get_handler
+        handler = get_handler(action_type)
+        if handler is not None:
+            action.update(handler.create_config(**kwargs))
         
         return action
     
@@ -0,0 +1,222 @@
+# 文件输出模块（不依赖Qt）：输出到文件的结果交给后台写入线程，界面线程只负责排队
+from typing import Any, List, Optional, Tuple
+from datetime import datetime
+from pathlib import Path
+import gzip
+import os
+import queue
+import shutil
+import threading
+import time
+
+# 追加模式下的滚动日志文件名
+LOG_NAME = "output"
+
+
+class OutputFile:
+    """一次文件输出（由 FileOutputWriter.open 创建，方法都只是排队，可在界面线程调用）"""
+    
+    def __init__(self, writer: "FileOutputWriter"):
+        self._writer = writer
+        self.path: Optional[Path] = None
+        self.bytes_written = 0
+        self.error = ""
+        self._done = threading.Event()
+        # 以下只在写入线程中使用
+        self._file: Any = None
+        self._chunks: List[str] = []
+        self._started_at = time.perf_counter()
+        
+    def write(self, text: str):
+        self._writer._put("write", self, text)
+        
+    def close(self):
+        self._writer._put("close", self, None)
+        
+    def abort(self, message: str):
+        """中止输出，已写入的部分保留"""
+        self._writer._put("abort", self, message)
+        
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """等待写入完成（测试和退出时使用）"""
+        return self._done.wait(timeout)
+
+
+class FileOutputWriter:
+    """后台文件写入
+    
+    mode 为 separate 时每个结果保存为单独的文件：output_日期_时间_毫秒.txt，同名时加序号，不会覆盖；
+    mode 为 append 时追加到 output.log（每条结果前有时间标题），超过 rotate_kb 后滚动为
+    output.1.log … output.<backup_count>.log。compress 为 True 时单独文件和滚动后的旧日志用 gzip 压缩。
+    所有操作按提交顺序在同一个线程中执行，追加模式下一条结果完整后才写入，流式输出之间不会交错。
+    """
+    
+    def __init__(self, directory: Path, mode: str = "separate", rotate_kb: int = 10240,
+                 backup_count: int = 5, compress: bool = False):
+        self.directory = Path(directory)
+        self.mode = mode
+        self.rotate_kb = rotate_kb
+        self.backup_count = backup_count
+        self.compress = compress
+        self._queue: "queue.Queue[Optional[Tuple[str, OutputFile, Any]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        
+    def open(self) -> OutputFile:
+        """开始一次输出"""
+        output = OutputFile(self)
+        self._put("open", output, None)
+        return output
+        
+    def save(self, text: str) -> OutputFile:
+        """保存一个完整结果"""
+        output = self.open()
+        output.write(text)
+        output.close()
+        return output
+        
+    def _put(self, operation: str, output: OutputFile, payload: Any):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="FileOutputWriter", daemon=True)
+                self._thread.start()
+        self._queue.put((operation, output, payload))
+        
+    def _run(self):
+        """写入线程"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            operation, output, payload = item
+            if output.error:
+                # 打开或写入已失败，忽略后续操作
+                if operation in ("close", "abort"):
+                    output._done.set()
+                continue
+            try:
+                getattr(self, f"_do_{operation}")(output, payload)
+            except Exception as e:
+                output.error = str(e)
+                print(f"[文件输出] 写入失败: {e}")
+                self._close_file(output)
+                output._done.set()
+                
+    def _do_open(self, output: OutputFile, payload):
+        if self.mode == "append":
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now()
+        stem = f"output_{timestamp.strftime('%Y%m%d_%H%M%S')}_{timestamp.microsecond // 1000:03d}"
+        suffix = ".txt.gz" if self.compress else ".txt"
+        index = 0
+        while True:
+            path = self.directory / (f"{stem}{suffix}" if index == 0 else f"{stem}_{index}{suffix}")
+            try:
+                # x 模式：文件已存在时失败，换一个序号，不会覆盖同一毫秒内的其他结果
+                output._file = gzip.open(path, "xb", compresslevel=6) if self.compress else open(path, "xb")
+                break
+            except FileExistsError:
+                index += 1
+        output.path = path
+        
+    def _do_write(self, output: OutputFile, text: str):
+        if output._file is None:
+            output._chunks.append(text)
+            return
+        data = text.encode("utf-8")
+        output._file.write(data)
+        output.bytes_written += len(data)
+        
+    def _do_close(self, output: OutputFile, message: Optional[str]):
+        if self.mode == "append":
+            self._append_record(output, message)
+        else:
+            self._close_file(output)
+        elapsed_ms = (time.perf_counter() - output._started_at) * 1000
+        if message is None:
+            print(f"结果已保存到: {output.path}")
+        else:
+            print(f"输出中止（{message}），已写入的部分保存在: {output.path}")
+        print(f"[性能] 文件输出: {output.bytes_written} 字节，从提交到写完 {elapsed_ms:.1f} ms")
+        output._done.set()
+        
+    def _do_abort(self, output: OutputFile, message: str):
+        self._do_close(output, message)
+        
+    def _close_file(self, output: OutputFile):
+        if output._file is not None:
+            output._file.close()
+            output._file = None
+            
+    def _log_path(self, index: int = 0) -> Path:
+        if index == 0:
+            return self.directory / f"{LOG_NAME}.log"
+        return self.directory / f"{LOG_NAME}.{index}.log{'.gz' if self.compress else ''}"
+        
+    def _append_record(self, output: OutputFile, message: Optional[str]):
+        """把一条完整结果追加到滚动日志"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._log_path()
+        if self.rotate_kb and path.exists() and path.stat().st_size >= self.rotate_kb * 1024:
+            self._rotate()
+        header = f"===== {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} =====\n"
+        footer = "\n" if message is None else f"\n[输出中止: {message}]\n"
+        data = (header + "".join(output._chunks) + footer).encode("utf-8")
+        output._chunks = []
+        with open(path, "ab") as file:
+            file.write(data)
+        output.bytes_written = len(data)
+        output.path = path
+        
+    def _rotate(self):
+        """output.log -> output.1.log，已有的旧日志序号依次加一，超过 backup_count 的删除"""
+        path = self._log_path()
+        if self.backup_count <= 0:
+            os.remove(path)
+            return
+        oldest = self._log_path(self.backup_count)
+        if oldest.exists():
+            os.remove(oldest)
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self._log_path(index)
+            if source.exists():
+                os.replace(source, self._log_path(index + 1))
+        if self.compress:
+            with open(path, "rb") as source, gzip.open(self._log_path(1), "wb", compresslevel=6) as target:
+                shutil.copyfileobj(source, target)
+            os.remove(path)
+        else:
+            os.replace(path, self._log_path(1))
+        print(f"[文件输出] 日志已滚动: {self._log_path(1)}")
+        
+    def shutdown(self, timeout: float = 5.0):
+        """写完已排队的输出后结束写入线程（程序退出时调用）"""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+        if thread.is_alive():
+            print("[文件输出] 等待写入完成超时，部分输出可能未保存")
+
+
+def _create_file_output_writer() -> FileOutputWriter:
+    """按配置创建全局文件写入（目录为空时使用配置目录下的 output，相对路径相对于配置目录）"""
+    from .config_manager import config_manager
+    directory = Path(config_manager.get("file_output.directory", "") or "output")
+    if not directory.is_absolute():
+        directory = config_manager.config_dir / directory
+    return FileOutputWriter(
+        directory,
+        mode=config_manager.get("file_output.mode", "separate"),
+        rotate_kb=config_manager.get("file_output.rotate_kb", 10240),
+        backup_count=config_manager.get("file_output.backup_count", 5),
+        compress=config_manager.get("file_output.gzip", False)
+    )
+
+
+# 全局文件写入
+file_output_writer = _create_file_output_writer()
@@ -1,5 +1,6 @@
 # 悬浮按钮模块
 from typing import Optional
+import time
 from PySide6.QtWidgets import (
     QWidget, QPushButton, QMenu, QSystemTrayIcon, QMessageBox, QApplication
 )
@@ -20,6 +21,9 @@ class FloatingButton(QWidget):
         self._drag_pos: Optional[QPoint] = None
         self._mouse_press_pos: Optional[QPoint] = None
         self._is_dragging = False
+        self._panel_prewarmed = False  # 主面板是否已在空闲时预热
+        self.command_palette = None  # 命令面板（首次使用时创建）
+        self._first_open_logged = False
         
         self.setup_ui()
         self.setup_tray()
@@ -183,44 +187,30 @@ class FloatingButton(QWidget):
             
     def update_last_foreground_window(self):
         """更新最后的前台窗口"""
-        # Windows平台特定代码
-        import sys
-        if sys.platform == "win32":
-            try:
-                import win32gui
-                hwnd = win32gui.GetForegroundWindow()
+        from .focus_restore import get_focus_backend, is_app_window_title
+        backend = get_focus_backend()
+        try:
+            window = backend.get_foreground_window()
+            if not window:
+                return
                 
-                # 排除自己和动作面板的窗口
-                exclude_hwnds = [int(self.winId())]
-                if self.action_panel:
-                    exclude_hwnds.append(int(self.action_panel.winId()))
-                
-                # 排除所有的应用内对话框（根据窗口标题判断）
-                window_title = win32gui.GetWindowText(hwnd)
-                app_dialog_titles = [
-                    "快捷发送面板",
-                    "数据面板",
-                    "编辑动作",
-                    "新增动作",
-                    "输入输出动作",
-                    "脚本编辑器",
-                    "图标选择",
-                    "Quicker",
-                    "关于"
-                ]
-                
-                # 检查是否是应用内的对话框
-                is_app_dialog = any(title in window_title for title in app_dialog_titles)
-                
-                if (hwnd not in exclude_hwnds and 
-                    win32gui.IsWindowVisible(hwnd) and 
-                    window_title != "" and
-                    not is_app_dialog):
-                    self.last_foreground_window = hwnd
-                    # print(f"[DEBUG] 更新前台窗口: {window_title} (hwnd: {hwnd})")
-            except Exception:
-                pass
+            # 排除自己和动作面板的窗口
+            exclude_windows = [int(self.winId())]
+            if self.action_panel:
+                exclude_windows.append(int(self.action_panel.winId()))
                 
+            # 排除所有的应用内对话框（根据窗口标题判断）
+            window_title = backend.get_window_title(window)
+            
+            if (window not in exclude_windows and 
+                backend.is_window_valid(window) and 
+                window_title != "" and
+                not is_app_window_title(window_title)):
+                self.last_foreground_window = window
+                # print(f"[DEBUG] 更新前台窗口: {window_title} (window: {window})")
+        except Exception:
+            pass
+            
     def quit_application(self):
         """退出应用程序"""
         app = QApplication.instance()
@@ -236,17 +226,75 @@ class FloatingButton(QWidget):
             "版本：2.0"
         )
         
+    @Slot()
+    def prewarm_panel(self):
+        """空闲时预热主面板：隐藏构建面板并渲染图标，可选预建第一层子面板"""
+        if self.action_panel is not None:
+            return
+            
+        start_time = time.perf_counter()
+        self.action_panel = ActionPanel(parent=self)
+        
+        # 提前创建原生窗口并完成样式polish和布局计算，首次显示时无需再做
+        panel = self.action_panel
+        panel.create()
+        panel.ensurePolished()
+        for widget in panel.findChildren(QWidget):
+            widget.ensurePolished()
+        panel.layout().activate()
+        
+        sub_panel_count = 0
+        if config_manager.get("action_panel.prewarm_sub_panels", False):
+            sub_panel_count = panel.prebuild_sub_panels()
+            
+        # 同时预建命令面板的搜索索引（首次建立需要计算拼音）
+        from .action_search import action_search_index
+        action_search_index.ensure_synced(config_manager.get("actions", []))
+        
+        # 预先启动脚本进程（启动Python解释器约需100 ms，放在空闲时）
+        if config_manager.get("script_workers.enabled", True):
+            from .action_executor import action_executor
+            from .script_worker_pool import get_script_worker_pool
+            action_executor.submit("script_workers_start", get_script_worker_pool().start)
+            
+        # 可选：在工作线程中预加载配置引用的输入输出脚本（执行脚本顶层的import等）
+        if config_manager.get("script_loader.warm_up", False):
+            self._warm_up_scripts()
+            
+        self._panel_prewarmed = True
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        print(f"[性能] 主面板预热完成（预建子面板 {sub_panel_count} 个），耗时 {elapsed_ms:.1f} ms")
+        
+    def _warm_up_scripts(self):
+        """在执行服务的工作线程中预加载配置引用的脚本（启用脚本进程时由每个进程加载）"""
+        from .action_executor import action_executor
+        from .script_loader import script_loader, collect_script_files
+        script_paths = [
+            config_manager.get_input_output_script_path(script_file)
+            for script_file in collect_script_files(config_manager.get("actions", []))
+        ]
+        if config_manager.get("script_workers.enabled", True):
+            from .script_worker_pool import get_script_worker_pool
+            warm_up = get_script_worker_pool().warm_up
+        else:
+            warm_up = script_loader.warm_up
+        if script_paths:
+            action_executor.submit(
+                "script_warm_up", warm_up, script_paths,
+                on_success=lambda count: print(f"[脚本] 已预加载 {count}/{len(script_paths)} 个脚本")
+            )
+            
     @Slot()
     def toggle_panel(self):
         """切换面板显示状态"""
         print("[DEBUG] toggle_panel 被调用")
+        start_time = time.perf_counter()
         
-        # 关闭所有子面板，只保留主面板
+        # 隐藏所有子面板，只保留主面板（子面板由父面板缓存，不在此销毁）
         for panel in list(ActionPanel._open_panels):
             if panel._panel_id != "main_panel":
                 panel.hide()
-                panel.deleteLater()
-                print(f"[DEBUG] 已关闭子面板: {panel._panel_id}")
+                print(f"[DEBUG] 已隐藏子面板: {panel._panel_id}")
                 
         # 创建或显示主面板
         if self.action_panel is None:
@@ -263,6 +311,39 @@ class FloatingButton(QWidget):
             self.action_panel.raise_()
             self.action_panel.activateWindow()
             
+            if not self._first_open_logged:
+                self._first_open_logged = True
+                # 在事件循环处理完首次绘制后记录首次打开耗时
+                QTimer.singleShot(0, lambda: self._log_first_open_latency(start_time))
+                
+    @Slot()
+    def show_command_palette(self, text: str = ""):
+        """打开命令面板，可带入已输入的文字"""
+        if self.command_palette is None:
+            from .command_palette import CommandPalette
+            self.command_palette = CommandPalette(self)
+            self.command_palette.action_chosen.connect(self._execute_palette_action)
+            
+        if self.action_panel and self.action_panel.isVisible():
+            self.action_panel.hide()
+        self.command_palette.open_with_text(text)
+        
+    def _execute_palette_action(self, action: dict):
+        """执行命令面板中选中的动作（由主面板负责执行）"""
+        if self.action_panel is None:
+            self.action_panel = ActionPanel(parent=self)
+        print(f"[DEBUG] 命令面板执行动作 [{action.get('name', '未命名')}] 类型: {action.get('type')}")
+        try:
+            self.action_panel._execute_action_config(action)
+        except Exception as e:
+            print(f"❌ 执行动作失败 [{action.get('name', '未命名')}]: {e}")
+            
+    def _log_first_open_latency(self, start_time: float):
+        """输出首次打开主面板的耗时（区分是否预热）"""
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        state = "已预热" if self._panel_prewarmed else "未预热"
+        print(f"[性能] 首次打开主面板耗时 {elapsed_ms:.1f} ms（{state}）")
+            
     def _position_panel(self):
         """定位面板位置"""
         if not self.action_panel:
@@ -0,0 +1,326 @@
+# 焦点恢复模块：隐藏面板后把焦点交还给上一个窗口，确认到达前台后再执行动作
+from typing import Optional, Callable, Dict, List
+import sys
+import time
+from PySide6.QtCore import QObject, QTimer
+
+# 应用内窗口的标题，记录上一个活动窗口时需要排除
+APP_WINDOW_TITLES = [
+    "快捷发送面板",
+    "数据面板",
+    "编辑动作",
+    "新增动作",
+    "输入输出动作",
+    "脚本编辑器",
+    "图标选择",
+    "命令面板",
+    "Quicker",
+    "关于"
+]
+
+
+def is_app_window_title(window_title: str) -> bool:
+    """标题是否属于应用内的窗口"""
+    return any(title in window_title for title in APP_WINDOW_TITLES)
+
+
+class FocusBackend:
+    """窗口焦点平台接口（窗口句柄统一用整数表示）"""
+    
+    name = "base"
+    
+    def get_foreground_window(self) -> Optional[int]:
+        """获取当前前台窗口"""
+        return None
+        
+    def activate_window(self, window: int) -> bool:
+        """请求把窗口切换到前台，返回请求是否已发出"""
+        return False
+        
+    def is_window_valid(self, window: int) -> bool:
+        """窗口是否仍然存在且可见"""
+        return False
+        
+    def get_window_title(self, window: int) -> str:
+        """获取窗口标题"""
+        return ""
+
+
+class NullFocusBackend(FocusBackend):
+    """不支持焦点控制的平台：不切换窗口，面板隐藏后等待固定时间再执行动作"""
+    
+    name = "null"
+
+
+class Win32FocusBackend(FocusBackend):
+    """Windows实现（pywin32）"""
+    
+    name = "win32"
+    
+    def __init__(self):
+        import win32gui
+        import win32con
+        self._win32gui = win32gui
+        self._win32con = win32con
+        
+    def get_foreground_window(self) -> Optional[int]:
+        return self._win32gui.GetForegroundWindow() or None
+        
+    def activate_window(self, window: int) -> bool:
+        win32gui = self._win32gui
+        try:
+            if not win32gui.IsWindow(window):
+                return False
+            # 如果被最小化则恢复
+            if win32gui.IsIconic(window):
+                win32gui.ShowWindow(window, self._win32con.SW_RESTORE)
+            win32gui.SetForegroundWindow(window)
+            return True
+        except Exception as e:
+            print(f"切换窗口失败: {e}")
+            return False
+            
+    def is_window_valid(self, window: int) -> bool:
+        try:
+            return bool(self._win32gui.IsWindow(window) and self._win32gui.IsWindowVisible(window))
+        except Exception:
+            return False
+            
+    def get_window_title(self, window: int) -> str:
+        try:
+            return self._win32gui.GetWindowText(window)
+        except Exception:
+            return ""
+
+
+class X11FocusBackend(FocusBackend):
+    """Linux/X11实现（python-xlib，通过EWMH的 _NET_ACTIVE_WINDOW 读取和切换前台窗口）"""
+    
+    name = "x11"
+    
+    def __init__(self):
+        from Xlib import X, display, protocol
+        self._X = X
+        self._protocol = protocol
+        self._display = display.Display()
+        self._root = self._display.screen().root
+        self._net_active_window = self._display.intern_atom("_NET_ACTIVE_WINDOW")
+        self._net_wm_name = self._display.intern_atom("_NET_WM_NAME")
+        self._utf8_string = self._display.intern_atom("UTF8_STRING")
+        
+    def get_foreground_window(self) -> Optional[int]:
+        try:
+            prop = self._root.get_full_property(self._net_active_window, self._X.AnyPropertyType)
+            if prop and prop.value:
+                return int(prop.value[0]) or None
+        except Exception:
+            pass
+        return None
+        
+    def activate_window(self, window: int) -> bool:
+        try:
+            target = self._display.create_resource_object("window", window)
+            # source indication = 2 表示来自分页器/工具，窗口管理器不会拒绝切换
+            event = self._protocol.event.ClientMessage(
+                window=target,
+                client_type=self._net_active_window,
+                data=(32, [2, self._X.CurrentTime, 0, 0, 0])
+            )
+            mask = self._X.SubstructureRedirectMask | self._X.SubstructureNotifyMask
+            self._root.send_event(event, event_mask=mask)
+            self._display.flush()
+            return True
+        except Exception as e:
+            print(f"切换窗口失败: {e}")
+            return False
+            
+    def is_window_valid(self, window: int) -> bool:
+        try:
+            target = self._display.create_resource_object("window", window)
+            return target.get_attributes().map_state == self._X.IsViewable
+        except Exception:
+            return False
+            
+    def get_window_title(self, window: int) -> str:
+        try:
+            target = self._display.create_resource_object("window", window)
+            prop = target.get_full_property(self._net_wm_name, self._utf8_string)
+            if prop and prop.value:
+                value = prop.value
+                return value.decode("utf-8", "replace") if isinstance(value, bytes) else str(value)
+            return target.get_wm_name() or ""
+        except Exception:
+            return ""
+
+
+class FakeFocusBackend(FocusBackend):
+    """模拟实现（测试和基准用）：activate_window 后经过 activation_delay 秒窗口才到达前台"""
+    
+    name = "fake"
+    
+    def __init__(self, activation_delay: float = 0.02):
+        self.activation_delay = activation_delay
+        self.foreground: Optional[int] = None
+        self.windows: Dict[int, str] = {}
+        self._pending: Optional[int] = None
+        self._pending_since = 0.0
+        self.activate_calls: List[int] = []
+        
+    def get_foreground_window(self) -> Optional[int]:
+        if self._pending is not None and time.perf_counter() - self._pending_since >= self.activation_delay:
+            self.foreground = self._pending
+            self._pending = None
+        return self.foreground
+        
+    def activate_window(self, window: int) -> bool:
+        if window not in self.windows:
+            return False
+        self.activate_calls.append(window)
+        self._pending = window
+        self._pending_since = time.perf_counter()
+        return True
+        
+    def is_window_valid(self, window: int) -> bool:
+        return window in self.windows
+        
+    def get_window_title(self, window: int) -> str:
+        return self.windows.get(window, "")
+
+
+_focus_backend: Optional[FocusBackend] = None
+
+
+def _create_focus_backend() -> FocusBackend:
+    """按配置和平台创建焦点后端（focus_restore.backend: auto / win32 / x11 / fake / null）"""
+    from .config_manager import config_manager
+    backend_name = config_manager.get("focus_restore.backend", "auto")
+    
+    if backend_name == "fake":
+        return FakeFocusBackend()
+    if backend_name == "null":
+        return NullFocusBackend()
+        
+    if backend_name in ("auto", "win32") and sys.platform == "win32":
+        try:
+            return Win32FocusBackend()
+        except ImportError:
+            print("⚠️ pywin32不可用，窗口切换功能将被禁用")
+    if backend_name in ("auto", "x11") and sys.platform.startswith("linux"):
+        try:
+            return X11FocusBackend()
+        except ImportError:
+            print("⚠️ python-xlib不可用，窗口切换功能将被禁用")
+            print("   如需使用窗口切换功能，请安装：pip install python-xlib")
+        except Exception as e:
+            print(f"⚠️ 无法连接X11显示服务，窗口切换功能将被禁用: {e}")
+    return NullFocusBackend()
+
+
+def get_focus_backend() -> FocusBackend:
+    """获取全局焦点后端（首次调用时创建）"""
+    global _focus_backend
+    if _focus_backend is None:
+        _focus_backend = _create_focus_backend()
+    return _focus_backend
+
+
+def set_focus_backend(backend: FocusBackend):
+    """替换全局焦点后端（测试时注入FakeFocusBackend）"""
+    global _focus_backend
+    _focus_backend = backend
+
+
+class _FocusRequest:
+    """一次进行中的焦点恢复"""
+    
+    def __init__(self, target: int, callback: Callable[[], None], action_type: str, start_time: float):
+        self.target = target
+        self.callback = callback
+        self.action_type = action_type
+        self.start_time = start_time
+        self.timer = QTimer()
+
+
+class FocusRestorer(QObject):
+    """焦点恢复：目标窗口确认到达前台（或超时）后立即执行回调，取代固定的100 ms + 200 ms延时"""
+    
+    # 原实现的固定等待时间：隐藏面板后100 ms，切换窗口后再200 ms
+    LEGACY_HIDE_DELAY_MS = 100
+    LEGACY_SWITCH_DELAY_MS = 200
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        from .config_manager import config_manager
+        self.poll_interval_ms = config_manager.get("focus_restore.poll_interval_ms", 10)
+        self.timeout_ms = config_manager.get("focus_restore.timeout_ms", 300)
+        self._requests: List[_FocusRequest] = []
+        self._stats: Dict[str, List[float]] = {}  # 动作类型 -> [次数, 累计节省毫秒]
+        
+    def restore(self, target: Optional[int], callback: Callable[[], None], action_type: str = ""):
+        """切换到目标窗口，确认到达前台后执行回调
+        
+        目标为空、已失效或切换失败时无法确认焦点，像原实现一样在面板隐藏后等待
+        LEGACY_HIDE_DELAY_MS 再执行；目标已在前台时不切换；
+        否则请求切换并轮询前台窗口，到达或超时后执行。
+        """
+        start_time = time.perf_counter()
+        backend = get_focus_backend()
+        
+        if not target or not backend.is_window_valid(target):
+            self._run_after_hide(callback)
+            return
+            
+        if backend.get_foreground_window() != target and not backend.activate_window(target):
+            print("[焦点] 切换到上一个窗口失败，等待面板隐藏后继续执行动作")
+            self._run_after_hide(callback)
+            return
+            
+        request = _FocusRequest(target, callback, action_type, start_time)
+        request.timer.setInterval(self.poll_interval_ms)
+        request.timer.timeout.connect(lambda: self._poll(request))
+        self._requests.append(request)
+        # 首次检查放到事件循环中，让面板的隐藏先完成
+        QTimer.singleShot(0, lambda: self._poll(request))
+        
+    def _poll(self, request: _FocusRequest):
+        """检查目标窗口是否已到达前台"""
+        if request not in self._requests:
+            return
+        elapsed_ms = (time.perf_counter() - request.start_time) * 1000
+        in_foreground = get_focus_backend().get_foreground_window() == request.target
+        if in_foreground or elapsed_ms >= self.timeout_ms:
+            request.timer.stop()
+            self._requests.remove(request)
+            if not in_foreground:
+                print(f"[焦点] 等待窗口到达前台超时（{self.timeout_ms} ms），继续执行动作")
+            self._finish(request.callback, request.action_type, request.start_time)
+        elif not request.timer.isActive():
+            request.timer.start()
+            
+    def _run_after_hide(self, callback: Callable[[], None]):
+        """没有切换窗口：等待面板隐藏生效后执行（不计入节省时间统计）"""
+        QTimer.singleShot(self.LEGACY_HIDE_DELAY_MS, callback)
+        
+    def _finish(self, callback: Callable[[], None], action_type: str, start_time: float):
+        """执行回调并记录与固定延时相比节省的时间"""
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        legacy_ms = self.LEGACY_HIDE_DELAY_MS + self.LEGACY_SWITCH_DELAY_MS
+        saved_ms = legacy_ms - elapsed_ms
+        
+        stats = self._stats.setdefault(action_type or "unknown", [0, 0.0])
+        stats[0] += 1
+        stats[1] += saved_ms
+        print(f"[性能] 焦点恢复 ({action_type or 'unknown'}): 等待 {elapsed_ms:.1f} ms，"
+              f"比固定延时节省 {saved_ms:.1f} ms（平均节省 {stats[1] / stats[0]:.1f} ms，共 {stats[0]} 次）")
+        callback()
+        
+    def get_saved_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """按动作类型返回节省时间统计"""
+        return {
+            action_type: {"count": count, "total_saved_ms": total, "average_saved_ms": total / count}
+            for action_type, (count, total) in self._stats.items() if count
+        }
+
+
+# 全局焦点恢复实例
+focus_restorer = FocusRestorer()
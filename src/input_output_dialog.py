@@ -55,6 +55,7 @@ class InputOutputActionDialog(QDialog):
             ("剪贴板内容", "clipboard"),
             ("鼠标选中文本", "selection"),
             ("手动输入", "manual"),
+            ("文件", "file"),
             ("无输入", "none")
         ]
         for text, value in input_options:
@@ -306,7 +307,7 @@ def process(input_text, input_source, output_target):
     
     Args:
         input_text (str): 输入的文本内容
-        input_source (str): 输入源 (clipboard/selection/manual/none)
+        input_source (str): 输入源 (clipboard/selection/manual/file/none)
         output_target (str): 输出目标 (text/url/clipboard/file/window)
     
     Returns:
@@ -0,0 +1,248 @@
+# 按键序列模块：把“模拟按键”动作的命令编译为操作列表，并以不阻塞事件循环的方式逐步执行
+from typing import Callable, List, Optional, Tuple
+from collections import OrderedDict
+import re
+from PySide6.QtCore import QTimer
+
+# 操作类型
+OP_PRESS = "press"  # 单个按键
+OP_HOTKEY = "hotkey"  # 组合键
+OP_WRITE = "write"  # 文本串
+OP_WAIT = "wait"  # 延时（毫秒）
+
+KeyOp = Tuple[str, object]
+
+_WAIT_PATTERN = re.compile(r"wait\(\s*(\d+)\s*\)$", re.IGNORECASE)
+_ESCAPES = {"n": "\n", "t": "\t", "\\": "\\", '"': '"', "'": "'"}
+
+_CACHE_SIZE = 256
+_compiled_cache: "OrderedDict[str, List[KeyOp]]" = OrderedDict()  # 命令文本 -> 操作列表
+
+
+class KeySequenceError(ValueError):
+    """按键序列语法错误"""
+    
+    def __init__(self, message: str, position: int):
+        super().__init__(f"第 {position + 1} 个字符处: {message}")
+        self.position = position
+
+
+def _get_known_keys() -> Optional[set]:
+    """获取pyautogui支持的按键名，不可用时返回None（只做语法检查）"""
+    try:
+        import pyautogui
+        return set(pyautogui.KEYBOARD_KEYS)
+    except Exception:
+        return None
+
+
+def _split_items(command: str) -> List[Tuple[str, int]]:
+    """按逗号或换行分割序列（引号内的逗号不分割），返回（原始片段，起始位置）"""
+    items = []
+    start = 0
+    quote = None
+    index = 0
+    while index < len(command):
+        char = command[index]
+        if quote:
+            if char == "\\":
+                index += 1
+            elif char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char in ",\n":
+            items.append((command[start:index], start))
+            start = index + 1
+        index += 1
+    if quote:
+        raise KeySequenceError("引号没有闭合", len(command) - 1)
+    items.append((command[start:], start))
+    return items
+
+
+def _parse_text(item: str, position: int) -> str:
+    """解析引号包围的文本串，支持 \\n \\t \\\\ \\" \\' 转义"""
+    quote = item[0]
+    if len(item) < 2 or item[-1] != quote:
+        raise KeySequenceError("文本串必须以同一种引号结尾", position)
+    chars = []
+    index = 1
+    while index < len(item) - 1:
+        char = item[index]
+        if char == "\\" and index + 1 < len(item) - 1:
+            index += 1
+            chars.append(_ESCAPES.get(item[index], "\\" + item[index]))
+        elif char == quote:
+            raise KeySequenceError("文本串中的引号需要用 \\ 转义", position + index)
+        else:
+            chars.append(char)
+        index += 1
+    return "".join(chars)
+
+
+def _parse_keys(item: str, position: int, known_keys: Optional[set]) -> List[str]:
+    """解析单个按键或组合键（“+”本身用 ctrl++ 的形式表示）"""
+    if item == "+":
+        keys = ["+"]
+    elif item.endswith("++"):
+        keys = [key.strip() for key in item[:-2].split("+")] + ["+"]
+    else:
+        keys = [key.strip() for key in item.split("+")]
+        
+    keys = [key.lower() if len(key) > 1 else key for key in keys]
+    for key in keys:
+        if not key:
+            raise KeySequenceError(f"组合键 '{item}' 中有空的按键", position)
+        if " " in key:
+            raise KeySequenceError(f"按键 '{key}' 不能包含空格，文本请用引号包围", position)
+        if known_keys is not None and key not in known_keys and key.lower() not in known_keys:
+            raise KeySequenceError(f"未知的按键 '{key}'", position)
+    return keys
+
+
+def compile_key_sequence(command: str, check_key_names: bool = True) -> List[KeyOp]:
+    """把按键序列编译为操作列表
+    
+    支持的格式（逗号或换行分隔）：
+    组合键 ctrl+c、单个按键 f5、文本串 "hello, world"、延时 wait(500)
+    """
+    known_keys = _get_known_keys() if check_key_names else None
+    ops: List[KeyOp] = []
+    for raw_item, start in _split_items(command):
+        item = raw_item.strip()
+        if not item:
+            continue
+        position = start + raw_item.index(item[0])
+        
+        if item[0] in "\"'":
+            ops.append((OP_WRITE, _parse_text(item, position)))
+            continue
+            
+        if item.lower().startswith("wait("):
+            match = _WAIT_PATTERN.match(item)
+            if not match:
+                raise KeySequenceError(f"延时格式错误: {item}，应为 wait(毫秒数)", position)
+            ops.append((OP_WAIT, int(match.group(1))))
+            continue
+            
+        keys = _parse_keys(item, position, known_keys)
+        if len(keys) == 1:
+            ops.append((OP_PRESS, keys[0]))
+        else:
+            ops.append((OP_HOTKEY, tuple(keys)))
+            
+    if not ops:
+        raise KeySequenceError("按键序列为空", 0)
+    return ops
+
+
+def validate_key_sequence(command: str) -> Optional[str]:
+    """校验按键序列，合法时返回None，否则返回错误信息"""
+    try:
+        compile_key_sequence(command)
+        return None
+    except KeySequenceError as e:
+        return str(e)
+
+
+def get_compiled_sequence(command: str) -> List[KeyOp]:
+    """获取编译后的操作列表（按命令文本缓存：哈希相同的不同命令不会互相命中，
+    不同动作或组合步骤中相同的命令共用一份）"""
+    ops = _compiled_cache.get(command)
+    if ops is not None:
+        _compiled_cache.move_to_end(command)
+        return ops
+        
+    ops = compile_key_sequence(command)
+    _compiled_cache[command] = ops
+    if len(_compiled_cache) > _CACHE_SIZE:
+        _compiled_cache.popitem(last=False)
+    return ops
+
+
+class KeySequenceRunner:
+    """按步骤执行操作列表：按键在工作线程执行，遇到延时时交给QTimer，不阻塞事件循环"""
+    
+    _running: List["KeySequenceRunner"] = []  # 保持运行中实例的引用
+    
+    def __init__(self, ops: List[KeyOp], on_error: Optional[Callable[[Exception], None]] = None,
+                 on_finished: Optional[Callable[[], None]] = None):
+        self.ops = ops
+        self.on_error = on_error
+        self.on_finished = on_finished
+        self._index = 0
+        
+    def start(self):
+        """开始执行"""
+        KeySequenceRunner._running.append(self)
+        self._run_steps()
+        
+    def _run_steps(self):
+        """执行到下一个延时或结束
+        
+        连续的按键、组合键和逐字输入合并为一个任务交给执行服务的工作线程，
+        需要剪贴板的粘贴在界面线程排队执行（粘贴快捷键发出后再继续），延时交给QTimer。
+        """
+        from .text_injection import text_injector
+        batch = []
+        while self._index < len(self.ops):
+            op, value = self.ops[self._index]
+            if op == OP_WAIT:
+                if batch:
+                    break
+                self._index += 1
+                QTimer.singleShot(value, self._run_steps)
+                return
+            if op == OP_WRITE and text_injector.choose_strategy(value) == text_injector.STRATEGY_PASTE:
+                if batch:
+                    break
+                self._index += 1
+                try:
+                    text_injector.inject(
+                        value, on_done=self._run_steps,
+                        on_error=lambda message: self._fail(RuntimeError(message))
+                    )
+                except Exception as e:
+                    self._fail(e)
+                return
+            batch.append((op, value))
+            self._index += 1
+            
+        if not batch:
+            self._finish()
+            if self.on_finished:
+                self.on_finished()
+            return
+            
+        from .action_executor import action_executor
+        action_executor.submit(
+            "key", self._run_batch, batch,
+            on_success=lambda result: self._run_steps(),
+            on_error=lambda message: self._fail(RuntimeError(message))
+        )
+        
+    def _run_batch(self, batch: List[KeyOp]):
+        """工作线程中执行一批按键操作"""
+        import pyautogui
+        from .text_injection import text_injector
+        for op, value in batch:
+            if op == OP_PRESS:
+                pyautogui.press(value)
+            elif op == OP_HOTKEY:
+                pyautogui.hotkey(*value)
+            elif op == OP_WRITE:
+                text_injector.type_text(value)
+                
+    def _fail(self, error: Exception):
+        """执行失败"""
+        self._finish()
+        if self.on_error:
+            self.on_error(error)
+        else:
+            print(f"模拟按键失败：{error}")
+            
+    def _finish(self):
+        """执行结束，释放引用"""
+        if self in KeySequenceRunner._running:
+            KeySequenceRunner._running.remove(self)
@@ -0,0 +1,211 @@
+# 大输入模块（不依赖Qt）：大段文本以文件的形式交给脚本，脚本进程通过内存映射按需读取
+from typing import Iterator, Optional, Union
+from pathlib import Path
+import codecs
+import mmap
+import os
+import tempfile
+
+ENCODING = "utf-8"
+# 逐行读取时每次解码的字节数（在换行处截断），内存占用与文件大小无关
+LINE_BLOCK_SIZE = 1024 * 1024
+
+# 脚本进程的地址空间上限（字节，0为未限制）和当前映射的字节数
+_address_space_limit = 0
+_mapped_bytes = 0
+
+
+def set_address_space_limit(limit: int):
+    """记录脚本进程设置的 RLIMIT_AS 软限制（由 script_worker 调用）
+    
+    内存映射占用地址空间，大文件映射会超出限制而失败；映射期间按文件大小临时放宽软限制，
+    关闭映射后恢复，脚本自身分配的内存仍受原限制约束。
+    """
+    global _address_space_limit
+    _address_space_limit = limit
+
+
+def _reserve_address_space(size: int):
+    """映射前后调整地址空间软限制（size 为负数时归还）"""
+    global _mapped_bytes
+    _mapped_bytes += size
+    if not _address_space_limit:
+        return
+    import resource
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    soft = _address_space_limit + _mapped_bytes
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+class FileInput:
+    """文件形式的输入（在界面、执行服务和脚本进程之间只传递路径）
+    
+    temporary 为 True 时是从剪贴板等输入溢出的临时文件，脚本执行结束后由 release 删除。
+    """
+    
+    __slots__ = ("path", "size", "temporary")
+    
+    def __init__(self, path: Union[str, Path], temporary: bool = False):
+        self.path = str(path)
+        self.size = os.path.getsize(self.path)
+        self.temporary = temporary
+        
+    def read_text(self) -> str:
+        """读取完整文本（供没有声明 LARGE_INPUT 的脚本使用）"""
+        return decode(Path(self.path).read_bytes())
+        
+    def release(self):
+        """删除临时文件（Windows 上文件仍被映射时删除失败，留给系统临时目录清理）"""
+        if not self.temporary:
+            return
+        try:
+            os.remove(self.path)
+        except OSError as e:
+            print(f"[大输入] 删除临时文件失败: {e}")
+            
+    def __repr__(self):
+        return f"FileInput({self.path!r}, {self.size} 字节)"
+
+
+def decode(data: bytes) -> str:
+    """按UTF-8解码（去掉BOM，无法解码的字节替换为 U+FFFD）"""
+    if data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8):]
+    return data.decode(ENCODING, errors="replace")
+
+
+class MappedInput:
+    """声明 LARGE_INPUT = True 的脚本收到的输入：内存映射的文件，按需解码
+    
+    for line in input_text: 逐行读取（不含换行符），只解码当前行
+    input_text.text 或 str(input_text): 完整文本（首次访问时解码）
+    input_text.size: 字节数；input_text.path: 文件路径；空输入时为假值
+    """
+    
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        self._text: Optional[str] = None
+        self._reserved = 0
+        with open(self.path, "rb") as file:
+            self.size = os.fstat(file.fileno()).st_size
+            # 空文件不能映射
+            self._map = None
+            if self.size:
+                _reserve_address_space(self.size)
+                self._reserved = self.size
+                try:
+                    self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                except BaseException:
+                    self._release_reservation()
+                    raise
+        self._start = len(codecs.BOM_UTF8) if self._map is not None and self._map[:3] == codecs.BOM_UTF8 else 0
+        
+    def __iter__(self) -> Iterator[str]:
+        return self.lines()
+        
+    def lines(self) -> Iterator[str]:
+        """逐行产出文本（不含 \\n 和 \\r\\n）
+        
+        按 LINE_BLOCK_SIZE 分块解码再拆分，比逐行解码快，同一时间只有一块在内存中。
+        """
+        data = self._map
+        if data is None:
+            return
+        position = self._start
+        end = len(data)
+        while position < end:
+            cut = end
+            if position + LINE_BLOCK_SIZE < end:
+                cut = data.rfind(b"\n", position, position + LINE_BLOCK_SIZE)
+                if cut < 0:
+                    # 单行超过一块
+                    cut = data.find(b"\n", position + LINE_BLOCK_SIZE)
+                    if cut < 0:
+                        cut = end
+            lines = data[position:cut].decode(ENCODING, errors="replace").split("\n")
+            if cut == end and data[end - 1] == 0x0A:
+                # 文件以换行结尾，不产出最后的空行
+                lines.pop()
+            for line in lines:
+                yield line[:-1] if line.endswith("\r") else line
+            position = cut + 1
+            
+    def read_bytes(self, start: int = 0, size: int = -1) -> bytes:
+        """读取原始字节（不解码，适合自行分块处理）"""
+        if self._map is None:
+            return b""
+        end = len(self._map) if size < 0 else start + size
+        return self._map[start:end]
+        
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = decode(self._map[:]) if self._map is not None else ""
+        return self._text
+        
+    def __str__(self):
+        return self.text
+        
+    def __bool__(self):
+        return self.size > self._start
+        
+    def close(self):
+        """解除映射（脚本执行结束后自动调用）"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._release_reservation()
+        
+    def _release_reservation(self):
+        if self._reserved:
+            _reserve_address_space(-self._reserved)
+            self._reserved = 0
+            
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+        
+    def __repr__(self):
+        return f"MappedInput({self.path!r}, {self.size} 字节)"
+
+
+def prepare_input(value, large_input: bool):
+    """把输入转换为脚本收到的 input_text：FileInput 对声明 LARGE_INPUT 的脚本映射为 MappedInput，
+    对其他脚本读取为完整文本；普通文本原样返回"""
+    if not isinstance(value, FileInput):
+        return value
+    return MappedInput(value.path) if large_input else value.read_text()
+
+
+def close_input(value):
+    """脚本执行结束后关闭 prepare_input 创建的映射"""
+    if isinstance(value, MappedInput):
+        value.close()
+
+
+def spill_text(text: str, threshold_kb: int) -> Union[str, FileInput]:
+    """文本达到 threshold_kb 时写入临时文件并返回 FileInput，否则原样返回（threshold_kb 为0时不溢出）"""
+    if not threshold_kb or not isinstance(text, str) or len(text) < threshold_kb * 1024:
+        return text
+    fd, path = tempfile.mkstemp(prefix="quicker_input_", suffix=".txt")
+    with os.fdopen(fd, "wb") as file:
+        file.write(text.encode(ENCODING, errors="surrogatepass"))
+    return FileInput(path, temporary=True)
+
+
+def input_size(value) -> int:
+    """输入大小（文本为字符数，文件为字节数），用于运行统计"""
+    if isinstance(value, (FileInput, MappedInput)):
+        return value.size
+    return len(value or "")
+
+
+def release_input(value):
+    """删除输入溢出的临时文件"""
+    if isinstance(value, FileInput):
+        value.release()
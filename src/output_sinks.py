@@ -0,0 +1,219 @@
+# 输出目标模块：逐块接收输入输出脚本的流式输出
+from typing import Callable, List, Optional
+import threading
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtWidgets import QApplication
+
+
+class OutputSink:
+    """输出目标（在界面线程中调用）"""
+    
+    def write(self, chunk: str):
+        """接收一块输出"""
+        
+    def close(self):
+        """输出正常结束"""
+        
+    def abort(self, message: str):
+        """输出因出错或取消而中止"""
+
+
+class TextOutputSink(OutputSink):
+    """发送文本：合并到达的各块，定时或达到字符数时通过文本注入队列输入到当前窗口
+    
+    每块单独注入时，每次粘贴都要等待目标程序读取剪贴板，细碎的输出会排起很长的队；
+    合并后粘贴次数随时间而不是块数增长。上一次粘贴还没被读取时继续合并，不提前输入。
+    """
+    
+    def __init__(self):
+        from .config_manager import config_manager
+        self.flush_ms = config_manager.get("text_injection.stream_flush_ms", 100)
+        self.flush_chars = config_manager.get("text_injection.stream_flush_chars", 4096)
+        self._chunks: List[str] = []
+        self._size = 0
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timer)
+        
+    def write(self, chunk: str):
+        if not chunk:
+            return
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+        if self._size >= self.flush_chars:
+            self.flush()
+        elif not self._timer.isActive():
+            self._timer.start(self.flush_ms)
+            
+    def _on_timer(self):
+        from .text_injection import text_injector
+        if text_injector.busy:
+            # 上一次粘贴还在等待读取，继续合并
+            self._timer.start(self.flush_ms)
+            return
+        self.flush()
+        
+    def flush(self):
+        """立即输入已合并的文本"""
+        from .text_injection import text_injector
+        self._timer.stop()
+        if not self._chunks:
+            return
+        text = "".join(self._chunks)
+        self._chunks = []
+        self._size = 0
+        text_injector.inject(text, on_error=lambda message: print(f"发送文本失败: {message}"))
+        
+    def close(self):
+        self.flush()
+        
+    def abort(self, message: str):
+        # 已经产生的输出照常输入，与其他输出目标保留已写入部分一致
+        self.flush()
+
+
+class ClipboardOutputSink(OutputSink):
+    """复制到剪贴板：剪贴板只能整体设置，各块先收集，结束时一次写入"""
+    
+    def __init__(self):
+        self._chunks: List[str] = []
+        
+    def write(self, chunk: str):
+        self._chunks.append(chunk)
+        
+    def close(self):
+        QApplication.clipboard().setText("".join(self._chunks))
+
+
+class UrlOutputSink(ClipboardOutputSink):
+    """打开网址：需要完整的网址，结束时打开"""
+    
+    def __init__(self, panel):
+        super().__init__()
+        self.panel = panel
+        
+    def close(self):
+        self.panel._execute_open_url("".join(self._chunks).strip())
+
+
+class FileOutputSink(OutputSink):
+    """保存到文件：各块交给后台写入线程，界面线程不等待磁盘"""
+    
+    def __init__(self):
+        from .file_output import file_output_writer
+        self._output = file_output_writer.open()
+        
+    def write(self, chunk: str):
+        self._output.write(chunk)
+        
+    def close(self):
+        self._output.close()
+        
+    def abort(self, message: str):
+        self._output.abort(message)
+
+
+class WindowOutputSink(OutputSink):
+    """显示窗口：非模态窗口实时追加输出，提供取消按钮"""
+    
+    def __init__(self, panel, job):
+        from .action_panel import SilentInfoDialog
+        self.dialog = SilentInfoDialog("输入输出结果", "", panel, streaming=True)
+        self.dialog.cancel_requested.connect(job.cancel)
+        self.dialog.show()
+        
+    def write(self, chunk: str):
+        self.dialog.append_text(chunk)
+        
+    def close(self):
+        self.dialog.set_finished()
+        
+    def abort(self, message: str):
+        self.dialog.set_finished(message)
+
+
+def create_output_sink(output_target: str, panel, job) -> Optional[OutputSink]:
+    """按输出目标创建流式输出目标"""
+    if output_target == "text":
+        return TextOutputSink()
+    if output_target == "clipboard":
+        return ClipboardOutputSink()
+    if output_target == "url":
+        return UrlOutputSink(panel)
+    if output_target == "file":
+        return FileOutputSink()
+    if output_target == "window":
+        return WindowOutputSink(panel, job)
+    return None
+
+
+class ChunkChannel(QObject):
+    """把工作线程收到的输出块交给界面线程的输出目标
+    
+    最多 max_pending 块在途，超过时生产方（执行服务的工作线程）阻塞等待，
+    再经由脚本进程池的有界队列和管道把背压传回脚本进程。
+    输出目标在第一块到达时才创建，没有流式输出的脚本不受影响。
+    """
+    
+    _chunk_ready = Signal(str)
+    
+    def __init__(self, sink_factory: Callable[[], Optional[OutputSink]], job, max_pending: int = 8,
+                 on_open: Optional[Callable[[OutputSink], None]] = None, parent=None):
+        super().__init__(parent)
+        self.sink_factory = sink_factory
+        self.job = job
+        self.on_open = on_open
+        self.sink: Optional[OutputSink] = None
+        self.chunk_count = 0
+        self._slots = threading.Semaphore(max_pending)
+        self._failed = False
+        self._chunk_ready.connect(self._on_chunk)
+        
+    def put(self, chunk: str):
+        """生产方调用：在途块数达到上限时阻塞，期间被取消则抛出异常"""
+        from .script_worker_pool import ScriptCancelledError
+        while not self._slots.acquire(timeout=0.05):
+            if self.job.cancelled:
+                raise ScriptCancelledError("脚本已取消")
+        if self.job.cancelled:
+            raise ScriptCancelledError("脚本已取消")
+        self._chunk_ready.emit(chunk)
+        
+    def _on_chunk(self, chunk: str):
+        """界面线程：写入输出目标"""
+        try:
+            if self._failed:
+                return
+            if self.sink is None:
+                self.sink = self.sink_factory()
+                if self.sink is None:
+                    raise ValueError("该输出目标不支持流式输出")
+                if self.on_open:
+                    self.on_open(self.sink)
+            self.sink.write(chunk)
+            self.chunk_count += 1
+        except Exception as e:
+            # 输出目标出错时取消脚本，避免继续产生输出
+            print(f"处理输出失败: {e}")
+            self._failed = True
+            self.job.cancel()
+        finally:
+            self._slots.release()
+            
+    @property
+    def opened(self) -> bool:
+        return self.sink is not None
+        
+    def close(self):
+        """脚本正常结束"""
+        if self.sink is None:
+            return
+        if self._failed:
+            self.sink.abort("处理输出失败")
+        else:
+            self.sink.close()
+            
+    def abort(self, message: str):
+        """脚本出错或取消"""
+        if self.sink is not None:
+            self.sink.abort(message)
@@ -0,0 +1,171 @@
+# Python 语法高亮模块：用于脚本编辑器，按文本块增量高亮并标记检查出的问题
+from typing import Dict, List, Optional, Tuple
+import builtins
+import keyword
+import re
+from PySide6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont, QTextDocument
+
+# 块状态：-1（未设置）和0为普通代码，其余为未结束的三引号字符串
+STATE_NORMAL = 0
+STATE_SINGLE_TRIPLE = 1
+STATE_DOUBLE_TRIPLE = 2
+_TRIPLE_QUOTES = {STATE_SINGLE_TRIPLE: "'''", STATE_DOUBLE_TRIPLE: '"""'}
+
+_KEYWORDS = frozenset(keyword.kwlist + getattr(keyword, "softkwlist", []))
+_BUILTINS = frozenset(name for name in dir(builtins) if not name.startswith("_"))
+_TOKEN_PATTERN = re.compile(r"""
+    (?P<comment>\#.*)
+  | (?P<string>(?i:[rbuf]{0,2})(?:'''|\"\"\"|'(?:\\.|[^'\\])*'?|"(?:\\.|[^"\\])*"?))
+  | (?P<decorator>@[\w.]+)
+  | (?P<number>\b(?:0[xob][\da-f_]+|\d[\d_]*\.?[\d_]*(?:e[+-]?\d+)?j?|\.\d[\d_]*(?:e[+-]?\d+)?j?)\b)
+  | (?P<word>[^\W\d]\w*)
+""", re.VERBOSE | re.IGNORECASE)
+
+
+def _format(color: str, bold: bool = False, italic: bool = False) -> QTextCharFormat:
+    text_format = QTextCharFormat()
+    text_format.setForeground(QColor(color))
+    if bold:
+        text_format.setFontWeight(QFont.Weight.Bold)
+    if italic:
+        text_format.setFontItalic(True)
+    return text_format
+
+
+class PythonHighlighter(QSyntaxHighlighter):
+    """Python 语法高亮
+    
+    QSyntaxHighlighter 只重新高亮修改过的块；块状态记录该行结束时是否在三引号字符串中，
+    状态不变时后面的块不会重新高亮，因此在长脚本中编辑也只处理受影响的几行。
+    set_problems 标记检查出的问题行（错误为红色波浪线，警告为橙色），只重新高亮变化的行。
+    """
+    
+    def __init__(self, document: QTextDocument):
+        super().__init__(document)
+        self.formats = {
+            "keyword": _format("#0033b3", bold=True),
+            "builtin": _format("#000080"),
+            "self": _format("#94558d", italic=True),
+            "definition": _format("#00627a", bold=True),
+            "string": _format("#067d17"),
+            "comment": _format("#8c8c8c", italic=True),
+            "decorator": _format("#9e880d"),
+            "number": _format("#1750eb"),
+        }
+        self._problems: Dict[int, Tuple[bool, str]] = {}  # 行号(从0开始) -> (是否错误, 信息)
+        
+    def set_problems(self, problems: List[Tuple[int, bool, str]]):
+        """设置问题行 [(行号(从1开始), 是否错误, 信息)]"""
+        new_problems: Dict[int, Tuple[bool, str]] = {}
+        for line, is_error, message in problems:
+            # 同一行有错误时只显示错误
+            if line - 1 not in new_problems or is_error:
+                new_problems[line - 1] = (is_error, message)
+        changed = {line for line in set(self._problems) | set(new_problems)
+                   if self._problems.get(line) != new_problems.get(line)}
+        self._problems = new_problems
+        document = self.document()
+        for line in changed:
+            block = document.findBlockByNumber(line)
+            if block.isValid():
+                self.rehighlightBlock(block)
+                
+    def problem_at(self, line: int) -> Optional[str]:
+        """行号(从1开始)对应的问题信息"""
+        problem = self._problems.get(line - 1)
+        return problem[1] if problem else None
+        
+    def highlightBlock(self, text: str):
+        offsets = _utf16_offsets(text)
+        position = 0
+        previous_state = self.previousBlockState()
+        if previous_state in _TRIPLE_QUOTES:
+            position = self._continue_string(text, 0, _TRIPLE_QUOTES[previous_state], previous_state, offsets)
+            if position < 0:
+                self._mark_problem(text)
+                return
+        self.setCurrentBlockState(STATE_NORMAL)
+        
+        after_definition = False
+        while True:
+            match = _TOKEN_PATTERN.search(text, position)
+            if match is None:
+                break
+            kind = match.lastgroup
+            start, end = match.span()
+            position = end
+            if kind == "string":
+                quote = match.group().lstrip("rbufRBUF")[:3]
+                if quote in ("'''", '"""'):
+                    state = STATE_SINGLE_TRIPLE if quote == "'''" else STATE_DOUBLE_TRIPLE
+                    position = self._continue_string(text, start, quote, state, offsets, end)
+                    if position < 0:
+                        break
+                    continue
+            elif kind == "word":
+                word = match.group()
+                if after_definition:
+                    kind = "definition"
+                elif word in _KEYWORDS:
+                    kind = "keyword"
+                elif word == "self" or word == "cls":
+                    kind = "self"
+                elif word in _BUILTINS:
+                    kind = "builtin"
+                else:
+                    continue
+                after_definition = word in ("def", "class")
+            self._set_format(offsets, start, end, self.formats[kind])
+        self._mark_problem(text)
+        
+    def _continue_string(self, text: str, start: int, quote: str, state: int,
+                         offsets: Optional[List[int]], search_from: Optional[int] = None) -> int:
+        """高亮从 start 开始的三引号字符串，返回字符串之后的位置；到行尾仍未结束时返回-1"""
+        index = start if search_from is None else search_from
+        while True:
+            close = text.find(quote, index)
+            if close < 0:
+                self._set_format(offsets, start, len(text), self.formats["string"])
+                self.setCurrentBlockState(state)
+                return -1
+            # 跳过转义的引号
+            backslashes = 0
+            while close - backslashes - 1 >= 0 and text[close - backslashes - 1] == "\\":
+                backslashes += 1
+            if backslashes % 2 == 0:
+                break
+            index = close + 1
+        end = close + len(quote)
+        self._set_format(offsets, start, end, self.formats["string"])
+        return end
+        
+    def _set_format(self, offsets: Optional[List[int]], start: int, end: int, text_format: QTextCharFormat):
+        if offsets is not None:
+            start, end = offsets[start], offsets[end]
+        self.setFormat(start, end - start, text_format)
+        
+    def _mark_problem(self, text: str):
+        """给问题行加波浪下划线（保留原有颜色）"""
+        problem = self._problems.get(self.currentBlock().blockNumber())
+        if problem is None:
+            return
+        if not text.strip():
+            return
+        color = QColor("#dc3545" if problem[0] else "#fd7e14")
+        offsets = _utf16_offsets(text)
+        length = offsets[-1] if offsets is not None else len(text)
+        for index in range(length):
+            text_format = QTextCharFormat(self.format(index))
+            text_format.setUnderlineStyle(QTextCharFormat.UnderlineStyle.WaveUnderline)
+            text_format.setUnderlineColor(color)
+            self.setFormat(index, 1, text_format)
+
+
+def _utf16_offsets(text: str) -> Optional[List[int]]:
+    """Python 字符位置 -> Qt（UTF-16）位置；文本中没有BMP以外的字符时返回None"""
+    if text.isascii() or not any(ord(char) > 0xFFFF for char in text):
+        return None
+    offsets = [0]
+    for char in text:
+        offsets.append(offsets[-1] + (2 if ord(char) > 0xFFFF else 1))
+    return offsets
@@ -633,17 +633,13 @@ class QuickSendPanel(QDialog):
             
     def _paste_to_previous_window(self):
         """切换到上一个窗口并执行粘贴"""
-        # 隐藏面板并切换到上一个窗口
+        from .focus_restore import focus_restorer
+        # 隐藏面板，上一个窗口确认回到前台后再粘贴
         self.hide()
-        QTimer.singleShot(100, lambda: self._switch_and_paste())
+        floating_button = self._get_floating_button()
+        last_window = getattr(floating_button, 'last_foreground_window', None) if floating_button else None
+        focus_restorer.restore(last_window, self._execute_paste, "quick_send")
         
-    def _switch_and_paste(self):
-        """切换窗口并执行粘贴"""
-        if self._switch_to_previous_window():
-            QTimer.singleShot(200, lambda: self._execute_paste())
-        else:
-            self._execute_paste()
-            
     def _execute_paste(self):
         """执行粘贴操作"""
         try:
@@ -655,37 +651,6 @@ class QuickSendPanel(QDialog):
         except Exception as e:
             print(f"粘贴失败: {e}")
         # 注意：不要在这里重新显示面板，保持目标窗口的焦点
-            
-    def _switch_to_previous_window(self) -> bool:
-        """切换到上一个活动窗口"""
-        # 获取浮动按钮的上一个活动窗口
-        floating_button = self._get_floating_button()
-        if not floating_button:
-            return False
-            
-        last_window = getattr(floating_button, 'last_foreground_window', None)
-        if not last_window:
-            return False
-            
-        # Windows平台特定代码
-        import sys
-        if sys.platform == "win32":
-            try:
-                import win32gui
-                import win32con
-                
-                # 检查窗口句柄是否仍然有效
-                if win32gui.IsWindow(last_window):
-                    # 如果被最小化则恢复
-                    if win32gui.IsIconic(last_window):
-                        win32gui.ShowWindow(last_window, win32con.SW_RESTORE)
-                    # 设置为前台窗口
-                    win32gui.SetForegroundWindow(last_window)
-                    return True
-            except Exception as e:
-                print(f"切换窗口失败: {e}")
-                
-        return False
         
     def _get_floating_button(self):
         """获取浮动按钮实例"""
@@ -700,39 +665,27 @@ class QuickSendPanel(QDialog):
         
     def _store_current_foreground_window(self):
         """在面板创建时存储当前的前台窗口"""
-        import sys
-        if sys.platform == "win32":
-            try:
-                import win32gui
-                hwnd = win32gui.GetForegroundWindow()
-                
-                # 检查是否是外部窗口（非应用内的对话框）
-                window_title = win32gui.GetWindowText(hwnd)
-                app_dialog_titles = [
-                    "快捷发送面板",
-                    "数据面板",
-                    "编辑动作",
-                    "新增动作",
-                    "输入输出动作",
-                    "脚本编辑器",
-                    "图标选择",
-                    "Quicker",
-                    "关于"
-                ]
-                
-                is_app_dialog = any(title in window_title for title in app_dialog_titles)
+        from .focus_restore import get_focus_backend, is_app_window_title
+        backend = get_focus_backend()
+        try:
+            window = backend.get_foreground_window()
+            if not window:
+                return
                 
-                if (win32gui.IsWindowVisible(hwnd) and 
-                    window_title != "" and
-                    not is_app_dialog):
-                    # 直接设置浮动按钮的last_foreground_window
-                    floating_button = self._get_floating_button()
-                    if floating_button:
-                        setattr(floating_button, 'last_foreground_window', hwnd)
-                        print(f"[DEBUG] 在快捷发送面板创建时记录前台窗口: {window_title} (hwnd: {hwnd})")
-                        
-            except Exception as e:
-                print(f"存储前台窗口失败: {e}")
+            # 检查是否是外部窗口（非应用内的对话框）
+            window_title = backend.get_window_title(window)
+            
+            if (backend.is_window_valid(window) and 
+                window_title != "" and
+                not is_app_window_title(window_title)):
+                # 直接设置浮动按钮的last_foreground_window
+                floating_button = self._get_floating_button()
+                if floating_button:
+                    setattr(floating_button, 'last_foreground_window', window)
+                    print(f"[DEBUG] 在快捷发送面板创建时记录前台窗口: {window_title} (window: {window})")
+                    
+        except Exception as e:
+            print(f"存储前台窗口失败: {e}")
         
     def _update_floating_button_last_window(self):
         """更新浮动按钮的前台窗口记录"""
@@ -4,9 +4,74 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QPlainTextEdit, QMessageBox, QFileDialog
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QObject, QTimer, Signal
+from PySide6.QtGui import QFont, QTextCursor
+import html
 import os
+import threading
+import time
+
+
+class ScriptLinter(QObject):
+    """后台脚本检查：只检查最新提交的文本，结果通过 finished 回到界面线程
+    
+    检查在一个常驻线程中进行，检查过程中再次提交的文本会覆盖等待中的文本，
+    因此连续输入时不会积压检查任务。达到 subprocess_lines 行的脚本在子进程中解析（见 lint_in_subprocess）。
+    """
+    
+    finished = Signal(int, list)  # 提交序号、问题列表
+    
+    def __init__(self, subprocess_lines: int = 2000, parent=None):
+        super().__init__(parent)
+        self.subprocess_lines = subprocess_lines
+        self._condition = threading.Condition()
+        self._pending = None
+        self._generation = 0
+        self._stopped = False
+        self._thread = None
+        
+    def check(self, source: str) -> int:
+        """提交文本，返回提交序号"""
+        with self._condition:
+            self._generation += 1
+            self._pending = (self._generation, source)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ScriptLinter", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+            return self._generation
+            
+    def _run(self):
+        from .script_lint import lint_source, lint_in_subprocess
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                generation, source = self._pending
+                self._pending = None
+            start_time = time.perf_counter()
+            line_count = source.count("\n") + 1
+            in_subprocess = bool(self.subprocess_lines) and line_count >= self.subprocess_lines
+            problems = lint_in_subprocess(source) if in_subprocess else lint_source(source)
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            print(f"[性能] 脚本检查: {line_count} 行，{elapsed_ms:.1f} ms{'（子进程）' if in_subprocess else ''}，"
+                  f"{len(problems)} 个问题")
+            with self._condition:
+                if self._stopped:
+                    return
+                self.finished.emit(generation, problems)
+                
+    def stop(self):
+        """停止检查线程（对话框关闭时调用）"""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+            
+    @property
+    def generation(self) -> int:
+        return self._generation
 
 
 class ScriptEditorDialog(QDialog):
@@ -69,11 +134,30 @@ class ScriptEditorDialog(QDialog):
             }
         """)
         
+        # Python 语法高亮（按块增量更新）
+        from .python_highlighter import PythonHighlighter
+        self.highlighter = PythonHighlighter(self.editor.document())
+        
         # 监听内容变化
         self.editor.textChanged.connect(self._on_content_changed)
         
         layout.addWidget(self.editor)
         
+        # 检查结果（停止输入一段时间后在后台检查语法和 process 函数）
+        self.lint_label = QLabel()
+        self.lint_label.setWordWrap(True)
+        self.lint_label.setTextFormat(Qt.TextFormat.RichText)
+        self.lint_label.linkActivated.connect(lambda line: self._goto_line(int(line)))
+        layout.addWidget(self.lint_label)
+        
+        from .config_manager import config_manager
+        self._lint_timer = QTimer(self)
+        self._lint_timer.setSingleShot(True)
+        self._lint_timer.setInterval(config_manager.get("script_editor.lint_delay_ms", 500))
+        self._lint_timer.timeout.connect(self._start_lint)
+        self._linter = ScriptLinter(config_manager.get("script_editor.lint_subprocess_lines", 2000), self)
+        self._linter.finished.connect(self._on_lint_finished)
+        
         # 按钮组
         button_layout = QHBoxLayout()
         
@@ -152,6 +236,7 @@ class ScriptEditorDialog(QDialog):
                     content = f.read()
                 self.editor.setPlainText(content)
                 self.content_changed = False
+                self._start_lint()
             else:
                 QMessageBox.warning(self, "错误", f"文件不存在: {self.script_path}")
         except Exception as e:
@@ -165,6 +250,42 @@ class ScriptEditorDialog(QDialog):
         if self.content_changed:
             title += " *"
         self.setWindowTitle(title)
+        self._lint_timer.start()
+        
+    def _start_lint(self):
+        """在后台检查当前文本"""
+        self._lint_timer.stop()
+        self._linter.check(self.editor.toPlainText())
+        
+    def _on_lint_finished(self, generation: int, problems: list):
+        """显示检查结果（检查期间文本又变化时丢弃旧结果）"""
+        if generation != self._linter.generation:
+            return
+        self.highlighter.set_problems([(problem.line, problem.is_error, problem.message) for problem in problems])
+        if not problems:
+            self.lint_label.setText('<span style="color: #28a745;">✓ 语法检查通过，已找到 process 函数</span>')
+            return
+        lines = []
+        for problem in problems:
+            color = "#dc3545" if problem.is_error else "#fd7e14"
+            lines.append(f'<a href="{problem.line}" style="color: {color};">第 {problem.line} 行</a>'
+                         f'<span style="color: {color};">: {html.escape(problem.message)}</span>')
+        self.lint_label.setText("<br>".join(lines))
+        
+    def _goto_line(self, line: int):
+        """跳转到指定行"""
+        block = self.editor.document().findBlockByNumber(line - 1)
+        if block.isValid():
+            cursor = QTextCursor(block)
+            self.editor.setTextCursor(cursor)
+            self.editor.centerCursor()
+            self.editor.setFocus()
+            
+    def done(self, result: int):
+        """关闭时停止检查线程"""
+        self._lint_timer.stop()
+        self._linter.stop()
+        super().done(result)
         
     def _save_content(self):
         """保存内容"""
@@ -0,0 +1,100 @@
+# 脚本检查模块（不依赖Qt）：用 ast 检查输入输出脚本的语法和 process 函数
+from typing import List
+from pathlib import Path
+import ast
+import json
+import subprocess
+import sys
+
+PROCESS_PARAMS = ("input_text", "input_source", "output_target")
+
+
+class LintProblem:
+    """一个检查结果（行号从1开始，列号从0开始）"""
+    
+    __slots__ = ("line", "column", "message", "is_error")
+    
+    def __init__(self, line: int, column: int, message: str, is_error: bool = True):
+        self.line = line
+        self.column = column
+        self.message = message
+        self.is_error = is_error
+        
+    def __repr__(self):
+        return f"LintProblem({self.line}, {self.column}, {self.message!r})"
+
+
+def lint_source(source: str) -> List[LintProblem]:
+    """检查脚本：语法错误为错误，缺少 process 或参数不能按 process(输入文本, 输入源, 输出目标) 调用为警告"""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError as e:
+        return [LintProblem(e.lineno or 1, max((e.offset or 1) - 1, 0), f"语法错误: {e.msg}")]
+    except ValueError as e:
+        # 源码中有空字符等
+        return [LintProblem(1, 0, f"无法解析: {e}")]
+        
+    process = None
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == "process":
+            process = node
+    if process is None:
+        signature = ", ".join(PROCESS_PARAMS)
+        return [LintProblem(1, 0, f"未找到 process 函数（需要在顶层定义 def process({signature})）", is_error=False)]
+        
+    problems = []
+    if isinstance(process, ast.AsyncFunctionDef):
+        problems.append(LintProblem(process.lineno, process.col_offset, "process 不能是 async 函数", is_error=False))
+    args = process.args
+    positional = len(args.posonlyargs) + len(args.args)
+    required = positional - len(args.defaults)
+    required_keywords = [arg.arg for arg, default in zip(args.kwonlyargs, args.kw_defaults) if default is None]
+    if positional < len(PROCESS_PARAMS) and args.vararg is None:
+        problems.append(LintProblem(
+            process.lineno, process.col_offset,
+            f"process 需要接收 {len(PROCESS_PARAMS)} 个参数 ({', '.join(PROCESS_PARAMS)})，当前只有 {positional} 个",
+            is_error=False
+        ))
+    elif required > len(PROCESS_PARAMS):
+        problems.append(LintProblem(
+            process.lineno, process.col_offset,
+            f"process 有 {required} 个必需参数，调用时只传入 {len(PROCESS_PARAMS)} 个", is_error=False
+        ))
+    if required_keywords:
+        problems.append(LintProblem(
+            process.lineno, process.col_offset,
+            f"process 的仅关键字参数需要默认值: {', '.join(required_keywords)}", is_error=False
+        ))
+    return problems
+
+
+def lint_in_subprocess(source: str, timeout: float = 10.0) -> List[LintProblem]:
+    """在子进程中检查
+    
+    ast.parse 执行期间一直持有GIL，上万行的脚本在界面进程的线程中解析会让界面卡顿约0.1秒，
+    放到子进程中则等待期间不占用GIL。子进程无法启动时在当前线程中检查。
+    """
+    kwargs = {}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-m", "src.script_lint"], input=source.encode("utf-8", "surrogatepass"),
+            capture_output=True, timeout=timeout, cwd=str(Path(__file__).resolve().parent.parent), **kwargs
+        )
+        rows = json.loads(completed.stdout.decode("utf-8"))
+    except (OSError, ValueError, subprocess.SubprocessError) as e:
+        print(f"[脚本检查] 子进程检查失败，改为在本进程中检查: {e}")
+        return lint_source(source)
+    return [LintProblem(*row) for row in rows]
+
+
+def main():
+    """子进程入口：从标准输入读取脚本，把检查结果以JSON写到标准输出"""
+    source = sys.stdin.buffer.read().decode("utf-8", "surrogatepass")
+    rows = [[problem.line, problem.column, problem.message, problem.is_error] for problem in lint_source(source)]
+    sys.stdout.buffer.write(json.dumps(rows, ensure_ascii=False).encode("utf-8"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+# 脚本加载模块：输入输出脚本只编译执行一次，缓存模块命名空间和 process 函数
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from collections.abc import Iterator as IteratorABC
+from pathlib import Path
+import cProfile
+import hashlib
+import io
+import pstats
+import threading
+import time
+
+
+class LoadedScript:
+    """已加载的脚本"""
+    
+    def __init__(self, path: Path, mtime_ns: int, size: int, digest: str,
+                 namespace: Dict[str, Any], process: Callable):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+        self.namespace = namespace
+        self.process = process
+        # 顶层声明 LARGE_INPUT = True 的脚本，文件输入以内存映射的 MappedInput 传入
+        self.large_input = bool(namespace.get("LARGE_INPUT", False))
+
+
+class ScriptLoader:
+    """输入输出脚本加载器
+    
+    按路径缓存编译执行后的模块命名空间，键为（路径、修改时间、文件大小），
+    修改时间变化但内容哈希不变时（如只是保存了一次）不重新执行，
+    因此脚本顶层的 import 等初始化只在首次加载和文件内容变化后执行。
+    """
+    
+    def __init__(self):
+        self._cache: Dict[Path, LoadedScript] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "loads": 0}
+        
+    def get_process(self, script_path: Path) -> Callable:
+        """获取脚本的 process 函数，文件变化时重新加载（可在工作线程中调用）"""
+        return self.get_script(script_path).process
+        
+    def get_script(self, script_path: Path) -> LoadedScript:
+        """获取已加载的脚本，文件变化时重新加载（可在工作线程中调用）"""
+        script_path = Path(script_path)
+        try:
+            stat = script_path.stat()
+        except FileNotFoundError:
+            self.invalidate(script_path)
+            raise FileNotFoundError(f"脚本文件不存在: {script_path}")
+            
+        with self._lock:
+            cached = self._cache.get(script_path)
+            if cached is not None and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+                self._stats["hits"] += 1
+                return cached
+                
+            source = script_path.read_bytes()
+            digest = hashlib.sha1(source).hexdigest()
+            if cached is not None and cached.digest == digest:
+                # 只有修改时间变化，内容相同
+                cached.mtime_ns = stat.st_mtime_ns
+                cached.size = stat.st_size
+                self._stats["hits"] += 1
+                return cached
+                
+            loaded = self._load(script_path, source, digest, stat.st_mtime_ns, stat.st_size)
+            self._cache[script_path] = loaded
+            return loaded
+            
+    def _load(self, script_path: Path, source: bytes, digest: str, mtime_ns: int, size: int) -> LoadedScript:
+        """编译并执行脚本顶层代码"""
+        start_time = time.perf_counter()
+        code = compile(source, str(script_path), "exec")
+        namespace: Dict[str, Any] = {
+            "__name__": f"quicker_script_{script_path.stem}",
+            "__file__": str(script_path),
+        }
+        exec(code, namespace)
+        
+        process = namespace.get("process")
+        if not callable(process):
+            raise ValueError("脚本中未找到process函数")
+            
+        self._stats["loads"] += 1
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        print(f"[性能] 加载脚本 {script_path.name}: 编译并执行顶层代码 {elapsed_ms:.1f} ms")
+        return LoadedScript(script_path, mtime_ns, size, digest, namespace, process)
+        
+    def invalidate(self, script_path: Optional[Path] = None):
+        """清除某个脚本（或全部脚本）的缓存"""
+        with self._lock:
+            if script_path is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(Path(script_path), None)
+                
+    def warm_up(self, script_paths: Iterable[Path]) -> int:
+        """预先加载脚本，返回成功加载的数量（加载失败只输出日志）"""
+        loaded = 0
+        for script_path in script_paths:
+            try:
+                self.get_process(script_path)
+                loaded += 1
+            except Exception as e:
+                print(f"[脚本] 预加载 {Path(script_path).name} 失败: {e}")
+        return loaded
+        
+    def get_stats(self) -> Dict[str, int]:
+        """获取缓存命中和加载次数"""
+        return dict(self._stats, cached=len(self._cache))
+
+
+class ScriptProfiler:
+    """测量一段脚本执行的CPU时间，启用时同时用 cProfile 记录调用耗时
+    
+    用法：with ScriptProfiler(profile) as profiler: ...，结束后读取 cpu_ms 和 profile_text。
+    CPU时间按当前线程计算，在脚本进程和本进程的工作线程中都只包含脚本自身的开销。
+    """
+    
+    def __init__(self, profile: bool = False, top: int = 25):
+        self.profile = profile
+        self.top = top
+        self.cpu_ms = 0.0
+        self.profile_text = ""
+        self._profiler: Optional[cProfile.Profile] = None
+        self._start_cpu = 0.0
+        
+    def __enter__(self):
+        if self.profile:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._start_cpu = time.thread_time()
+        return self
+        
+    def __exit__(self, *exc_info):
+        self.cpu_ms = (time.thread_time() - self._start_cpu) * 1000
+        if self._profiler is not None:
+            self._profiler.disable()
+            output = io.StringIO()
+            pstats.Stats(self._profiler, stream=output).sort_stats("cumulative").print_stats(self.top)
+            self.profile_text = output.getvalue()
+        return False
+
+
+def iter_output_chunks(result: Any) -> Optional[Iterator[str]]:
+    """process 返回生成器或迭代器时逐块产出文本（流式输出），返回普通值时返回None"""
+    if not isinstance(result, IteratorABC):
+        return None
+    return (str(chunk) for chunk in result if chunk is not None)
+
+
+def collect_script_files(actions: List[Dict[str, Any]]) -> List[str]:
+    """收集动作树中引用的脚本文件名（包括子页面、组合动作的步骤和脚本管道）"""
+    script_files = []
+    stack = list(actions)
+    while stack:
+        action = stack.pop()
+        if action.get("script_file"):
+            script_files.append(action["script_file"])
+        script_files.extend(action.get("scripts", []))
+        stack.extend(action.get("actions", []))
+        stack.extend(step for step in action.get("steps", []) if isinstance(step, dict))
+    return list(dict.fromkeys(script_files))
+
+
+# 全局脚本加载器
+script_loader = ScriptLoader()
@@ -0,0 +1,170 @@
+# 脚本结果缓存模块（不依赖Qt）：声明为纯函数的输入输出脚本，相同输入直接返回上次的结果
+from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from pathlib import Path
+import ast
+import hashlib
+import json
+import threading
+
+# 脚本在顶层写 PURE = True 表示结果只取决于输入（没有副作用、不读取时间/网络等）
+PURE_FLAG = "PURE"
+
+
+def is_pure_source(source: bytes) -> bool:
+    """静态检查脚本顶层是否有 PURE = True（不执行脚本）"""
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return False
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant) and node.value.value is True:
+            if any(isinstance(target, ast.Name) and target.id == PURE_FLAG for target in node.targets):
+                return True
+    return False
+
+
+class ScriptResultCache:
+    """纯脚本的结果缓存（LRU）
+    
+    键为（脚本内容哈希、输入文本哈希、输入源、输出目标），脚本修改后旧结果自然不再命中并逐渐被淘汰。
+    按结果文本的总大小淘汰最久未用的条目，超过单条上限的结果不缓存。
+    脚本是否为纯函数在本进程中静态检查，不需要加载脚本，因此也适用于在脚本进程中执行的情况。
+    persist_path 不为空时，启动后首次使用时读取，退出时写回。
+    """
+    
+    def __init__(self, max_bytes: int = 4 * 1024 * 1024, max_entry_bytes: int = 256 * 1024,
+                 persist_path: Optional[Path] = None):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self.persist_path = Path(persist_path) if persist_path else None
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+        # 脚本路径 -> (修改时间, 文件大小, 内容哈希, 是否纯函数)
+        self._scripts: Dict[Path, Tuple[int, int, str, bool]] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+        self._stats = {"hits": 0, "misses": 0}
+        
+    def make_key(self, script_path: Path, input_text: str, input_source: str, output_target: str) -> Optional[str]:
+        """生成缓存键，脚本不是纯函数（或不存在）时返回None"""
+        script_path = Path(script_path)
+        try:
+            stat = script_path.stat()
+        except OSError:
+            return None
+        with self._lock:
+            info = self._scripts.get(script_path)
+        if info is None or info[0] != stat.st_mtime_ns or info[1] != stat.st_size:
+            source = script_path.read_bytes()
+            info = (stat.st_mtime_ns, stat.st_size, hashlib.sha1(source).hexdigest(), is_pure_source(source))
+            with self._lock:
+                self._scripts[script_path] = info
+        if not info[3] or not isinstance(input_text, str):
+            # 文件输入（FileInput）不缓存
+            return None
+        input_digest = hashlib.sha1((input_text or "").encode("utf-8", "surrogatepass")).hexdigest()
+        return f"{info[2]}:{input_digest}:{input_source}:{output_target}"
+        
+    def get(self, key: str) -> Optional[str]:
+        """查找结果，命中时移到最近使用的位置"""
+        with self._lock:
+            self._ensure_loaded()
+            result = self._entries.get(key)
+            if result is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return result
+            
+    def put(self, key: str, result: str):
+        """保存结果，超出总大小时淘汰最久未用的条目"""
+        size = len(result.encode("utf-8", "surrogatepass"))
+        if size > self.max_entry_bytes:
+            return
+        with self._lock:
+            self._ensure_loaded()
+            self._remove(key)
+            self._entries[key] = result
+            self._sizes[key] = size
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+            self._dirty = True
+            
+    def _remove(self, key: str):
+        if key in self._entries:
+            del self._entries[key]
+            self._total_bytes -= self._sizes.pop(key)
+            
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+            self._dirty = True
+            
+    def _ensure_loaded(self):
+        """首次使用时读取持久化的结果（调用方持有锁）"""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.persist_path is None or not self.persist_path.exists():
+            return
+        try:
+            with open(self.persist_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            for key, result in entries:
+                size = len(result.encode("utf-8", "surrogatepass"))
+                self._entries[key] = result
+                self._sizes[key] = size
+                self._total_bytes += size
+            while self._total_bytes > self.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+        except Exception as e:
+            print(f"[脚本] 读取结果缓存失败: {e}")
+            
+    def save(self):
+        """把缓存写回文件（退出时调用，未启用持久化或没有变化时不写）"""
+        if self.persist_path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = list(self._entries.items())
+            self._dirty = False
+        self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.persist_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+        temp_path.replace(self.persist_path)
+        
+    def get_stats(self) -> dict:
+        """获取命中次数、未命中次数、命中率和占用大小"""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return dict(
+                self._stats,
+                hit_ratio=self._stats["hits"] / lookups if lookups else 0.0,
+                entries=len(self._entries),
+                bytes=self._total_bytes
+            )
+
+
+def _create_script_result_cache() -> ScriptResultCache:
+    """按配置创建全局脚本结果缓存"""
+    from .config_manager import config_manager
+    persist = config_manager.get("script_cache.persist", False)
+    return ScriptResultCache(
+        max_bytes=config_manager.get("script_cache.max_kb", 4096) * 1024,
+        max_entry_bytes=config_manager.get("script_cache.max_entry_kb", 256) * 1024,
+        persist_path=config_manager.config_dir / "script_cache" / "results.json" if persist else None
+    )
+
+
+# 全局脚本结果缓存
+script_result_cache = _create_script_result_cache()
@@ -0,0 +1,106 @@
+# 脚本运行统计模块（不依赖Qt）：记录每次输入输出脚本的耗时、CPU时间、输入输出大小和异常
+from typing import Deque, Dict, List, Optional
+from collections import deque
+import threading
+
+
+class ScriptRun:
+    """一次脚本执行的记录"""
+    
+    __slots__ = ("script", "started_at", "wall_ms", "cpu_ms", "input_size", "output_size", "error", "cached")
+    
+    def __init__(self, script: str, started_at: float, wall_ms: float, cpu_ms: Optional[float],
+                 input_size: int, output_size: int, error: str = "", cached: bool = False):
+        self.script = script
+        self.started_at = started_at
+        self.wall_ms = wall_ms
+        self.cpu_ms = cpu_ms
+        self.input_size = input_size
+        self.output_size = output_size
+        self.error = error
+        self.cached = cached
+
+
+class ScriptStatsRecorder:
+    """按脚本记录最近的执行历史和累计统计（可在任意线程调用）"""
+    
+    def __init__(self, history_size: int = 50):
+        self.history_size = history_size
+        self._history: Dict[str, Deque[ScriptRun]] = {}
+        self._totals: Dict[str, Dict[str, float]] = {}
+        self._profiles: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        
+    def record(self, run: ScriptRun):
+        """记录一次执行"""
+        with self._lock:
+            history = self._history.get(run.script)
+            if history is None:
+                history = self._history[run.script] = deque(maxlen=self.history_size)
+                self._totals[run.script] = {
+                    "runs": 0, "errors": 0, "cached": 0, "wall_ms": 0.0, "max_wall_ms": 0.0,
+                    "cpu_ms": 0.0, "cpu_runs": 0, "input_size": 0, "output_size": 0
+                }
+            history.append(run)
+            totals = self._totals[run.script]
+            totals["runs"] += 1
+            totals["errors"] += bool(run.error)
+            totals["cached"] += run.cached
+            totals["wall_ms"] += run.wall_ms
+            totals["max_wall_ms"] = max(totals["max_wall_ms"], run.wall_ms)
+            if run.cpu_ms is not None:
+                totals["cpu_ms"] += run.cpu_ms
+                totals["cpu_runs"] += 1
+            totals["input_size"] += run.input_size
+            totals["output_size"] += run.output_size
+            
+    def record_profile(self, script: str, profile_text: str):
+        """保存脚本最近一次的性能分析结果"""
+        with self._lock:
+            self._profiles[script] = profile_text
+            
+    def get_profile(self, script: str) -> str:
+        with self._lock:
+            return self._profiles.get(script, "")
+            
+    def get_history(self, script: str) -> List[ScriptRun]:
+        """获取脚本最近的执行记录（新的在前）"""
+        with self._lock:
+            return list(reversed(self._history.get(script, ())))
+            
+    def get_summary(self) -> List[Dict[str, float]]:
+        """获取每个脚本的累计统计，按平均耗时从高到低排序"""
+        with self._lock:
+            rows = []
+            for script, totals in self._totals.items():
+                runs = totals["runs"]
+                rows.append({
+                    "script": script,
+                    "runs": runs,
+                    "errors": totals["errors"],
+                    "cached": totals["cached"],
+                    "avg_wall_ms": totals["wall_ms"] / runs,
+                    "max_wall_ms": totals["max_wall_ms"],
+                    "avg_cpu_ms": totals["cpu_ms"] / totals["cpu_runs"] if totals["cpu_runs"] else None,
+                    "avg_input_size": totals["input_size"] / runs,
+                    "avg_output_size": totals["output_size"] / runs,
+                })
+        rows.sort(key=lambda row: row["avg_wall_ms"], reverse=True)
+        return rows
+        
+    def clear(self):
+        """清空全部记录"""
+        with self._lock:
+            self._history.clear()
+            self._totals.clear()
+            self._profiles.clear()
+
+
+def _create_script_stats() -> ScriptStatsRecorder:
+    """按配置创建全局脚本运行统计"""
+    from .config_manager import config_manager
+    return ScriptStatsRecorder(history_size=config_manager.get("script_stats.history_size", 50))
+
+
+# 全局脚本运行统计
+script_stats = _create_script_stats()
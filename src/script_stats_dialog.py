@@ -0,0 +1,176 @@
+# 脚本运行统计对话框模块
+from typing import Optional
+from datetime import datetime
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QCheckBox,
+    QTableWidget, QTableWidgetItem, QHeaderView, QPlainTextEdit, QSplitter, QAbstractItemView
+)
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont
+from .config_manager import config_manager
+from .script_stats import script_stats
+
+SUMMARY_COLUMNS = ["脚本", "次数", "失败", "缓存命中", "平均耗时(ms)", "最长耗时(ms)", "平均CPU(ms)", "平均输入", "平均输出"]
+HISTORY_COLUMNS = ["时间", "耗时(ms)", "CPU(ms)", "输入", "输出", "结果"]
+
+
+class _NumberItem(QTableWidgetItem):
+    """按数值排序的表格项"""
+    
+    def __init__(self, value: Optional[float], text: str = None):
+        super().__init__(text if text is not None else ("-" if value is None else f"{value:.1f}"))
+        self.value = value if value is not None else -1.0
+        self.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        
+    def __lt__(self, other):
+        if isinstance(other, _NumberItem):
+            return self.value < other.value
+        return super().__lt__(other)
+
+
+class ScriptStatsDialog(QDialog):
+    """脚本运行统计：各脚本的累计统计、选中脚本的最近记录和性能分析结果"""
+    
+    def __init__(self, script_file: str = "", parent=None):
+        super().__init__(parent)
+        self.script_file = script_file
+        self.setWindowTitle("脚本运行统计")
+        self.resize(900, 640)
+        self._setup_ui()
+        self.refresh()
+        
+    def _setup_ui(self):
+        """设置用户界面"""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(8)
+        layout.setContentsMargins(15, 15, 15, 15)
+        
+        self.cache_label = QLabel()
+        self.cache_label.setStyleSheet("color: #666;")
+        layout.addWidget(self.cache_label)
+        
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        
+        # 累计统计（默认按平均耗时排序，慢的在前）
+        self.summary_table = self._create_table(SUMMARY_COLUMNS)
+        self.summary_table.setSortingEnabled(True)
+        self.summary_table.horizontalHeader().setSortIndicator(4, Qt.SortOrder.DescendingOrder)
+        self.summary_table.itemSelectionChanged.connect(self._on_script_selected)
+        splitter.addWidget(self.summary_table)
+        
+        # 选中脚本的最近记录
+        self.history_table = self._create_table(HISTORY_COLUMNS)
+        splitter.addWidget(self.history_table)
+        
+        # 性能分析结果
+        self.profile_view = QPlainTextEdit()
+        self.profile_view.setReadOnly(True)
+        self.profile_view.setFont(QFont("Consolas", 9))
+        self.profile_view.setPlaceholderText("勾选“记录性能分析”后再次运行该脚本，这里会显示 cProfile 的结果")
+        splitter.addWidget(self.profile_view)
+        splitter.setSizes([240, 200, 200])
+        layout.addWidget(splitter)
+        
+        button_layout = QHBoxLayout()
+        self.profile_check = QCheckBox("记录性能分析 (cProfile)")
+        self.profile_check.setToolTip("对选中的脚本启用 cProfile，会增加执行耗时")
+        self.profile_check.toggled.connect(self._on_profile_toggled)
+        button_layout.addWidget(self.profile_check)
+        button_layout.addStretch()
+        
+        refresh_button = QPushButton("刷新")
+        refresh_button.clicked.connect(self.refresh)
+        button_layout.addWidget(refresh_button)
+        clear_button = QPushButton("清空记录")
+        clear_button.clicked.connect(self._clear)
+        button_layout.addWidget(clear_button)
+        close_button = QPushButton("关闭")
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+        
+    def _create_table(self, columns) -> QTableWidget:
+        table = QTableWidget(0, len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        return table
+        
+    def refresh(self):
+        """重新读取统计"""
+        from .script_result_cache import script_result_cache
+        cache = script_result_cache.get_stats()
+        self.cache_label.setText(
+            f"结果缓存: 命中 {cache['hits']} 次，未命中 {cache['misses']} 次，命中率 {cache['hit_ratio']:.0%}，"
+            f"{cache['entries']} 条 / {cache['bytes'] / 1024:.0f} KB"
+        )
+        
+        self.summary_table.setSortingEnabled(False)
+        self.summary_table.blockSignals(True)
+        rows = script_stats.get_summary()
+        self.summary_table.setRowCount(len(rows))
+        for row, summary in enumerate(rows):
+            self.summary_table.setItem(row, 0, QTableWidgetItem(summary["script"]))
+            self.summary_table.setItem(row, 1, _NumberItem(summary["runs"], str(summary["runs"])))
+            self.summary_table.setItem(row, 2, _NumberItem(summary["errors"], str(summary["errors"])))
+            self.summary_table.setItem(row, 3, _NumberItem(summary["cached"], str(summary["cached"])))
+            self.summary_table.setItem(row, 4, _NumberItem(summary["avg_wall_ms"]))
+            self.summary_table.setItem(row, 5, _NumberItem(summary["max_wall_ms"]))
+            self.summary_table.setItem(row, 6, _NumberItem(summary["avg_cpu_ms"]))
+            self.summary_table.setItem(row, 7, _NumberItem(summary["avg_input_size"], f"{summary['avg_input_size']:.0f}"))
+            self.summary_table.setItem(row, 8, _NumberItem(summary["avg_output_size"], f"{summary['avg_output_size']:.0f}"))
+        self.summary_table.setSortingEnabled(True)
+        self.summary_table.blockSignals(False)
+        # 排序后再查找当前脚本所在的行
+        for row in range(self.summary_table.rowCount()):
+            if self.summary_table.item(row, 0).text() == self.script_file:
+                self.summary_table.selectRow(row)
+                break
+        self._show_script(self.script_file)
+        
+    def _on_script_selected(self):
+        items = self.summary_table.selectedItems()
+        if items:
+            self.script_file = self.summary_table.item(items[0].row(), 0).text()
+            self._show_script(self.script_file)
+            
+    def _show_script(self, script_file: str):
+        """显示脚本的最近记录和性能分析结果"""
+        history = script_stats.get_history(script_file) if script_file else []
+        self.history_table.setRowCount(len(history))
+        for row, run in enumerate(history):
+            started = datetime.fromtimestamp(run.started_at).strftime("%m-%d %H:%M:%S")
+            if run.error:
+                outcome = f"失败: {run.error}"
+            else:
+                outcome = "缓存命中" if run.cached else "成功"
+            self.history_table.setItem(row, 0, QTableWidgetItem(started))
+            self.history_table.setItem(row, 1, _NumberItem(run.wall_ms))
+            self.history_table.setItem(row, 2, _NumberItem(run.cpu_ms))
+            self.history_table.setItem(row, 3, _NumberItem(run.input_size, str(run.input_size)))
+            self.history_table.setItem(row, 4, _NumberItem(run.output_size, str(run.output_size)))
+            self.history_table.setItem(row, 5, QTableWidgetItem(outcome))
+        self.profile_view.setPlainText(script_stats.get_profile(script_file) if script_file else "")
+        
+        self.profile_check.blockSignals(True)
+        self.profile_check.setEnabled(bool(script_file))
+        self.profile_check.setChecked(script_file in config_manager.get("script_stats.profile_scripts", []))
+        self.profile_check.setText(f"记录性能分析 (cProfile): {script_file}" if script_file else "记录性能分析 (cProfile)")
+        self.profile_check.blockSignals(False)
+        
+    def _on_profile_toggled(self, checked: bool):
+        """为选中的脚本开关性能分析"""
+        if not self.script_file:
+            return
+        profile_scripts = [name for name in config_manager.get("script_stats.profile_scripts", [])
+                           if name != self.script_file]
+        if checked:
+            profile_scripts.append(self.script_file)
+        config_manager.set("script_stats.profile_scripts", profile_scripts)
+        
+    def _clear(self):
+        script_stats.clear()
+        self.refresh()
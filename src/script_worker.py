@@ -0,0 +1,108 @@
+# 脚本工作进程入口（不依赖Qt）：从标准输入接收任务，执行脚本后把结果写回标准输出
+import os
+import pickle
+import struct
+import sys
+from pathlib import Path
+
+_HEADER = struct.Struct("<I")
+
+
+def send_message(stream, message):
+    """写入一条消息（4字节长度 + pickle数据）"""
+    data = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    stream.write(_HEADER.pack(len(data)) + data)
+    stream.flush()
+
+
+def recv_message(stream):
+    """读取一条消息，管道关闭时返回None"""
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    size = _HEADER.unpack(header)[0]
+    data = stream.read(size)
+    if len(data) < size:
+        return None
+    return pickle.loads(data)
+
+
+def _apply_memory_limit(memory_limit_mb: int):
+    """限制本进程的地址空间（仅POSIX，Windows上忽略）
+    
+    只设置软限制：映射大输入文件时需要按文件大小临时放宽（见 large_input.set_address_space_limit）。
+    """
+    if memory_limit_mb <= 0:
+        return
+    try:
+        import resource
+        from src.large_input import set_address_space_limit
+        limit = memory_limit_mb * 1024 * 1024
+        hard = resource.getrlimit(resource.RLIMIT_AS)[1]
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+        set_address_space_limit(limit)
+    except (ImportError, ValueError, OSError) as e:
+        print(f"[脚本进程] 无法设置内存限制: {e}", file=sys.stderr)
+
+
+def main():
+    """工作进程主循环
+    
+    消息格式：(任务ID, 脚本路径, 输入文本, 输入源, 输出目标[, 是否性能分析])，输入文本为None表示只加载脚本，
+    为 FileInput 时只传递文件路径；
+    回复格式：(任务ID, 类型, 内容)，类型为 result（完整结果）、chunk（流式输出的一块）、
+    end（流式输出结束）、cpu（CPU时间和性能分析结果，在 result / end 之前发送）或 error（错误信息）。
+    流式输出时父进程读取变慢会使管道写满，本进程随之阻塞在写入上，不会无限制地积压输出。
+    """
+    # 标准输出留给消息通道，脚本中的print改为输出到标准错误
+    channel_out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+    channel_in = sys.stdin.buffer
+    
+    _apply_memory_limit(int(sys.argv[1]) if len(sys.argv) > 1 else 0)
+    
+    from src.script_loader import ScriptLoader, ScriptProfiler, iter_output_chunks
+    from src.large_input import prepare_input, close_input
+    loader = ScriptLoader()
+    send_message(channel_out, ("ready", "ready", os.getpid()))
+    
+    while True:
+        message = recv_message(channel_in)
+        if message is None:
+            break
+        job_id, script_path, input_text, input_source, output_target, *options = message
+        profile = bool(options and options[0])
+        try:
+            script = loader.get_script(Path(script_path))
+            if input_text is None:
+                reply = (job_id, "result", "")
+            else:
+                # 文件输入（FileInput）在这里才读取或映射，不经过管道传输
+                input_text = prepare_input(input_text, script.large_input)
+                try:
+                    with ScriptProfiler(profile) as profiler:
+                        result = script.process(input_text, input_source, output_target)
+                        chunks = iter_output_chunks(result)
+                        if chunks is None:
+                            reply = (job_id, "result", str(result) if result is not None else "")
+                        else:
+                            for chunk in chunks:
+                                send_message(channel_out, (job_id, "chunk", chunk))
+                            reply = (job_id, "end", None)
+                finally:
+                    close_input(input_text)
+                send_message(channel_out, (job_id, "cpu", (profiler.cpu_ms, profiler.profile_text)))
+        except MemoryError:
+            reply = (job_id, "error", "脚本超出内存限制")
+        except BaseException as e:
+            if isinstance(e, KeyboardInterrupt):
+                raise
+            reply = (job_id, "error", f"{e.__class__.__name__}: {e}")
+        send_message(channel_out, reply)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+# 脚本进程池模块（不依赖Qt）：预先启动的工作进程执行输入输出脚本，支持超时、取消和内存限制
+from typing import Callable, Iterable, List, Optional
+from pathlib import Path
+import itertools
+import queue
+import subprocess
+import sys
+import threading
+import time
+from .script_worker import send_message, recv_message
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 工作进程的启动代码：只导入脚本加载器，不导入Qt和主程序
+_WORKER_BOOTSTRAP = (
+    "import sys; sys.path.insert(0, sys.argv[2]); "
+    "from src.script_worker import main; main()"
+)
+
+
+class ScriptTimeoutError(RuntimeError):
+    """脚本执行超时"""
+
+
+class ScriptCancelledError(RuntimeError):
+    """脚本执行被取消"""
+
+
+class ScriptJob:
+    """一次脚本执行的控制句柄，可在任意线程调用 cancel()"""
+    
+    def __init__(self):
+        self._cancelled = threading.Event()
+        
+    def cancel(self):
+        """取消执行（正在执行脚本的工作进程会被结束并替换）"""
+        self._cancelled.set()
+        
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+
+class _WorkerProcess:
+    """一个工作进程及其读取线程"""
+    
+    def __init__(self, memory_limit_mb: int):
+        kwargs = {}
+        if sys.platform == "win32":
+            kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+        self.process = subprocess.Popen(
+            [sys.executable, "-u", "-c", _WORKER_BOOTSTRAP, str(memory_limit_mb), str(PROJECT_ROOT)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, **kwargs
+        )
+        # 有界队列：消费变慢时读取线程阻塞，管道写满后工作进程也随之阻塞（背压）
+        self.replies: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=64)
+        self._reader = threading.Thread(target=self._read_loop, name="ScriptWorkerReader", daemon=True)
+        self._reader.start()
+        
+    def _read_loop(self):
+        """读取线程：把回复放入队列，管道关闭（进程退出）时放入None"""
+        try:
+            while True:
+                message = recv_message(self.process.stdout)
+                if message is None:
+                    break
+                self.replies.put(message)
+        except Exception:
+            pass
+        self.replies.put(None)
+        
+    def send(self, message: tuple):
+        send_message(self.process.stdin, message)
+        
+    def kill(self):
+        """结束进程，并清空回复队列让可能阻塞的读取线程退出"""
+        try:
+            self.process.kill()
+            self.process.wait(timeout=2)
+        except Exception:
+            pass
+        deadline = time.monotonic() + 1
+        while self._reader.is_alive() and time.monotonic() < deadline:
+            try:
+                while True:
+                    self.replies.get_nowait()
+            except queue.Empty:
+                pass
+            self._reader.join(0.05)
+            
+    def close(self):
+        """关闭输入管道让进程自行退出，超时后强制结束"""
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=1)
+        except Exception:
+            self.kill()
+
+
+class ScriptWorkerPool:
+    """脚本工作进程池
+    
+    进程在 start() 时预先启动，并各自缓存已加载的脚本；run() 在调用线程中阻塞等待结果
+    （由动作执行服务的工作线程调用）。超时、取消或进程崩溃时结束该进程并启动新的进程补位。
+    """
+    
+    def __init__(self, size: int = 2, memory_limit_mb: int = 1024, poll_interval: float = 0.02):
+        self.size = max(1, size)
+        self.memory_limit_mb = memory_limit_mb
+        self.poll_interval = poll_interval
+        self._idle: "queue.Queue[_WorkerProcess]" = queue.Queue()
+        self._workers: List[_WorkerProcess] = []
+        self._lock = threading.Lock()
+        self._job_counter = itertools.count(1)
+        self._started = False
+        self._replaced = 0
+        
+    def start(self):
+        """启动工作进程（重复调用无影响）"""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            for _ in range(self.size):
+                self._idle.put(self._spawn())
+                
+    def _spawn(self) -> _WorkerProcess:
+        worker = _WorkerProcess(self.memory_limit_mb)
+        self._workers.append(worker)
+        return worker
+        
+    def _replace(self, worker: _WorkerProcess):
+        """结束出问题的进程并启动新进程补位"""
+        worker.kill()
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+            self._replaced += 1
+            if self._started:
+                self._idle.put(self._spawn())
+                
+    def _acquire(self, deadline: Optional[float], job: Optional[ScriptJob]) -> _WorkerProcess:
+        """等待空闲进程"""
+        while True:
+            try:
+                return self._idle.get(timeout=self.poll_interval)
+            except queue.Empty:
+                if job is not None and job.cancelled:
+                    raise ScriptCancelledError("脚本已取消")
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise ScriptTimeoutError("等待空闲脚本进程超时")
+                    
+    def _call(self, request_args: tuple, timeout_ms: Optional[int], job: Optional[ScriptJob],
+              on_chunk: Optional[Callable[[str], None]] = None, meta: Optional[dict] = None) -> Optional[str]:
+        """把请求交给一个空闲进程并等待回复
+        
+        流式输出的每一块交给 on_chunk（在调用线程中阻塞调用，形成背压），全部结束后返回None；
+        没有 on_chunk 时把各块拼接后返回。流式输出时超时按两块之间的间隔计算。
+        meta 不为None时填入 cpu_ms 和 profile（性能分析结果）。
+        """
+        self.start()
+        deadline = time.monotonic() + timeout_ms / 1000 if timeout_ms else None
+        worker = self._acquire(deadline, job)
+        job_id = next(self._job_counter)
+        try:
+            worker.send((job_id,) + request_args)
+        except OSError:
+            self._replace(worker)
+            raise RuntimeError("脚本进程已退出，请重试")
+            
+        chunks: List[str] = []
+        while True:
+            if job is not None and job.cancelled:
+                self._replace(worker)
+                raise ScriptCancelledError("脚本已取消")
+            try:
+                reply = worker.replies.get(timeout=self.poll_interval)
+            except queue.Empty:
+                if deadline is not None and time.monotonic() >= deadline:
+                    self._replace(worker)
+                    raise ScriptTimeoutError(f"脚本执行超时（超过 {timeout_ms / 1000:.1f} 秒），已结束脚本进程")
+                continue
+                
+            if reply is None:
+                self._replace(worker)
+                raise RuntimeError("脚本进程异常退出（可能超出内存限制）")
+            if reply[0] != job_id:
+                # 启动完成通知
+                continue
+                
+            _, kind, payload = reply
+            if kind == "chunk":
+                if on_chunk is None:
+                    chunks.append(payload)
+                else:
+                    try:
+                        on_chunk(payload)
+                    except BaseException:
+                        # 消费方取消或出错：进程还在输出，只能结束
+                        self._replace(worker)
+                        raise
+                if timeout_ms:
+                    deadline = time.monotonic() + timeout_ms / 1000
+                continue
+            if kind == "cpu":
+                if meta is not None:
+                    meta["cpu_ms"], meta["profile"] = payload
+                continue
+                
+            self._idle.put(worker)
+            if kind == "error":
+                raise RuntimeError(payload)
+            if kind == "end":
+                return None if on_chunk is not None else "".join(chunks)
+            return payload
+            
+    def run(self, script_path: Path, input_text: str, input_source: str, output_target: str,
+            timeout_ms: Optional[int] = None, job: Optional[ScriptJob] = None,
+            on_chunk: Optional[Callable[[str], None]] = None, profile: bool = False,
+            meta: Optional[dict] = None) -> Optional[str]:
+        """在工作进程中执行脚本的 process 函数，返回结果文本（流式输出交给 on_chunk 时返回None）
+        
+        profile 为 True 时用 cProfile 记录，结果和CPU时间填入 meta。
+        """
+        return self._call((str(script_path), input_text, input_source, output_target, profile),
+                          timeout_ms, job, on_chunk, meta)
+        
+    def warm_up(self, script_paths: Iterable[Path]) -> int:
+        """让每个工作进程预先加载脚本，返回成功加载的脚本数"""
+        self.start()
+        script_paths = list(script_paths)
+        loaded = 0
+        for script_path in script_paths:
+            ok = True
+            for _ in range(self.size):
+                try:
+                    self._call((str(script_path), None, "", ""), None, None)
+                except Exception as e:
+                    print(f"[脚本] 预加载 {Path(script_path).name} 失败: {e}")
+                    ok = False
+                    break
+            loaded += ok
+        return loaded
+        
+    def get_stats(self) -> dict:
+        """获取进程数和替换次数"""
+        return {"workers": len(self._workers), "idle": self._idle.qsize(), "replaced": self._replaced}
+        
+    def shutdown(self):
+        """结束所有工作进程"""
+        with self._lock:
+            self._started = False
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
+
+_script_worker_pool: Optional[ScriptWorkerPool] = None
+
+
+def get_script_worker_pool() -> ScriptWorkerPool:
+    """获取全局脚本进程池（首次调用时按配置创建，进程在首次执行或预热时启动）"""
+    global _script_worker_pool
+    if _script_worker_pool is None:
+        from .config_manager import config_manager
+        _script_worker_pool = ScriptWorkerPool(
+            size=config_manager.get("script_workers.count", 2),
+            memory_limit_mb=config_manager.get("script_workers.memory_limit_mb", 1024)
+        )
+    return _script_worker_pool
+
+
+def benchmark(script_path: Path, runs: int = 20):
+    """比较常驻进程与每次新启动子进程执行脚本的延迟
+    
+    用法：python -m src.script_worker_pool input_output_actions/example_uppercase.py [次数]
+    """
+    script_path = Path(script_path).resolve()
+    cold_code = (
+        "import sys; sys.path.insert(0, sys.argv[1]); from pathlib import Path; "
+        "from src.script_loader import ScriptLoader; "
+        "print(ScriptLoader().get_process(Path(sys.argv[2]))('hello world', 'clipboard', 'text'))"
+    )
+    cold_times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", cold_code, str(PROJECT_ROOT), str(script_path)],
+                       capture_output=True, check=True)
+        cold_times.append((time.perf_counter() - start) * 1000)
+        
+    pool = ScriptWorkerPool(size=1)
+    pool.start()
+    pool.run(script_path, "hello world", "clipboard", "text")  # 首次加载脚本
+    warm_times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        pool.run(script_path, "hello world", "clipboard", "text")
+        warm_times.append((time.perf_counter() - start) * 1000)
+    pool.shutdown()
+    
+    cold_times.sort()
+    warm_times.sort()
+    print(f"新启动子进程: 中位数 {cold_times[runs // 2]:.1f} ms，最小 {cold_times[0]:.1f} ms")
+    print(f"常驻工作进程: 中位数 {warm_times[runs // 2]:.2f} ms，最小 {warm_times[0]:.2f} ms")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(benchmark.__doc__)
+    else:
+        benchmark(Path(sys.argv[1]), int(sys.argv[2]) if len(sys.argv) > 2 else 20)
@@ -0,0 +1,190 @@
+# 文本注入模块：短ASCII文本逐字输入，长文本或非ASCII文本通过剪贴板粘贴
+from typing import Callable, Deque, Optional, Dict, List, Tuple
+from collections import deque
+import sys
+import time
+from PySide6.QtCore import QObject, QTimer, QMimeData
+from PySide6.QtWidgets import QApplication
+
+
+class TextInjector(QObject):
+    """文本注入策略选择器
+    
+    pyautogui.write 逐字符模拟按键，长文本需要数秒，且无法输入中文等非ASCII字符。
+    超过长度阈值或包含非ASCII字符时改为：保存剪贴板 -> 写入文本 -> 发送粘贴快捷键 ->
+    确认粘贴后恢复原剪贴板内容。
+    
+    所有输入经同一个队列依次执行：粘贴后等待 restore_delay_ms（目标程序读取剪贴板）再执行下一项，
+    连续的多次粘贴只在第一次前保存一次原剪贴板，最后一次粘贴被读取后恢复一次，
+    不会把上一次粘贴的文本当成原内容，也不会让目标程序读到下一块文本。
+    """
+    
+    STRATEGY_TYPE = "type"
+    STRATEGY_PASTE = "paste"
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        from .config_manager import config_manager
+        self.strategy = config_manager.get("text_injection.strategy", "auto")
+        self.paste_threshold = config_manager.get("text_injection.paste_threshold", 32)
+        self.restore_delay_ms = config_manager.get("text_injection.restore_delay_ms", 150)
+        self._stats: Dict[str, List[float]] = {}  # 策略 -> [字符数, 累计秒数]
+        # 待执行的输入：(策略, 文本, 完成回调, 失败回调)
+        self._queue: Deque[Tuple[str, str, Optional[Callable[[], None]], Optional[Callable[[str], None]]]] = deque()
+        self._paste_pending = False  # 已发送粘贴快捷键，等待目标程序读取剪贴板
+        self._burst_active = False  # 本轮连续粘贴已保存原剪贴板
+        self._burst_saved: Optional[QMimeData] = None
+        self._last_pasted = ""
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.timeout.connect(self._on_paste_settled)
+        
+    def choose_strategy(self, text: str) -> str:
+        """根据配置、文本长度和字符范围选择注入方式"""
+        if self.strategy in (self.STRATEGY_TYPE, self.STRATEGY_PASTE):
+            return self.strategy
+        if len(text) >= self.paste_threshold or not text.isascii():
+            return self.STRATEGY_PASTE
+        return self.STRATEGY_TYPE
+        
+    def inject(self, text: str, on_done: Optional[Callable[[], None]] = None,
+               on_error: Optional[Callable[[str], None]] = None) -> str:
+        """向当前前台窗口输入文本，返回使用的策略（在界面线程调用，缺少pyautogui时抛出ImportError）
+        
+        队列空闲时立即执行；前一次粘贴还在等待目标程序读取时排队，按提交顺序执行。
+        on_done 在文本已发送（粘贴快捷键已按下）后调用，on_error 在发送失败时调用（未提供时输出日志）。
+        """
+        import pyautogui
+        
+        if not text:
+            if on_done:
+                on_done()
+            return self.STRATEGY_TYPE
+            
+        strategy = self.choose_strategy(text)
+        self._queue.append((strategy, text, on_done, on_error))
+        if not self._paste_pending:
+            self._run_queue(pyautogui)
+        return strategy
+        
+    @property
+    def busy(self) -> bool:
+        """是否有粘贴正在等待读取或排队中的输入"""
+        return self._paste_pending or bool(self._queue)
+        
+    def _run_queue(self, pyautogui):
+        """依次执行排队的输入，遇到粘贴时等待目标程序读取剪贴板后再继续"""
+        while self._queue and not self._paste_pending:
+            strategy, text, on_done, on_error = self._queue.popleft()
+            start_time = time.perf_counter()
+            try:
+                if strategy == self.STRATEGY_PASTE:
+                    self._paste_text(text, pyautogui)
+                else:
+                    pyautogui.write(text)
+            except Exception as e:
+                if on_error:
+                    on_error(str(e))
+                else:
+                    print(f"输入文本失败: {e}")
+                continue
+            self._record(strategy, len(text), time.perf_counter() - start_time)
+            if on_done:
+                on_done()
+                
+    def _on_paste_settled(self):
+        """粘贴的宽限时间已过：继续执行排队的输入，整轮结束后恢复原剪贴板"""
+        self._paste_pending = False
+        if self._queue:
+            import pyautogui
+            self._run_queue(pyautogui)
+        if not self._paste_pending and self._burst_active:
+            self._burst_active = False
+            saved_mime_data, self._burst_saved = self._burst_saved, None
+            self._restore_clipboard(self._last_pasted, saved_mime_data)
+        
+    def inject_async(self, text: str, on_error: Optional[Callable[[str], None]] = None) -> str:
+        """输入文本，逐字输入在执行服务的工作线程中进行（缺少pyautogui时抛出ImportError）
+        
+        粘贴需要操作剪贴板，仍在界面线程完成（只是设置剪贴板和发送快捷键，耗时很短）；
+        有粘贴正在进行时逐字输入也排在其后，保持输入顺序。
+        """
+        import pyautogui
+        
+        if not text:
+            return self.STRATEGY_TYPE
+            
+        strategy = self.choose_strategy(text)
+        if strategy == self.STRATEGY_PASTE or self.busy:
+            return self.inject(text, on_error=on_error)
+            
+        from .action_executor import action_executor
+        action_executor.submit("text", self.type_text, text, on_error=on_error)
+        return strategy
+        
+    def type_text(self, text: str):
+        """逐字输入文本（可在工作线程中调用）"""
+        import pyautogui
+        start_time = time.perf_counter()
+        pyautogui.write(text)
+        self._record(self.STRATEGY_TYPE, len(text), time.perf_counter() - start_time)
+        
+    def _paste_text(self, text: str, pyautogui):
+        """粘贴文本（本轮第一次粘贴前保存原剪贴板），宽限时间后才执行下一项"""
+        clipboard = QApplication.clipboard()
+        if not self._burst_active:
+            self._burst_saved = self._copy_mime_data(clipboard.mimeData())
+            self._burst_active = True
+            
+        clipboard.setText(text)
+        self._last_pasted = text
+        # 快捷键已同步送达，目标程序读取剪贴板是异步的；
+        # 宽限时间内不修改剪贴板，之后剪贴板仍是我们写入的文本才恢复原内容
+        self._paste_pending = True
+        self._settle_timer.start(self.restore_delay_ms)
+        if sys.platform == "darwin":
+            pyautogui.hotkey("command", "v")
+        else:
+            pyautogui.hotkey("ctrl", "v")
+        
+    def _restore_clipboard(self, pasted_text: str, saved_mime_data: Optional[QMimeData]):
+        """恢复粘贴前的剪贴板内容（期间剪贴板被其他程序修改时不覆盖）"""
+        clipboard = QApplication.clipboard()
+        if clipboard.text() != pasted_text:
+            return
+        if saved_mime_data is None:
+            clipboard.clear()
+        else:
+            clipboard.setMimeData(saved_mime_data)
+            
+    def _copy_mime_data(self, mime_data: Optional[QMimeData]) -> Optional[QMimeData]:
+        """复制剪贴板数据（剪贴板持有的对象在内容变化后会失效）"""
+        if mime_data is None or not mime_data.formats():
+            return None
+        copied = QMimeData()
+        for mime_format in mime_data.formats():
+            copied.setData(mime_format, mime_data.data(mime_format))
+        return copied
+        
+    def _record(self, strategy: str, char_count: int, elapsed: float):
+        """记录吞吐量并输出与另一种策略的对比"""
+        stats = self._stats.setdefault(strategy, [0, 0.0])
+        stats[0] += char_count
+        stats[1] += elapsed
+        
+        rate = char_count / elapsed if elapsed > 0 else float("inf")
+        message = f"[性能] 文本注入({strategy}): {char_count} 字符，耗时 {elapsed * 1000:.1f} ms，约 {rate:.0f} 字符/秒"
+        other = self.STRATEGY_TYPE if strategy == self.STRATEGY_PASTE else self.STRATEGY_PASTE
+        other_rate = self.get_throughput(other)
+        if other_rate:
+            message += f"（{other} 平均 {other_rate:.0f} 字符/秒）"
+        print(message)
+        
+    def get_throughput(self, strategy: str) -> float:
+        """获取某种策略的平均吞吐量（字符/秒），没有记录时返回0"""
+        char_count, elapsed = self._stats.get(strategy, (0, 0.0))
+        return char_count / elapsed if elapsed > 0 else 0.0
+
+
+# 全局文本注入实例
+text_injector = TextInjector()
@@ -0,0 +1,247 @@
+# 动作使用统计模块（不依赖Qt）
+from typing import Dict, List, Optional, Tuple
+from array import array
+from pathlib import Path
+import heapq
+import json
+import queue
+import threading
+import time
+
+
+class UsageStore:
+    """动作使用统计存储
+    
+    每次使用先更新内存中的数组表，再放入队列由后台线程批量追加到日志文件；
+    日志超过一定条数后压缩进表文件并清空。表按动作ID分配槽位，
+    次数、最后使用时间和频近度分数各用一个 array 存储。
+    """
+    
+    LOG_FILENAME = "usage.log"
+    TABLE_FILENAME = "usage_table.json"
+    
+    def __init__(self, data_dir: Path, half_life_days: float = 7.0,
+                 flush_interval: float = 2.0, compact_threshold: int = 1000):
+        self.data_dir = Path(data_dir)
+        self.half_life = max(half_life_days, 0.01) * 86400.0
+        self.flush_interval = flush_interval
+        self.compact_threshold = compact_threshold
+        
+        # 数组表：槽位 -> 数据
+        self._slots: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._counts = array("L")
+        self._last_used = array("d")
+        self._scores = array("d")  # 在 last_used 时刻的频近度分数
+        
+        # 每条使用记录的序号；表文件记录压缩时的序号，加载时只重放之后的日志
+        self._sequence = 0
+        
+        self._lock = threading.Lock()
+        self._pending: "queue.Queue[Optional[Tuple[int, float, str]]]" = queue.Queue()
+        self._log_records = 0
+        self._loaded = False
+        self._writer_thread: Optional[threading.Thread] = None
+        
+    def _ensure_loaded(self):
+        """首次使用时加载表文件并重放日志，然后启动后台写入线程"""
+        if self._loaded:
+            return
+        self._loaded = True
+        
+        table_path = self.data_dir / self.TABLE_FILENAME
+        if table_path.exists():
+            try:
+                with open(table_path, "r", encoding="utf-8") as f:
+                    table = json.load(f)
+                for action_id, count, last_used, score in zip(
+                    table.get("ids", []), table.get("counts", []),
+                    table.get("last_used", []), table.get("scores", [])
+                ):
+                    slot = self._get_slot(action_id)
+                    self._counts[slot] = count
+                    self._last_used[slot] = last_used
+                    self._scores[slot] = score
+                self._sequence = table.get("sequence", 0)
+            except Exception as e:
+                print(f"[使用统计] 读取统计表失败: {e}")
+                
+        log_path = self.data_dir / self.LOG_FILENAME
+        if log_path.exists():
+            try:
+                with open(log_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        fields = line.rstrip("\n").split("\t", 2)
+                        if len(fields) != 3:
+                            continue
+                        try:
+                            sequence = int(fields[0])
+                            timestamp = float(fields[1])
+                        except ValueError:
+                            # 写入中断等造成的残缺行，跳过后继续重放
+                            continue
+                        self._log_records += 1
+                        if sequence > self._sequence:
+                            self._apply_use(fields[2], timestamp)
+                            self._sequence = sequence
+            except Exception as e:
+                print(f"[使用统计] 读取使用日志失败: {e}")
+                
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="UsageStoreWriter", daemon=True)
+        self._writer_thread.start()
+        
+    def _get_slot(self, action_id: str) -> int:
+        """获取动作的槽位，不存在时分配新槽位"""
+        slot = self._slots.get(action_id)
+        if slot is None:
+            slot = len(self._ids)
+            self._slots[action_id] = slot
+            self._ids.append(action_id)
+            self._counts.append(0)
+            self._last_used.append(0.0)
+            self._scores.append(0.0)
+        return slot
+        
+    def _decay(self, score: float, elapsed: float) -> float:
+        """按半衰期衰减分数"""
+        if elapsed <= 0:
+            return score
+        return score * 0.5 ** (elapsed / self.half_life)
+        
+    def _apply_use(self, action_id: str, timestamp: float):
+        """把一次使用计入数组表"""
+        slot = self._get_slot(action_id)
+        last_used = self._last_used[slot]
+        self._scores[slot] = self._decay(self._scores[slot], timestamp - last_used) + 1.0
+        self._counts[slot] += 1
+        self._last_used[slot] = max(last_used, timestamp)
+        
+    def record_use(self, action_id: str):
+        """记录一次动作使用（内存表立即更新，文件写入由后台线程批量完成）"""
+        if not action_id:
+            return
+        self._ensure_loaded()
+        timestamp = time.time()
+        with self._lock:
+            self._apply_use(action_id, timestamp)
+            self._sequence += 1
+            sequence = self._sequence
+        self._pending.put((sequence, timestamp, action_id))
+        
+    def get_frecency(self, action_id: str, now: Optional[float] = None) -> float:
+        """获取动作当前的频近度分数（每次使用计1分，按半衰期衰减）"""
+        self._ensure_loaded()
+        slot = self._slots.get(action_id)
+        if slot is None:
+            return 0.0
+        now = time.time() if now is None else now
+        return self._decay(self._scores[slot], now - self._last_used[slot])
+        
+    def get_count(self, action_id: str) -> int:
+        """获取动作的累计使用次数"""
+        self._ensure_loaded()
+        slot = self._slots.get(action_id)
+        return self._counts[slot] if slot is not None else 0
+        
+    def get_top_ids(self, limit: int = 10) -> List[str]:
+        """按频近度从高到低返回动作ID"""
+        self._ensure_loaded()
+        now = time.time()
+        with self._lock:
+            ranked = heapq.nlargest(
+                limit, range(len(self._ids)),
+                key=lambda slot: self._decay(self._scores[slot], now - self._last_used[slot])
+            )
+            return [self._ids[slot] for slot in ranked if self._counts[slot] > 0]
+            
+    def _writer_loop(self):
+        """后台线程：批量追加日志，必要时压缩"""
+        while True:
+            try:
+                record = self._pending.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            if record is None:
+                break
+            # 等待一个刷新周期，把期间的记录合并为一次写入
+            time.sleep(self.flush_interval)
+            batch = [record]
+            stop = False
+            while True:
+                try:
+                    record = self._pending.get_nowait()
+                except queue.Empty:
+                    break
+                if record is None:
+                    stop = True
+                    break
+                batch.append(record)
+            self._write_batch(batch)
+            if stop:
+                break
+                
+    def _write_batch(self, batch: List[Tuple[int, float, str]]):
+        """追加一批使用记录到日志，超过阈值时压缩"""
+        try:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.data_dir / self.LOG_FILENAME, "a", encoding="utf-8") as f:
+                f.write("".join(f"{sequence}\t{timestamp:.3f}\t{action_id}\n"
+                                for sequence, timestamp, action_id in batch))
+            self._log_records += len(batch)
+            if self._log_records >= self.compact_threshold:
+                self._compact()
+        except Exception as e:
+            print(f"[使用统计] 写入使用日志失败: {e}")
+            
+    def _compact(self):
+        """把内存表写入表文件并清空日志"""
+        with self._lock:
+            rows = [slot for slot in range(len(self._ids)) if self._counts[slot] > 0]
+            table = {
+                "ids": [self._ids[slot] for slot in rows],
+                "counts": [self._counts[slot] for slot in rows],
+                "last_used": [self._last_used[slot] for slot in rows],
+                "scores": [self._scores[slot] for slot in rows],
+                "sequence": self._sequence,
+            }
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        table_path = self.data_dir / self.TABLE_FILENAME
+        temp_path = table_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(table, f)
+        temp_path.replace(table_path)
+        # 表已包含截至当前序号的全部记录；队列中尚未写入日志的记录已计入内存表（序号不大于表序号），
+        # 之后即使追加到日志，加载时也会按序号跳过，不会重复计数
+        open(self.data_dir / self.LOG_FILENAME, "w", encoding="utf-8").close()
+        self._log_records = 0
+        
+    def flush(self):
+        """停止后台线程并把未写入的记录落盘（退出时调用）"""
+        if not self._loaded:
+            return
+        if self._writer_thread is not None and self._writer_thread.is_alive():
+            self._pending.put(None)
+            self._writer_thread.join(timeout=self.flush_interval + 3)
+            if self._writer_thread.is_alive():
+                # 写入线程还在追加日志，此时压缩会与它同时改写文件；
+                # 日志中的记录下次启动时仍会重放
+                print("[使用统计] 等待写入线程超时，跳过保存统计表")
+                return
+        try:
+            self._compact()
+        except Exception as e:
+            print(f"[使用统计] 保存统计表失败: {e}")
+
+
+def _create_usage_store() -> UsageStore:
+    """按配置创建全局使用统计实例"""
+    from .config_manager import config_manager
+    return UsageStore(
+        config_manager.config_dir / "usage_stats",
+        half_life_days=config_manager.get("usage_stats.half_life_days", 7.0),
+        flush_interval=config_manager.get("usage_stats.flush_interval", 2.0)
+    )
+
+
+# 全局使用统计实例
+usage_store = _create_usage_store()
@@ -0,0 +1,51 @@
+# 测试公共配置：无界面运行 Qt，提供 QApplication 和模拟的 pyautogui
+import os
+import sys
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def wait_until(app, condition, timeout: float = 2.0) -> bool:
+    """处理事件直到条件成立或超时"""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        if condition():
+            return True
+        time.sleep(0.005)
+    app.processEvents()
+    return condition()
+
+
+def process_deferred_deletes():
+    """在短暂的事件循环中执行 deleteLater（processEvents 和无参数的 sendPostedEvents 不会处理它）"""
+    from PySide6.QtCore import QEventLoop, QTimer
+    loop = QEventLoop()
+    QTimer.singleShot(0, loop.quit)
+    loop.exec()
+
+
+@pytest.fixture
+def fake_pyautogui(monkeypatch):
+    """记录调用的 pyautogui（不会真的发送按键）"""
+    module = types.ModuleType("pyautogui")
+    module.calls = []
+    module.hotkey = lambda *keys: module.calls.append(("hotkey", keys))
+    module.press = lambda key: module.calls.append(("press", key))
+    module.write = lambda text: module.calls.append(("write", text))
+    monkeypatch.setitem(sys.modules, "pyautogui", module)
+    return module
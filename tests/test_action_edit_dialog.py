@@ -0,0 +1,23 @@
+# 动作编辑对话框测试：校验失败时不修改配置
+from PySide6.QtWidgets import QMessageBox
+
+from src.action_edit_dialog import ActionEditDialog
+
+
+def test_invalid_edit_leaves_config_untouched(qapp, monkeypatch):
+    warnings = []
+    monkeypatch.setattr(QMessageBox, "warning", lambda parent, title, text: warnings.append(text))
+    action = {"id": "a", "type": "text", "name": "原名称", "icon_path": "", "hotkey": "", "text": "hello"}
+    dialog = ActionEditDialog(action)
+    dialog.name_input.setText("新名称")
+    dialog.hotkey_input.setText("ctrl+alt+1")
+    dialog.type_editor.text_input.setPlainText("")
+    
+    dialog._save_changes()
+    
+    assert warnings == ["文本内容不能为空"]
+    assert dialog.get_updated_config()["name"] == "原名称"
+    assert dialog.get_updated_config()["text"] == "hello"
+    assert dialog.get_updated_config()["hotkey"] == ""
+    assert action["name"] == "原名称"
+    assert action["text"] == "hello"
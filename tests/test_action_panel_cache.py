@@ -0,0 +1,74 @@
+# 子面板缓存测试：打开的文件夹超过缓存上限时淘汰最久未用的子面板并销毁
+from conftest import process_deferred_deletes
+from src.action_panel import ActionPanel
+from src.config_manager import config_manager
+
+
+def _make_folders(count):
+    return [
+        {"id": f"folder-{index}", "type": "panel", "name": f"文件夹{index}", "actions": [
+            {"id": f"folder-{index}-item", "type": "command", "name": "命令", "command": "echo"}
+        ]}
+        for index in range(count)
+    ]
+
+
+def _live_sub_panels(panel):
+    process_deferred_deletes()
+    return [child for child in panel.findChildren(ActionPanel) if child.parent_panel is panel]
+
+
+def test_sub_panel_cache_stays_within_limit(qapp, monkeypatch):
+    cache_size = 3
+    monkeypatch.setitem(config_manager._config.setdefault("action_panel", {}), "sub_panel_cache_size", cache_size)
+    folders = _make_folders(cache_size * 3)
+    panel = ActionPanel(actions=folders)
+    disposed = []
+    try:
+        for folder in folders:
+            sub_panel = panel._get_sub_panel(folder)
+            sub_panel.destroyed.connect(lambda *args, node_id=sub_panel._node_id: disposed.append(node_id))
+            assert len(panel._sub_panel_cache) <= cache_size
+            assert len(_live_sub_panels(panel)) <= cache_size
+            
+        # 保留最近打开的几个，更早的按打开顺序被淘汰并销毁
+        recent = [folder["id"] for folder in folders[-cache_size:]]
+        assert list(panel._sub_panel_cache) == recent
+        assert disposed == [folder["id"] for folder in folders[:-cache_size]]
+        assert sorted(child._node_id for child in _live_sub_panels(panel)) == sorted(recent)
+    finally:
+        panel._dispose()
+        process_deferred_deletes()
+
+
+def test_reused_sub_panel_is_not_evicted(qapp, monkeypatch):
+    cache_size = 2
+    monkeypatch.setitem(config_manager._config.setdefault("action_panel", {}), "sub_panel_cache_size", cache_size)
+    folders = _make_folders(4)
+    panel = ActionPanel(actions=folders)
+    try:
+        first = panel._get_sub_panel(folders[0])
+        panel._get_sub_panel(folders[1])
+        # 再次打开第一个文件夹后它成为最近使用的，淘汰的是第二个
+        assert panel._get_sub_panel(folders[0]) is first
+        panel._get_sub_panel(folders[2])
+        assert list(panel._sub_panel_cache) == [folders[0]["id"], folders[2]["id"]]
+        assert len(_live_sub_panels(panel)) == cache_size
+    finally:
+        panel._dispose()
+        process_deferred_deletes()
+
+
+def test_removed_folders_are_pruned(qapp, monkeypatch):
+    folders = _make_folders(3)
+    panel = ActionPanel(actions=folders)
+    try:
+        for folder in folders:
+            panel._get_sub_panel(folder)
+        del folders[1:]
+        panel._prune_sub_panel_cache()
+        assert list(panel._sub_panel_cache) == [folders[0]["id"]]
+        assert [child._node_id for child in _live_sub_panels(panel)] == [folders[0]["id"]]
+    finally:
+        panel._dispose()
+        process_deferred_deletes()
@@ -0,0 +1,20 @@
+# 搜索索引测试：面板就地修改动作后，命令面板能搜到新名称
+from src.action_panel import ActionPanel
+from src.action_search import action_search_index
+from src.config_manager import config_manager
+
+
+def test_renamed_action_is_reindexed(qapp, monkeypatch):
+    actions = [{"id": "search-rename", "type": "command", "name": "old name", "command": "echo"}]
+    monkeypatch.setitem(config_manager._config, "actions", actions)
+    monkeypatch.setattr(config_manager, "update_config", lambda config: None)
+    action_search_index.ensure_synced(actions)
+    assert [entry.action_id for entry in action_search_index.search("old")] == ["search-rename"]
+    
+    panel = ActionPanel(actions=actions)
+    actions[0]["name"] = "new name"
+    panel.handle_rename_action("search-rename")
+    
+    assert action_search_index.ensure_synced(config_manager.get("actions", []))
+    assert [entry.action_id for entry in action_search_index.search("new")] == ["search-rename"]
+    assert action_search_index.search("old") == []
@@ -0,0 +1,21 @@
+# 动作类型注册表测试：图标来自处理器，没有处理器的旧类型保留原有图标
+from src.action_types import DEFAULT_ICON, get_action_types, get_type_icon
+
+
+def test_registered_types_use_handler_icons():
+    icons = {action_type: get_type_icon(action_type) for action_type in get_action_types()}
+    # 与改为注册表之前按钮上的图标一致
+    assert icons["key"] == "⌨️"
+    assert icons["program"] == "⚙️"
+    assert icons["url"] == "🌐"
+    assert icons["text"] == "📝"
+    assert icons["panel"] == "📁"
+    assert icons["input_output"] == "🔄"
+    assert all(icons.values())
+
+
+def test_types_without_handler_keep_their_icons():
+    assert get_type_icon("command") == "⚡"
+    assert get_type_icon("clipboard") == "📋"
+    assert get_type_icon("placeholder") == "🔄"
+    assert get_type_icon("unknown_type") == DEFAULT_ICON
@@ -0,0 +1,24 @@
+# 动作按钮样式测试：共享样式表包含各状态的配置颜色
+import re
+
+from src.button_widget import build_action_button_stylesheet
+
+
+def _selector_body(stylesheet, selector):
+    match = re.search(re.escape(selector) + r"\s*\{([^}]*)\}", stylesheet)
+    assert match, selector
+    return match.group(1)
+
+
+def test_hovered_selector_uses_hover_colors():
+    stylesheet = build_action_button_stylesheet({
+        "hover_background_color": "#123456", "hover_border_color": "#abcdef"
+    })
+    hovered = _selector_body(stylesheet, 'DraggableButton[hovered="true"]')
+    assert "background-color: #123456" in hovered
+    assert "border-color: #abcdef" in hovered
+
+
+def test_hover_border_color_has_default():
+    hovered = _selector_body(build_action_button_stylesheet({}), 'DraggableButton[hovered="true"]')
+    assert "border-color: #4f7cff" in hovered
@@ -0,0 +1,94 @@
+# 选中文本获取测试：用延迟的 FakeClipboardBackend 模拟目标程序异步写入剪贴板
+import pytest
+
+from conftest import wait_until
+from src import clipboard_capture
+from src.clipboard_capture import FakeClipboardBackend, SelectionCapture
+
+
+@pytest.fixture
+def backend(qapp, monkeypatch):
+    fake = FakeClipboardBackend(copy_delay=0.05, selection="selected text", initial="original")
+    monkeypatch.setattr(clipboard_capture, "_clipboard_backend", fake)
+    return fake
+
+
+@pytest.fixture
+def capture(backend):
+    selection_capture = SelectionCapture()
+    selection_capture.timeout_ms = 300
+    selection_capture.restore_clipboard = True
+    return selection_capture
+
+
+def test_delayed_copy_is_captured(qapp, backend, capture):
+    results = []
+    capture.capture(results.append)
+    # 复制是异步的，发送快捷键后不能立即读取剪贴板
+    assert results == []
+    assert wait_until(qapp, lambda: results)
+    assert results == ["selected text"]
+    assert backend.copy_calls == 1
+
+
+def test_timeout_returns_empty_text(qapp, backend, capture):
+    backend.selection = None
+    capture.timeout_ms = 50
+    results = []
+    capture.capture(results.append)
+    assert wait_until(qapp, lambda: results)
+    # 没有选中内容时返回空文本，而不是剪贴板里的旧内容
+    assert results == [""]
+    assert backend.text() == "original"
+
+
+def test_copy_slower_than_timeout_returns_empty_text(qapp, backend, capture):
+    backend.copy_delay = 0.2
+    capture.timeout_ms = 50
+    results = []
+    capture.capture(results.append)
+    assert wait_until(qapp, lambda: results)
+    assert results == [""]
+
+
+def test_original_clipboard_is_restored(qapp, backend, capture):
+    results = []
+    capture.capture(results.append)
+    assert wait_until(qapp, lambda: results)
+    assert results == ["selected text"]
+    assert backend.text() == "original"
+
+
+def test_original_clipboard_kept_when_restore_disabled(qapp, backend, capture):
+    capture.restore_clipboard = False
+    results = []
+    capture.capture(results.append)
+    assert wait_until(qapp, lambda: results)
+    assert backend.text() == "selected text"
+
+
+def test_concurrent_captures_are_queued(qapp, backend, capture):
+    events = []
+    
+    def on_done(name):
+        def callback(text):
+            events.append((name, text, backend.copy_calls, backend.text()))
+            # 下一次复制得到不同的文本，交错执行时会被前一个请求读到
+            backend.selection = f"selection after {name}"
+        return callback
+        
+    capture.capture(on_done("first"))
+    capture.capture(on_done("second"))
+    capture.capture(on_done("third"))
+    # 同一时间只有一个复制在进行
+    assert backend.copy_calls == 1
+    assert wait_until(qapp, lambda: len(events) == 3)
+    
+    assert [event[0] for event in events] == ["first", "second", "third"]
+    assert [event[1] for event in events] == [
+        "selected text", "selection after first", "selection after second"
+    ]
+    # 每个请求完成时只发送过自己的复制，且原剪贴板已恢复
+    assert [event[2] for event in events] == [1, 2, 3]
+    assert all(event[3] == "original" for event in events)
+    assert backend.text() == "original"
@@ -0,0 +1,58 @@
+# 焦点恢复测试：切换成功时等待窗口到达前台，无法切换时在面板隐藏后延时执行
+import time
+
+import pytest
+
+from conftest import wait_until
+from src import focus_restore
+from src.focus_restore import FakeFocusBackend, FocusRestorer, NullFocusBackend
+
+# Qt 默认的粗精度定时器最多可能提前 5% 触发
+HIDE_DELAY_LOWER_BOUND_MS = FocusRestorer.LEGACY_HIDE_DELAY_MS * 0.95 - 1
+
+
+@pytest.fixture
+def restorer(qapp):
+    restorer = FocusRestorer()
+    restorer.poll_interval_ms = 5
+    restorer.timeout_ms = 300
+    return restorer
+
+
+def _restore_and_wait(qapp, restorer, target):
+    calls = []
+    start = time.perf_counter()
+    restorer.restore(target, lambda: calls.append((time.perf_counter() - start) * 1000), "test")
+    # 回调不会在 restore 中同步执行，调用方刚隐藏的面板还没有消失
+    assert calls == []
+    assert wait_until(qapp, lambda: calls)
+    return calls[0]
+
+
+@pytest.mark.parametrize("target", [None, 12345])
+def test_null_backend_waits_for_hide(qapp, restorer, monkeypatch, target):
+    monkeypatch.setattr(focus_restore, "_focus_backend", NullFocusBackend())
+    elapsed_ms = _restore_and_wait(qapp, restorer, target)
+    assert elapsed_ms >= HIDE_DELAY_LOWER_BOUND_MS
+    # 没有切换窗口，不计入节省时间统计
+    assert restorer.get_saved_latency_stats() == {}
+
+
+def test_failed_activation_waits_for_hide(qapp, restorer, monkeypatch):
+    backend = FakeFocusBackend()
+    backend.windows[1] = "目标"
+    monkeypatch.setattr(backend, "activate_window", lambda window: False)
+    monkeypatch.setattr(focus_restore, "_focus_backend", backend)
+    elapsed_ms = _restore_and_wait(qapp, restorer, 1)
+    assert elapsed_ms >= HIDE_DELAY_LOWER_BOUND_MS
+    assert restorer.get_saved_latency_stats() == {}
+
+
+def test_switch_runs_when_window_reaches_foreground(qapp, restorer, monkeypatch):
+    backend = FakeFocusBackend(activation_delay=0.02)
+    backend.windows[1] = "目标"
+    monkeypatch.setattr(focus_restore, "_focus_backend", backend)
+    elapsed_ms = _restore_and_wait(qapp, restorer, 1)
+    assert backend.foreground == 1
+    assert elapsed_ms < FocusRestorer.LEGACY_HIDE_DELAY_MS + FocusRestorer.LEGACY_SWITCH_DELAY_MS
+    assert restorer.get_saved_latency_stats()["test"]["count"] == 1
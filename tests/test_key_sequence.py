@@ -0,0 +1,24 @@
+# 按键序列测试：编译结果按命令文本缓存
+from src import key_sequence
+from src.key_sequence import get_compiled_sequence
+
+
+def test_cache_is_keyed_on_command_text(monkeypatch):
+    monkeypatch.setattr(key_sequence, "_compiled_cache", key_sequence.OrderedDict())
+    first = get_compiled_sequence("ctrl+c, wait(100), enter")
+    assert get_compiled_sequence("ctrl+c, wait(100), enter") is first
+    assert get_compiled_sequence("ctrl+v") != first
+    assert list(key_sequence._compiled_cache) == ["ctrl+c, wait(100), enter", "ctrl+v"]
+
+
+def test_hash_collision_does_not_return_other_command(monkeypatch):
+    monkeypatch.setattr(key_sequence, "_compiled_cache", key_sequence.OrderedDict())
+    
+    class SameHash(str):
+        def __hash__(self):
+            return 42
+            
+    first = get_compiled_sequence(SameHash("f5"))
+    second = get_compiled_sequence(SameHash("enter"))
+    assert first != second
+    assert second == key_sequence.compile_key_sequence("enter")
@@ -0,0 +1,73 @@
+# 大输入测试：内存上限下映射大文件，溢出的临时文件在执行线程结束后才删除
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from conftest import wait_until
+from src.action_panel import ActionPanel
+from src.config_manager import config_manager
+from src.large_input import FileInput, spill_text
+from src.script_worker_pool import ScriptWorkerPool
+
+LINE_STATS = Path(__file__).resolve().parent.parent / "input_output_actions" / "example_line_stats.py"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="内存上限只在POSIX上生效")
+def test_mapped_input_larger_than_memory_limit(tmp_path):
+    memory_limit_mb = 128
+    line = b"x" * 99 + b"\n"
+    line_count = (memory_limit_mb + 64) * 1024 * 1024 // len(line)
+    path = tmp_path / "large.txt"
+    with open(path, "wb") as file:
+        block = line * 10000
+        for _ in range(line_count // 10000):
+            file.write(block)
+    line_count = line_count // 10000 * 10000
+    allocate = tmp_path / "allocate.py"
+    allocate.write_text("def process(input_text, input_source, output_target):\n"
+                        "    return str(len(bytearray(int(input_text))))\n", encoding="utf-8")
+                        
+    pool = ScriptWorkerPool(size=1, memory_limit_mb=memory_limit_mb)
+    pool.start()
+    try:
+        result = pool.run(LINE_STATS, FileInput(path), "file", "window", timeout_ms=60000)
+        assert f"行数: {line_count}" in result
+        # 映射关闭后上限恢复，脚本自身分配超过上限的内存仍然失败
+        with pytest.raises(Exception, match="内存"):
+            pool.run(allocate, str(memory_limit_mb * 1024 * 1024), "clipboard", "window", timeout_ms=60000)
+    finally:
+        pool.shutdown()
+
+
+def test_spilled_input_released_after_thread_finishes(qapp, monkeypatch):
+    monkeypatch.setitem(config_manager._config.setdefault("script_workers", {}), "enabled", False)
+    monkeypatch.setitem(config_manager._config.setdefault("action_executor", {}), "script_timeout_ms", 50)
+    input_file = spill_text("a" * 2048, 1)
+    release = threading.Event()
+    finished = threading.Event()
+    seen = []
+    
+    def slow_script(script_file, input_text, input_source, output_target, job=None, on_chunk=None):
+        release.wait(5)
+        # 超时之后线程仍在读取输入
+        seen.append(os.path.exists(input_text.path))
+        finished.set()
+        return "done"
+        
+    panel = ActionPanel(actions=[])
+    errors = []
+    try:
+        panel._submit_script("slow.py", input_file, "clipboard", "window",
+                             on_success=lambda result: None, on_error=errors.append, execute=slow_script)
+        assert wait_until(qapp, lambda: errors)
+        assert os.path.exists(input_file.path)
+        release.set()
+        assert finished.wait(5)
+        assert wait_until(qapp, lambda: not os.path.exists(input_file.path))
+        assert seen == [True]
+    finally:
+        release.set()
+        panel._dispose()
@@ -0,0 +1,50 @@
+# 流式输出测试：发送文本时合并各块，经文本注入队列输入
+from PySide6.QtWidgets import QApplication
+
+from conftest import wait_until
+from src.output_sinks import TextOutputSink
+from src.text_injection import text_injector
+
+
+def _make_sink(fake_pyautogui, monkeypatch, flush_ms=50, flush_chars=1000):
+    pasted = []
+    
+    def hotkey(*keys):
+        pasted.append(QApplication.clipboard().text())
+        
+    fake_pyautogui.hotkey = hotkey
+    monkeypatch.setattr(text_injector, "strategy", text_injector.STRATEGY_PASTE)
+    monkeypatch.setattr(text_injector, "restore_delay_ms", 20)
+    sink = TextOutputSink()
+    sink.flush_ms = flush_ms
+    sink.flush_chars = flush_chars
+    return sink, pasted
+
+
+def test_small_chunks_are_coalesced(qapp, fake_pyautogui, monkeypatch):
+    sink, pasted = _make_sink(fake_pyautogui, monkeypatch)
+    QApplication.clipboard().setText("original")
+    for index in range(50):
+        sink.write(f"{index},")
+    assert pasted == []
+    
+    assert wait_until(qapp, lambda: pasted)
+    sink.close()
+    assert wait_until(qapp, lambda: not text_injector.busy)
+    assert len(pasted) == 1
+    assert "".join(pasted) == "".join(f"{index}," for index in range(50))
+    assert QApplication.clipboard().text() == "original"
+
+
+def test_size_threshold_flushes_immediately(qapp, fake_pyautogui, monkeypatch):
+    sink, pasted = _make_sink(fake_pyautogui, monkeypatch, flush_ms=10000, flush_chars=10)
+    sink.write("abcde")
+    assert pasted == []
+    sink.write("fghij")
+    assert pasted == ["abcdefghij"]
+    # 上一次粘贴未被读取前到达的块合并为下一次粘贴
+    sink.write("k")
+    sink.write("l")
+    sink.close()
+    assert wait_until(qapp, lambda: not text_injector.busy)
+    assert pasted == ["abcdefghij", "kl"]
@@ -0,0 +1,41 @@
+# 脚本管道测试：每一段都经过 _execute_script，记录运行统计并使用纯脚本结果缓存
+import pytest
+
+from src.action_panel import ActionPanel
+from src.action_types.pipeline import execute_pipeline
+from src.config_manager import config_manager
+from src.script_stats import script_stats
+
+
+@pytest.fixture
+def scripts(tmp_path):
+    upper = tmp_path / "pipeline_upper.py"
+    upper.write_text("PURE = True\n\n\n"
+                     "def process(input_text, input_source, output_target):\n"
+                     "    return input_text.upper() + '|' + input_source + '|' + output_target\n", encoding="utf-8")
+    suffix = tmp_path / "pipeline_suffix.py"
+    suffix.write_text("def process(input_text, input_source, output_target):\n"
+                      "    return input_text + '|' + input_source + '|' + output_target\n", encoding="utf-8")
+    return str(upper), str(suffix)
+
+
+@pytest.mark.parametrize("use_workers", [False, True])
+def test_pipeline_steps_record_stats_and_use_cache(qapp, monkeypatch, scripts, use_workers):
+    monkeypatch.setitem(config_manager._config.setdefault("script_workers", {}), "enabled", use_workers)
+    monkeypatch.setitem(config_manager._config.setdefault("script_cache", {}), "enabled", True)
+    upper, suffix = scripts
+    script_stats.clear()
+    panel = ActionPanel(actions=[])
+    try:
+        for _ in range(2):
+            result = execute_pipeline(panel, [upper, suffix], f"abc-{use_workers}", "clipboard", "text")
+            assert result == f"ABC-{str(use_workers).upper()}|clipboard|next|previous|text"
+    finally:
+        panel._dispose()
+        
+    upper_runs = script_stats.get_history(upper)
+    suffix_runs = script_stats.get_history(suffix)
+    assert len(upper_runs) == 2 and len(suffix_runs) == 2
+    # 新的在前：第二次执行纯脚本时命中结果缓存，非纯脚本每次都执行
+    assert [run.cached for run in upper_runs] == [True, False]
+    assert [run.cached for run in suffix_runs] == [False, False]
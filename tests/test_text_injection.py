@@ -0,0 +1,68 @@
+# 文本注入测试：连续粘贴按顺序执行，整轮结束后恢复一次原剪贴板
+from PySide6.QtWidgets import QApplication
+
+from conftest import wait_until
+from src.text_injection import TextInjector
+
+
+def _make_injector(fake_pyautogui):
+    """粘贴快捷键按下时记录剪贴板内容（相当于目标程序读到的文本）"""
+    injector = TextInjector()
+    injector.strategy = TextInjector.STRATEGY_PASTE
+    injector.restore_delay_ms = 30
+    pasted = []
+    
+    def hotkey(*keys):
+        fake_pyautogui.calls.append(("hotkey", keys))
+        pasted.append(QApplication.clipboard().text())
+        
+    fake_pyautogui.hotkey = hotkey
+    return injector, pasted
+
+
+def test_back_to_back_pastes_restore_original_clipboard(qapp, fake_pyautogui):
+    injector, pasted = _make_injector(fake_pyautogui)
+    clipboard = QApplication.clipboard()
+    clipboard.setText("original")
+    
+    done = []
+    injector.inject("first", on_done=lambda: done.append("first"))
+    injector.inject("second", on_done=lambda: done.append("second"))
+    # 第二次粘贴要等第一次的宽限时间结束，此时剪贴板仍是第一块
+    assert pasted == ["first"]
+    assert clipboard.text() == "first"
+    
+    assert wait_until(qapp, lambda: not injector.busy)
+    assert pasted == ["first", "second"]
+    assert done == ["first", "second"]
+    assert clipboard.text() == "original"
+
+
+def test_mixed_type_and_paste_keep_order(qapp, fake_pyautogui):
+    injector, pasted = _make_injector(fake_pyautogui)
+    injector.strategy = "auto"
+    injector.paste_threshold = 5
+    clipboard = QApplication.clipboard()
+    clipboard.setText("original")
+    
+    injector.inject("long text one")
+    injector.inject("ab")
+    injector.inject("long text two")
+    assert wait_until(qapp, lambda: not injector.busy)
+    
+    assert [call for call in fake_pyautogui.calls if call[0] == "write"] == [("write", "ab")]
+    order = [call[0] for call in fake_pyautogui.calls]
+    assert order == ["hotkey", "write", "hotkey"]
+    assert pasted == ["long text one", "long text two"]
+    assert clipboard.text() == "original"
+
+
+def test_clipboard_changed_by_user_is_not_overwritten(qapp, fake_pyautogui):
+    injector, pasted = _make_injector(fake_pyautogui)
+    clipboard = QApplication.clipboard()
+    clipboard.setText("original")
+    
+    injector.inject("pasted")
+    clipboard.setText("copied meanwhile")
+    assert wait_until(qapp, lambda: not injector.busy)
+    assert clipboard.text() == "copied meanwhile"
@@ -0,0 +1,53 @@
+# 使用统计测试：日志中的残缺行不影响重放，写入线程未结束时不压缩
+import threading
+
+from src.usage_store import UsageStore
+
+
+def test_malformed_log_lines_are_skipped(tmp_path):
+    (tmp_path / UsageStore.LOG_FILENAME).write_text(
+        "1\t100.000\ta\n"
+        "x\t101.000\ta\n"
+        "2\tbroken\ta\n"
+        "3\t102.000\tb\n"
+        "4\t103.000\ta\n",
+        encoding="utf-8"
+    )
+    store = UsageStore(tmp_path, flush_interval=0.01)
+    assert store.get_count("a") == 2
+    assert store.get_count("b") == 1
+    store.flush()
+
+
+def test_flush_skips_compact_while_writer_is_busy(tmp_path, monkeypatch):
+    store = UsageStore(tmp_path, flush_interval=0.01)
+    release = threading.Event()
+    written = []
+    
+    def slow_write(batch):
+        release.wait(10)
+        written.extend(batch)
+        
+    monkeypatch.setattr(store, "_write_batch", slow_write)
+    compacted = []
+    monkeypatch.setattr(store, "_compact", lambda: compacted.append(True))
+    store.record_use("a")
+    try:
+        store.flush()
+        assert compacted == []
+    finally:
+        release.set()
+    store._writer_thread.join(5)
+    assert [record[2] for record in written] == ["a"]
+
+
+def test_flush_compacts_after_writer_exits(tmp_path):
+    store = UsageStore(tmp_path, flush_interval=0.01)
+    store.record_use("a")
+    store.record_use("a")
+    store.flush()
+    assert not store._writer_thread.is_alive()
+    reloaded = UsageStore(tmp_path)
+    assert reloaded.get_count("a") == 2
+    assert (tmp_path / UsageStore.TABLE_FILENAME).exists()
+    assert (tmp_path / UsageStore.LOG_FILENAME).read_text(encoding="utf-8") == ""